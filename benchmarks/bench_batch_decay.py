@@ -0,0 +1,76 @@
+"""Throughput of the vectorised decay kernel versus the scalar functions.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_batch_decay.py
+
+Reports creature-ticks per second for ``apply_tick_decay`` at 10k, 100k and
+1M creatures.  The scalar loop is only timed at the smaller sizes.
+"""
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from drakeling.domain import batch, decay
+from drakeling.domain.models import LifecycleStage, MoodState, PersonalityProfile
+
+SIZES = (10_000, 100_000, 1_000_000)
+SCALAR_LIMIT = 100_000
+TICKS = 20
+
+
+def _population(n: int, rng: np.random.Generator):
+    columns = {
+        name: rng.random(n)
+        for name in ("mood", "energy", "trust", "trust_floor", "loneliness",
+                     "state_curiosity", "stability")
+    }
+    state = batch.MoodStateBatch(**columns)
+    resting = rng.random(n) < 0.1
+    rate = rng.random(n)
+    return state, resting, rate
+
+
+def _bench_batch(n: int, rng: np.random.Generator) -> float:
+    state, resting, rate = _population(n, rng)
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        state = batch.apply_tick_decay(state, resting, rate)
+    return n * TICKS / (time.perf_counter() - start)
+
+
+def _bench_scalar(n: int, rng: np.random.Generator) -> float:
+    state, resting, rate = _population(n, rng)
+    states = state.to_states()
+    stages = [
+        LifecycleStage.RESTING if r else LifecycleStage.MATURE for r in resting
+    ]
+    traits = [
+        PersonalityProfile("aa" * 32, 0.5, 0.5, 0.5, 0.5, 0.5, float(r))
+        for r in rate
+    ]
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        states = [
+            decay.apply_tick_decay(s, stage, t)
+            for s, stage, t in zip(states, stages, traits)
+        ]
+    return n * TICKS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'creatures':>10}  {'batch ticks/s':>15}  {'scalar ticks/s':>15}  {'speedup':>8}")
+    for n in SIZES:
+        vec = _bench_batch(n, rng)
+        if n <= SCALAR_LIMIT:
+            sca = _bench_scalar(n, rng)
+            print(f"{n:>10,}  {vec:>15,.0f}  {sca:>15,.0f}  {vec / sca:>7.1f}x")
+        else:
+            print(f"{n:>10,}  {vec:>15,.0f}  {'-':>15}  {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
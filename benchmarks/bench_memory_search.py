@@ -0,0 +1,121 @@
+"""Latency of GET /memories/search over a large history.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_memory_search.py
+
+Fills the memory and interaction tables with synthetic text drawn from a
+Zipf-distributed vocabulary (rows are inserted through the normal tables,
+so the FTS triggers do the indexing), then times queries of decreasing
+word frequency end to end through the API.  Cost grows with the number
+of matching rows, since every match is ranked; the ``matches`` column
+shows how many that was.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert, text
+
+from drakeling.api.app import create_app
+from drakeling.daemon.config import DrakelingConfig
+from drakeling.storage.database import get_engine, get_session_factory, run_migrations
+from drakeling.storage.models import CreatureMemoryRow, InteractionLogRow
+from drakeling.storage.search import match_expression
+
+ROWS_PER_TABLE = 150_000
+CHUNK = 5_000
+ITERATIONS = 50
+VOCABULARY = 20_000
+# Word ranks to query: common, mid-frequency, rare, and a two-word AND
+QUERY_RANKS = ((10,), (100,), (1_000,), (10_000,), (50, 200))
+
+_RANKS = range(1, VOCABULARY + 1)
+_CUM_WEIGHTS = list(itertools.accumulate(1.0 / rank for rank in _RANKS))
+
+
+def _word(rank: int) -> str:
+    return f"w{rank}x"
+
+
+def _sentence(rng: random.Random) -> str:
+    ranks = rng.choices(_RANKS, cum_weights=_CUM_WEIGHTS, k=rng.randint(8, 24))
+    return " ".join(_word(rank) for rank in ranks)
+
+
+async def _populate(session_factory, rng: random.Random) -> None:
+    for start in range(0, ROWS_PER_TABLE, CHUNK):
+        async with session_factory() as session:
+            await session.execute(insert(CreatureMemoryRow), [
+                {"created_at": float(start + i), "memory_type": "reflection",
+                 "content": _sentence(rng), "lifecycle_stage": "juvenile"}
+                for i in range(CHUNK)
+            ])
+            await session.execute(insert(InteractionLogRow), [
+                {"created_at": float(start + i), "source": "user",
+                 "interaction_type": "talk", "content": _sentence(rng)}
+                for i in range(CHUNK)
+            ])
+            await session.commit()
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        (data_dir / "api_token").write_text("bench")
+        engine = get_engine(data_dir)
+        await run_migrations(engine)
+        session_factory = get_session_factory(engine)
+
+        start = time.perf_counter()
+        await _populate(session_factory, random.Random(0))
+        print(
+            f"Indexed {2 * ROWS_PER_TABLE:,} rows in "
+            f"{time.perf_counter() - start:.1f}s"
+        )
+
+        app = create_app(
+            config=DrakelingConfig(),
+            session_factory=session_factory,
+            data_dir=data_dir,
+        )
+        app.state.llm = None
+        transport = ASGITransport(app=app)
+        async with AsyncClient(
+            transport=transport,
+            base_url="http://test",
+            headers={"Authorization": "Bearer bench"},
+        ) as client:
+            print(f"{'query':<22} {'matches':>8} {'p50':>9} {'p95':>9}")
+            for ranks in QUERY_RANKS:
+                query = " ".join(_word(rank) for rank in ranks)
+                async with session_factory() as session:
+                    matches = (await session.execute(
+                        text("SELECT count(*) FROM history_fts"
+                             " WHERE history_fts MATCH :q"),
+                        {"q": match_expression(query)},
+                    )).scalar_one()
+                samples: list[float] = []
+                for _ in range(ITERATIONS):
+                    t0 = time.perf_counter()
+                    resp = await client.get(
+                        "/memories/search", params={"q": query},
+                    )
+                    samples.append(time.perf_counter() - t0)
+                    resp.raise_for_status()
+                ordered = sorted(samples)
+                p50 = statistics.median(ordered) * 1000
+                p95 = ordered[int(0.95 * (len(ordered) - 1))] * 1000
+                print(f"{query:<22} {matches:>8,} {p50:7.2f}ms {p95:7.2f}ms")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
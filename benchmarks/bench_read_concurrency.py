@@ -0,0 +1,115 @@
+"""GET latency while writers hold long transactions, shared vs read-only pool.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_read_concurrency.py
+
+Writer tasks repeatedly open a transaction on the write engine, insert a
+row and hold the transaction open for a while before committing, as a slow
+``/talk`` or tick flush would.  Meanwhile ``GET /memories/search`` is timed
+once with reads sharing the write engine's pool and once with the separate
+read-only engine.
+"""
+from __future__ import annotations
+
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import OperationalError
+
+from drakeling.api.app import create_app
+from drakeling.daemon.config import DrakelingConfig
+from drakeling.storage.database import (
+    get_engine,
+    get_read_engine,
+    get_session_factory,
+    run_migrations,
+)
+from drakeling.storage.models import InteractionLogRow
+
+# More writers than the write pool has connections (5 + 10 overflow)
+# shows reads queueing for a connection behind them
+WRITERS = (1, 8, 24)
+HOLD_SECONDS = 0.02
+READS = 100
+
+
+async def _writer(session_factory, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        try:
+            async with session_factory() as session:
+                session.add(InteractionLogRow(
+                    created_at=time.time(), source="user",
+                    interaction_type="talk", content="a warm stone",
+                ))
+                await session.flush()
+                await asyncio.sleep(HOLD_SECONDS)
+                await session.commit()
+        except OperationalError:
+            # Lock wait exceeded busy_timeout; heavy contention is the point
+            pass
+
+
+async def _bench(separate: bool, writers: int) -> str:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        (data_dir / "api_token").write_text("bench")
+        engine = get_engine(data_dir)
+        await run_migrations(engine)
+        session_factory = get_session_factory(engine)
+        read_engine = get_read_engine(data_dir) if separate else None
+        app = create_app(
+            config=DrakelingConfig(),
+            session_factory=session_factory,
+            data_dir=data_dir,
+            read_session_factory=(
+                get_session_factory(read_engine) if read_engine else None
+            ),
+        )
+        app.state.llm = None
+
+        stop = asyncio.Event()
+        tasks = [
+            asyncio.create_task(_writer(session_factory, stop))
+            for _ in range(writers)
+        ]
+        samples: list[float] = []
+        transport = ASGITransport(app=app)
+        async with AsyncClient(
+            transport=transport,
+            base_url="http://test",
+            headers={"Authorization": "Bearer bench"},
+        ) as client:
+            await asyncio.sleep(0.1)
+            for _ in range(READS):
+                start = time.perf_counter()
+                resp = await client.get("/memories/search", params={"q": "stone"})
+                samples.append(time.perf_counter() - start)
+                resp.raise_for_status()
+        stop.set()
+        await asyncio.gather(*tasks)
+        if read_engine is not None:
+            await read_engine.dispose()
+        await engine.dispose()
+
+    ordered = sorted(samples)
+    p50 = statistics.median(ordered) * 1000
+    p95 = ordered[int(0.95 * (len(ordered) - 1))] * 1000
+    return f"p50 {p50:8.2f}ms  p95 {p95:8.2f}ms"
+
+
+async def main() -> None:
+    print(f"writers hold each transaction for {HOLD_SECONDS * 1000:.0f}ms")
+    print(f"{'writers':>7}  {'shared pool':<28}  {'read-only pool':<28}")
+    for writers in WRITERS:
+        shared = await _bench(separate=False, writers=writers)
+        separate = await _bench(separate=True, writers=writers)
+        print(f"{writers:>7}  {shared:<28}  {separate:<28}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
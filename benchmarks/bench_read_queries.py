@@ -0,0 +1,129 @@
+"""Full ORM rows vs column-projected Core selects on the request read paths.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_read_queries.py
+
+Compares, in queries per second:
+
+* the creature row as ``/status`` used to load it (full ORM entity) against
+  a Core select of the 14 columns it returns;
+* the ``/talk`` history lookup as full ``InteractionLogRow`` entities
+  against ``storage.queries.recent_talk``;
+
+and reports ``GET /status`` requests per second, now that it is served from
+the in-memory store without a query.
+"""
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import desc, select
+
+from drakeling.api.app import create_app
+from drakeling.daemon.config import DrakelingConfig
+from drakeling.storage.database import get_engine, get_session_factory, run_migrations
+from drakeling.storage.models import CreatureStateRow, InteractionLogRow
+from drakeling.storage.queries import recent_talk
+
+ITERATIONS = 2_000
+
+_STATUS_COLUMNS = select(
+    CreatureStateRow.name, CreatureStateRow.colour,
+    CreatureStateRow.lifecycle_stage, CreatureStateRow.mood,
+    CreatureStateRow.energy, CreatureStateRow.trust,
+    CreatureStateRow.loneliness, CreatureStateRow.state_curiosity,
+    CreatureStateRow.stability, CreatureStateRow.born_at,
+    CreatureStateRow.cumulative_care_events,
+    CreatureStateRow.cumulative_talk_interactions,
+    CreatureStateRow.pre_exhausted_stage, CreatureStateRow.updated_at,
+).limit(1)
+
+
+async def _rate(fn) -> float:
+    for _ in range(50):
+        await fn()
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await fn()
+    return ITERATIONS / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        (data_dir / "api_token").write_text("bench")
+        engine = get_engine(data_dir)
+        await run_migrations(engine)
+        session_factory = get_session_factory(engine)
+        app = create_app(
+            config=DrakelingConfig(),
+            session_factory=session_factory,
+            data_dir=data_dir,
+        )
+        app.state.llm = None
+        transport = ASGITransport(app=app)
+        async with AsyncClient(
+            transport=transport,
+            base_url="http://test",
+            headers={"Authorization": "Bearer bench"},
+        ) as client:
+            await client.post("/birth", json={"colour": "red", "name": "Bench"})
+            async with session_factory() as session:
+                session.add_all(
+                    InteractionLogRow(
+                        created_at=float(i), source="user",
+                        interaction_type="talk", content="hello " * 40,
+                    )
+                    for i in range(500)
+                )
+                await session.commit()
+
+            async with session_factory() as session:
+                async def orm_creature():
+                    session.expunge_all()
+                    row = (await session.execute(
+                        select(CreatureStateRow).limit(1)
+                    )).scalar_one()
+                    return row.name, row.mood
+
+                async def core_creature():
+                    row = (await session.execute(_STATUS_COLUMNS)).first()
+                    return row.name, row.mood
+
+                async def orm_history():
+                    session.expunge_all()
+                    rows = (await session.execute(
+                        select(InteractionLogRow)
+                        .where(InteractionLogRow.interaction_type == "talk")
+                        .order_by(desc(InteractionLogRow.created_at))
+                        .limit(10)
+                    )).scalars().all()
+                    return [(r.source, r.content) for r in reversed(rows)]
+
+                async def core_history():
+                    return await recent_talk(session, limit=10)
+
+                results = [
+                    ("creature row, ORM entity", await _rate(orm_creature)),
+                    ("creature row, 14 columns", await _rate(core_creature)),
+                    ("talk history, ORM entities", await _rate(orm_history)),
+                    ("talk history, 2 columns", await _rate(core_history)),
+                ]
+
+            async def get_status():
+                (await client.get("/status")).raise_for_status()
+
+            results.append(("GET /status (in-memory)", await _rate(get_status)))
+        await engine.dispose()
+
+    for label, rate in results:
+        print(f"{label:<30} {rate:>10,.0f}/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
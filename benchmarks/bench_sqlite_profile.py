@@ -0,0 +1,94 @@
+"""Commit latency of /care and of a tick flush under each SQLite profile.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_sqlite_profile.py
+
+``legacy`` is SQLite's default configuration (rollback journal, full
+fsync), i.e. the daemon's behaviour before pragmas were applied.
+"""
+from __future__ import annotations
+
+import asyncio
+import statistics
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+
+import drakeling.api.cooldown as cooldown
+from drakeling.api.app import create_app
+from drakeling.daemon.config import DrakelingConfig
+from drakeling.storage.database import (
+    SQLITE_PROFILES,
+    get_engine,
+    get_session_factory,
+    run_migrations,
+)
+from drakeling.storage.models import LifecycleEventRow
+
+ITERATIONS = 200
+
+
+def _summary(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p50 = statistics.median(ordered) * 1000
+    p95 = ordered[int(0.95 * (len(ordered) - 1))] * 1000
+    return f"p50 {p50:7.3f}ms  p95 {p95:7.3f}ms"
+
+
+async def _bench(profile: str) -> tuple[str, str]:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        (data_dir / "api_token").write_text("bench")
+        engine = get_engine(data_dir, SQLITE_PROFILES[profile])
+        await run_migrations(engine)
+        app = create_app(
+            config=DrakelingConfig(),
+            session_factory=get_session_factory(engine),
+            data_dir=data_dir,
+        )
+        app.state.llm = None
+        transport = ASGITransport(app=app)
+        async with AsyncClient(
+            transport=transport,
+            base_url="http://test",
+            headers={"Authorization": "Bearer bench"},
+        ) as client:
+            await client.post("/birth", json={"colour": "red", "name": "Bench"})
+            store = app.state.store
+
+            # /care: boost in memory, then force the write it would cause
+            care: list[float] = []
+            for _ in range(ITERATIONS):
+                cooldown._last_care_at = 0.0
+                start = time.perf_counter()
+                await client.post("/care", json={"type": "gentle_attention"})
+                await store.flush()
+                care.append(time.perf_counter() - start)
+
+            # Tick: state update plus a lifecycle row in one transaction
+            tick: list[float] = []
+            for _ in range(ITERATIONS):
+                now = time.time()
+                store.update(replace(store.creature), now=now)
+                start = time.perf_counter()
+                await store.flush(LifecycleEventRow(
+                    created_at=now, event_type="bench",
+                ))
+                tick.append(time.perf_counter() - start)
+        await engine.dispose()
+    return _summary(care), _summary(tick)
+
+
+async def main() -> None:
+    print(f"{'profile':<10}  {'/care + flush':<30}  {'tick flush':<30}")
+    for profile in ("legacy", "durable", "balanced"):
+        care, tick = await _bench(profile)
+        print(f"{profile:<10}  {care:<30}  {tick:<30}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+"""Daemon startup cost of the migration step, with and without Alembic.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_startup.py
+
+Each run is a fresh interpreter that imports the daemon, opens an
+up-to-date database and brings it to head, once through the
+``run_migrations`` fast path and once forcing ``alembic upgrade head``
+as every start did before.  Reported: wall time of the migration step,
+peak RSS of the process, and whether Alembic was imported.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+RUNS = 10
+
+_CHILD = r"""
+import asyncio, json, resource, sys, time
+from pathlib import Path
+
+import drakeling.daemon.main  # noqa: F401  (the daemon's own imports)
+from drakeling.storage import database
+
+async def main(data_dir, force):
+    engine = database.get_engine(data_dir)
+    start = time.perf_counter()
+    if force:
+        async with engine.begin() as conn:
+            await conn.run_sync(database._run_alembic)
+    else:
+        await database.run_migrations(engine)
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return elapsed
+
+elapsed = asyncio.run(main(Path(sys.argv[1]), sys.argv[2] == "force"))
+print(json.dumps({
+    "ms": elapsed * 1000,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "alembic": "alembic" in sys.modules,
+}))
+"""
+
+
+def _run(data_dir: Path, mode: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, str(data_dir), mode],
+        check=True, capture_output=True, text=True, env=os.environ.copy(),
+    ).stdout
+    return json.loads(out)
+
+
+def main() -> None:
+    from drakeling.storage.database import get_engine, run_migrations
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+
+        async def _prepare() -> None:
+            engine = get_engine(data_dir)
+            await run_migrations(engine)
+            await engine.dispose()
+
+        asyncio.run(_prepare())
+
+        print(f"{'mode':<16} {'migrate p50':>12} {'peak RSS':>10}  alembic imported")
+        for mode, label in (("force", "alembic upgrade"), ("fast", "fast path")):
+            runs = [_run(data_dir, mode) for _ in range(RUNS)]
+            ms = statistics.median(r["ms"] for r in runs)
+            rss = statistics.median(r["rss_mb"] for r in runs)
+            print(f"{label:<16} {ms:>10.1f}ms {rss:>8.1f}MB  {runs[0]['alembic']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,11 @@ from typing import Any
 
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.datastructures import State
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from drakeling.daemon.config import DrakelingConfig
+from drakeling.daemon.state import CreatureStore
 
 _security = HTTPBearer()
 
@@ -17,13 +19,17 @@ def create_app(
     config: DrakelingConfig,
     session_factory: async_sessionmaker[AsyncSession],
     data_dir: Path,
+    store: CreatureStore | None = None,
+    read_session_factory: async_sessionmaker[AsyncSession] | None = None,
 ) -> FastAPI:
     app = FastAPI(title="Drakeling", docs_url=None, redoc_url=None)
 
     # Store shared state on the app instance
     app.state.config = config
     app.state.session_factory = session_factory
+    app.state.read_session_factory = read_session_factory or session_factory
     app.state.data_dir = data_dir
+    app.state.store = store or CreatureStore(session_factory)
 
     # Read the API token once at startup
     token_path = data_dir / "api_token"
@@ -33,11 +39,18 @@ def create_app(
     from drakeling.api.attention import router as attention_router
     from drakeling.api.birth import router as birth_router
     from drakeling.api.care import router as care_router
+    from drakeling.api.dashboard import router as dashboard_router
+    from drakeling.api.diagnostics import router as diagnostics_router
+    from drakeling.api.events import router as events_router
     from drakeling.api.export_import import router as export_import_router
+    from drakeling.api.history import router as history_router
+    from drakeling.api.memories import router as memories_router
     from drakeling.api.release import router as release_router
     from drakeling.api.rest import router as rest_router
+    from drakeling.api.stats import router as stats_router
     from drakeling.api.status import router as status_router
     from drakeling.api.talk import router as talk_router
+    from drakeling.api.ws import router as ws_router
 
     app.include_router(birth_router)
     app.include_router(status_router)
@@ -47,6 +60,13 @@ def create_app(
     app.include_router(attention_router)
     app.include_router(export_import_router)
     app.include_router(release_router)
+    app.include_router(stats_router)
+    app.include_router(diagnostics_router)
+    app.include_router(memories_router)
+    app.include_router(history_router)
+    app.include_router(events_router)
+    app.include_router(ws_router)
+    app.include_router(dashboard_router)
 
     return app
 
@@ -62,6 +82,67 @@ async def verify_token(
 
 
 async def get_session(request: Request) -> Any:
-    """FastAPI dependency that yields a database session."""
-    async with request.app.state.session_factory() as session:
+    """FastAPI dependency that yields a database session.
+
+    GET requests get a session on the read-only engine.
+    """
+    if request.method in ("GET", "HEAD"):
+        factory = request.app.state.read_session_factory
+    else:
+        factory = request.app.state.session_factory
+    async with factory() as session:
         yield session
+
+
+def settle_creature(state: State, now: float) -> list[Any]:
+    """Apply ticks the background loop has not yet applied to the creature.
+
+    *state* is the app's ``app.state``.  Returns lifecycle event rows that
+    must be flushed with the state.
+    """
+    scheduler = getattr(state, "scheduler", None)
+    if scheduler is None:
+        return []
+    return scheduler.settle(state.store, now)
+
+
+def state_etag(request: Request, now: float, *parts: object) -> str:
+    """Strong ETag for a response derived only from the live creature.
+
+    Combines the store's version with the ticks owed at *now*, so decay
+    that reads project between ticks changes the tag too, plus any
+    *parts* the response also depends on.
+    """
+    scheduler = getattr(request.app.state, "scheduler", None)
+    owed = scheduler.owed_ticks(now) if scheduler is not None else 0
+    version = ".".join(
+        str(part) for part in (request.app.state.store.version, owed, *parts)
+    )
+    return f'"{version}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's ``If-None-Match`` already names *etag*."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip().removeprefix("W/")
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+def wake_scheduler(state: State, *, reset: bool = False) -> None:
+    """Tell the background loop that the creature changed.
+
+    *state* is the app's ``app.state``.  Pass ``reset=True`` when the
+    creature itself was replaced.
+    """
+    scheduler = getattr(state, "scheduler", None)
+    if scheduler is None:
+        return
+    if reset:
+        scheduler.reset()
+    else:
+        scheduler.wake()
@@ -1,46 +1,44 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+import time
+from typing import Any
 
-from drakeling.api.app import get_session, verify_token
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+
+from drakeling.api.app import etag_matches, state_etag, verify_token
+from drakeling.domain.attention import HATCHING_SOON_WINDOW, evaluate_attention
 from drakeling.domain.lifecycle import EGG_TO_HATCHED_TIME
-from drakeling.domain.models import LifecycleStage
-from drakeling.storage.models import CreatureStateRow
+from drakeling.domain.models import Creature, LifecycleStage
 
 router = APIRouter(dependencies=[Depends(verify_token)])
 
 
 @router.get("/needs-attention")
-async def needs_attention(session: AsyncSession = Depends(get_session)):
-    result = await session.execute(select(CreatureStateRow).limit(1))
-    row = result.scalar_one_or_none()
-    if row is None:
+async def needs_attention(request: Request, response: Response):
+    creature = await request.app.state.store.get()
+    if creature is None:
         raise HTTPException(status_code=404, detail="No creature exists")
 
-    # Priority order: lonely -> low_mood -> low_energy -> hatching_soon
-    reason = None
-    urgency = None
-
-    if row.loneliness >= 0.7:
-        reason = "lonely"
-        urgency = "high" if row.loneliness >= 0.9 else "medium"
-    elif row.mood <= 0.2:
-        reason = "low_mood"
-        urgency = "high" if row.mood <= 0.1 else "medium"
-    elif row.energy <= 0.2:
-        reason = "low_energy"
-        urgency = "medium" if row.energy <= 0.1 else "low"
-    elif row.lifecycle_stage == LifecycleStage.EGG.value:
-        import time
-        elapsed = time.time() - row.born_at
-        remaining = EGG_TO_HATCHED_TIME - elapsed
-        # "Within one tick" is configurable, approximate with 60s
-        if remaining <= 60 and row.cumulative_care_events >= 1:
-            reason = "hatching_soon"
-            urgency = "low"
+    now = time.time()
+    # The only answer that changes with the clock alone: hatching soon
+    hatching_window = (
+        creature.lifecycle_stage == LifecycleStage.EGG
+        and now - creature.born_at >= EGG_TO_HATCHED_TIME - HATCHING_SOON_WINDOW
+    )
+    etag = state_etag(request, now, int(hatching_window))
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    scheduler = getattr(request.app.state, "scheduler", None)
+    if scheduler is not None:
+        creature = scheduler.project(creature, now)
+
+    return attention_body(creature, now)
+
 
+def attention_body(creature: Creature, now: float) -> dict[str, Any]:
+    reason, urgency = evaluate_attention(creature, now)
     return {
         "needs_attention": reason is not None,
         "reason": reason,
@@ -5,10 +5,9 @@ import time
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, field_validator
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from drakeling.api.app import get_session, verify_token
+from drakeling.api.app import get_session, verify_token, wake_scheduler
 from drakeling.crypto.identity import generate_keypair, save_private_key
 from drakeling.domain.models import CreatureName, DragonColour, LifecycleStage
 from drakeling.domain.traits import generate_traits
@@ -47,8 +46,8 @@ async def birth(
     session: AsyncSession = Depends(get_session),
 ):
     # Reject if creature already exists
-    existing = await session.execute(select(CreatureStateRow).limit(1))
-    if existing.scalar_one_or_none() is not None:
+    store = request.app.state.store
+    if await store.get() is not None:
         raise HTTPException(status_code=409, detail="A creature already exists")
 
     data_dir = request.app.state.data_dir
@@ -105,6 +104,8 @@ async def birth(
     )
     session.add(event)
     await session.commit()
+    store.adopt(creature)
+    wake_scheduler(request.app.state, reset=True)
 
     if request.app.state.config.dev_mode:
         print(f"[dev] Birth: {body.name} ({colour.value})")
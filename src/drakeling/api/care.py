@@ -1,18 +1,19 @@
 from __future__ import annotations
 
 import time
+from dataclasses import replace
 from enum import StrEnum
 
+from typing import Any
+
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, field_validator
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import State
 
-from drakeling.api.app import get_session, verify_token
+from drakeling.api.app import settle_creature, verify_token, wake_scheduler
 from drakeling.domain.decay import apply_care_boost, apply_feed_boost
-from drakeling.domain.models import LifecycleStage, MoodState, PersonalityProfile
 from drakeling.llm.prompts import build_care_prompt
-from drakeling.storage.models import CreatureStateRow, InteractionLogRow
+from drakeling.storage.models import InteractionLogRow
 
 router = APIRouter(dependencies=[Depends(verify_token)])
 
@@ -41,68 +42,65 @@ class CareRequest(BaseModel):
 
 
 @router.post("/care")
-async def care(
-    body: CareRequest,
-    request: Request,
-    session: AsyncSession = Depends(get_session),
-):
+async def care(body: CareRequest, request: Request):
+    return await give_care(request.app.state, body.type)
+
+
+async def give_care(state: State, care_type: str) -> dict[str, Any]:
+    """Care for the creature; shared by ``POST /care`` and the WebSocket.
+
+    *state* is the app's ``app.state`` and *care_type* a validated
+    :class:`CareType` value.
+    """
     from drakeling.api.cooldown import check_care_cooldown, record_care
 
     remaining = check_care_cooldown()
     if remaining is not None:
         return {"cooldown_remaining": round(remaining, 1)}
 
-    result = await session.execute(select(CreatureStateRow).limit(1))
-    row = result.scalar_one_or_none()
-    if row is None:
+    store = state.store
+    if await store.get() is None:
         raise HTTPException(status_code=404, detail="No creature exists")
 
     record_care()
     now = time.time()
-
-    mood = MoodState(
-        mood=row.mood, energy=row.energy, trust=row.trust,
-        trust_floor=row.trust_floor, loneliness=row.loneliness,
-        state_curiosity=row.state_curiosity, stability=row.stability,
+    events = settle_creature(state, now)
+
+    creature = store.creature
+    boost = apply_feed_boost if care_type == CareType.FEED else apply_care_boost
+    creature = replace(
+        creature,
+        mood_state=boost(creature.mood_state),
+        cumulative_care_events=creature.cumulative_care_events + 1,
     )
-    boost = apply_feed_boost if body.type == CareType.FEED else apply_care_boost
-    new_mood = boost(mood)
-    row.mood = new_mood.mood
-    row.energy = new_mood.energy
-    row.trust = new_mood.trust
-    row.loneliness = new_mood.loneliness
-    row.state_curiosity = new_mood.state_curiosity
-    row.stability = new_mood.stability
-    row.cumulative_care_events += 1
-    row.updated_at = now
+    store.update(creature, now=now)
+    if events:
+        await store.flush(*events)
 
     # Try LLM response
-    llm = request.app.state.llm
+    llm = state.llm
     response_text = None
     if llm and not llm.budget_exhausted:
-        from drakeling.domain.models import Creature, DragonColour
-        from drakeling.daemon.tick import _row_to_creature
-
-        creature = _row_to_creature(row)
-        messages = build_care_prompt(creature, body.type)
+        messages = build_care_prompt(creature, care_type)
         response_text = await llm.call(messages)
 
         if response_text:
-            session.add(InteractionLogRow(
+            store.writes.add(InteractionLogRow(
                 created_at=now,
                 source="creature",
                 interaction_type="care_response",
                 content=response_text,
-                care_type=body.type,
+                care_type=care_type,
             ))
 
-    await session.commit()
+    wake_scheduler(state)
 
+    ms = creature.mood_state
     return {
         "response": response_text,
         "state": {
-            "mood": row.mood, "energy": row.energy, "trust": row.trust,
-            "loneliness": row.loneliness, "state_curiosity": row.state_curiosity,
-            "stability": row.stability,
+            "mood": ms.mood, "energy": ms.energy, "trust": ms.trust,
+            "loneliness": ms.loneliness, "state_curiosity": ms.state_curiosity,
+            "stability": ms.stability,
         },
     }
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from drakeling.api.app import get_session, verify_token
+from drakeling.api.attention import attention_body
+from drakeling.api.cooldown import check_care_cooldown, check_talk_cooldown
+from drakeling.api.status import status_body
+from drakeling.storage.queries import recent_feed
+
+router = APIRouter(dependencies=[Depends(verify_token)])
+
+
+@router.get("/dashboard")
+async def dashboard(
+    request: Request,
+    feed: int = Query(20, ge=0, le=100),
+    session: AsyncSession = Depends(get_session),
+):
+    """Everything a client shows on opening, in one round trip.
+
+    Status and attention come from the live creature; the only database
+    read is the last *feed* interaction log entries.
+    """
+    store = request.app.state.store
+    creature = await store.get()
+    if creature is None:
+        raise HTTPException(status_code=404, detail="No creature exists")
+
+    now = time.time()
+    scheduler = getattr(request.app.state, "scheduler", None)
+    if scheduler is not None:
+        creature = scheduler.project(creature, now)
+    llm = getattr(request.app.state, "llm", None)
+
+    entries = []
+    if feed:
+        if store.writes.pending:
+            await store.writes.flush()
+        entries = [
+            {
+                "created_at": row.created_at,
+                "source": row.source,
+                "interaction_type": row.interaction_type,
+                "content": row.content,
+                "care_type": row.care_type,
+            }
+            for row in await recent_feed(session, limit=feed)
+        ]
+
+    return {
+        "status": status_body(creature, llm.budget_remaining if llm else None),
+        "attention": attention_body(creature, now),
+        "cooldown": {
+            "care": round(check_care_cooldown() or 0.0, 1),
+            "talk": round(check_talk_cooldown() or 0.0, 1),
+        },
+        "budget": {
+            "exhausted": llm.budget_exhausted if llm else None,
+            "remaining_today": llm.budget_remaining if llm else None,
+            "used_today": llm.tokens_used_today if llm else None,
+        },
+        "feed": entries,
+    }
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from drakeling.api.app import verify_token
+
+router = APIRouter(dependencies=[Depends(verify_token)])
+
+
+@router.get("/diagnostics/tick")
+async def tick_diagnostics(request: Request):
+    """Rolling per-phase timing histograms for the background loop."""
+    scheduler = getattr(request.app.state, "scheduler", None)
+    if scheduler is None:
+        raise HTTPException(status_code=503, detail="Tick loop is not running")
+    return scheduler.profiler.snapshot()
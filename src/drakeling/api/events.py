@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+from contextlib import aclosing
+from typing import Any, AsyncIterator
+
+from fastapi import APIRouter, Depends, Header, Request
+from fastapi.responses import StreamingResponse
+
+from drakeling.api.app import verify_token
+from drakeling.daemon.events import EventBus, follow
+
+router = APIRouter(dependencies=[Depends(verify_token)])
+
+KEEPALIVE_SECONDS = 30.0
+RETRY_MS = 3000
+
+
+def format_event(id: int | None, type: str, data: Any) -> str:
+    """One server-sent event in wire format; *id* None leaves it out."""
+    payload = json.dumps(data, separators=(",", ":"))
+    prefix = f"id: {id}\n" if id is not None else ""
+    return f"{prefix}event: {type}\ndata: {payload}\n\n"
+
+
+def parse_event_id(value: str | None) -> int | None:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+async def event_stream(
+    bus: EventBus,
+    last_event_id: int | None = None,
+    *,
+    keepalive: float = KEEPALIVE_SECONDS,
+) -> AsyncIterator[str]:
+    """Server-sent event text for :func:`follow`, with keepalive comments."""
+    yield f"retry: {RETRY_MS}\n\n"
+    async with aclosing(follow(bus, last_event_id, keepalive=keepalive)) as events:
+        async for event in events:
+            if event is None:
+                yield ": keepalive\n\n"
+            else:
+                yield format_event(event.id, event.type, event.data)
+
+
+@router.get("/events")
+async def events(
+    request: Request,
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+):
+    """Server-sent stream of state diffs, attention changes and events."""
+    store = request.app.state.store
+    await store.get()
+    return StreamingResponse(
+        event_stream(store.events, parse_event_id(last_event_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -7,18 +7,18 @@ from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from drakeling.api.app import get_session, verify_token
+from drakeling.api.app import verify_token, wake_scheduler
 from drakeling.crypto.bundle import export_bundle, import_bundle
 from drakeling.crypto.identity import (
     PRIVATE_KEY_FILENAME,
     save_private_key,
     verify_binding,
 )
-from drakeling.storage.database import DB_FILENAME
-from drakeling.storage.models import CreatureStateRow, LifecycleEventRow
+from drakeling.storage.database import DB_FILENAME, release_database
+from drakeling.storage.models import LifecycleEventRow
+from drakeling.storage.queries import creature_identity
+from drakeling.storage.snapshot import snapshot_database
 
 router = APIRouter(dependencies=[Depends(verify_token)])
 
@@ -37,16 +37,25 @@ class ImportRequest(BaseModel):
 async def do_export(
     body: ExportRequest,
     request: Request,
-    session: AsyncSession = Depends(get_session),
 ):
     data_dir: Path = request.app.state.data_dir
 
-    result = await session.execute(select(CreatureStateRow).limit(1))
-    creature = result.scalar_one_or_none()
+    store = request.app.state.store
+    creature = await store.get()
     if creature is None:
         raise HTTPException(status_code=404, detail="No creature to export")
 
-    bundle_bytes = export_bundle(data_dir, body.passphrase)
+    # Bundle a consistent snapshot rather than the live file, after
+    # writing pending state and queued history
+    await store.flush()
+    snapshot_path = data_dir / f"{DB_FILENAME}.export"
+    try:
+        await snapshot_database(request.app.state.session_factory, snapshot_path)
+        bundle_bytes = export_bundle(
+            data_dir, body.passphrase, db_path=snapshot_path,
+        )
+    finally:
+        snapshot_path.unlink(missing_ok=True)
 
     timestamp = time.strftime("%Y%m%d_%H%M%S")
     filename = f"{creature.name}_{timestamp}.drakeling"
@@ -60,7 +69,6 @@ async def do_export(
 async def do_import(
     body: ImportRequest,
     request: Request,
-    session: AsyncSession = Depends(get_session),
 ):
     config = request.app.state.config
     data_dir: Path = request.app.state.data_dir
@@ -72,8 +80,8 @@ async def do_import(
         )
 
     # Check for existing creature
-    result = await session.execute(select(CreatureStateRow).limit(1))
-    existing = result.scalar_one_or_none()
+    store = request.app.state.store
+    existing = await store.get()
     if existing is not None and not body.force:
         raise HTTPException(
             status_code=409,
@@ -95,6 +103,15 @@ async def do_import(
     key_path = data_dir / PRIVATE_KEY_FILENAME
     bak_path = None
 
+    # Close our connections so no WAL from the old file outlives it
+    if existing is not None:
+        await store.flush()
+        store.clear()
+    await release_database(request.app.state.session_factory)
+    read_factory = request.app.state.read_session_factory
+    if read_factory is not request.app.state.session_factory:
+        await read_factory.kw["bind"].dispose()
+
     # Backup existing DB if force overwrite
     if existing is not None:
         timestamp = time.strftime("%Y%m%d_%H%M%S")
@@ -102,18 +119,24 @@ async def do_import(
         shutil.copy2(db_path, bak_path)
 
     # Install imported data
+    temp_engine = None
     try:
         save_private_key(data_dir, key_bytes)
         db_path.write_bytes(db_bytes)
 
         # Verify binding with the imported data
         # We need to read the public key from the imported DB
-        from drakeling.storage.database import get_engine, get_session_factory
-        temp_engine = get_engine(data_dir)
+        from drakeling.storage.database import (
+            get_engine,
+            get_session_factory,
+            run_migrations,
+        )
+        temp_engine = get_engine(data_dir, config.sqlite_pragmas())
+        # Bundles from older versions may predate the current schema
+        await run_migrations(temp_engine)
         temp_sf = get_session_factory(temp_engine)
         async with temp_sf() as temp_session:
-            res = await temp_session.execute(select(CreatureStateRow).limit(1))
-            imported_creature = res.scalar_one_or_none()
+            imported_creature = await creature_identity(temp_session)
             if imported_creature is None:
                 raise ValueError("Imported database contains no creature")
 
@@ -135,13 +158,18 @@ async def do_import(
 
     except Exception as exc:
         # Rollback: remove imported key, restore backup
+        if temp_engine is not None:
+            await temp_engine.dispose()
         if key_path.exists():
             key_path.unlink()
         if bak_path and bak_path.exists():
             shutil.copy2(bak_path, db_path)
+        await store.load()
         raise HTTPException(
             status_code=422,
             detail=f"Import failed, rolled back: {exc}",
         )
 
+    await store.load()
+    wake_scheduler(request.app.state, reset=True)
     return {"status": "imported", "name": imported_creature.name}
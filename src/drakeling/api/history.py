@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from drakeling.api.app import get_session, verify_token
+from drakeling.daemon.history import (
+    RESOLUTIONS,
+    STAT_FIELDS,
+    pick_resolution,
+    query_stats,
+)
+
+router = APIRouter(dependencies=[Depends(verify_token)])
+
+# Largest response, in buckets, so a minute-resolution query can't span years
+MAX_BUCKETS = 5_000
+
+
+@router.get("/history/stats")
+async def stat_history(
+    request: Request,
+    from_: float | None = Query(None, alias="from"),
+    to: float | None = None,
+    resolution: str | None = None,
+    session: AsyncSession = Depends(get_session),
+):
+    """Stat averages over time, one array per stat (columnar).
+
+    *from* and *to* are Unix timestamps (default: the last 24 hours).
+    *resolution* is ``minute``, ``hour`` or ``day``; by default the finest
+    one still kept for *from* is used.
+    """
+    now = time.time()
+    end = now if to is None else to
+    start = end - 86_400 if from_ is None else from_
+    if start > end:
+        raise HTTPException(status_code=422, detail="'from' is after 'to'")
+    if resolution is None:
+        resolution = pick_resolution(start, now)
+    elif resolution not in RESOLUTIONS:
+        raise HTTPException(
+            status_code=422,
+            detail="Invalid resolution. Must be one of: " + ", ".join(RESOLUTIONS),
+        )
+    step, _ = RESOLUTIONS[resolution]
+    if (end - start) / step > MAX_BUCKETS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Range too long for {resolution} resolution",
+        )
+
+    # Samples still averaging in memory, and those of ticks not yet
+    # applied, are merged in without writing anything
+    store = request.app.state.store
+    pending = store.history
+    scheduler = getattr(request.app.state, "scheduler", None)
+    if scheduler is not None and await store.get() is not None:
+        pending = scheduler.pending_history(store, now)
+
+    rows = pending.merged(
+        await query_stats(session, resolution, start, end),
+        resolution, start, end,
+    )
+    columns = list(zip(*rows)) if rows else [()] * (len(STAT_FIELDS) + 1)
+    return {
+        "resolution": resolution,
+        "step": step,
+        "from": start,
+        "to": end,
+        "t": list(columns[0]),
+        **{
+            name: [round(v, 4) for v in columns[i + 1]]
+            for i, name in enumerate(STAT_FIELDS)
+        },
+    }
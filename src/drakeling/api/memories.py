@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from drakeling.api.app import get_session, verify_token
+from drakeling.storage.search import match_expression, search_history
+
+router = APIRouter(dependencies=[Depends(verify_token)])
+
+
+@router.get("/memories/search")
+async def search_memories(
+    request: Request,
+    q: str = Query(min_length=1, max_length=500),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    session: AsyncSession = Depends(get_session),
+):
+    """Full-text search over reflections and interactions, best first."""
+    if match_expression(q) is None:
+        raise HTTPException(status_code=422, detail="Query has no searchable words")
+
+    await request.app.state.store.writes.flush()
+    # Fetch one extra row to know whether another page exists
+    hits = await search_history(session, q, limit=limit + 1, offset=offset)
+    return {
+        "query": q,
+        "offset": offset,
+        "limit": limit,
+        "has_more": len(hits) > limit,
+        "results": [asdict(hit) for hit in hits[:limit]],
+    }
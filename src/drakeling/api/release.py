@@ -4,16 +4,18 @@ from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
-from sqlalchemy import delete, select
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from drakeling.api.app import get_session, verify_token
+from drakeling.api.app import get_session, verify_token, wake_scheduler
 from drakeling.crypto.identity import PRIVATE_KEY_FILENAME
 from drakeling.storage.models import (
     CreatureMemoryRow,
     CreatureStateRow,
+    HistoryArchiveRow,
     InteractionLogRow,
     LifecycleEventRow,
+    StatHistoryRow,
 )
 
 router = APIRouter(dependencies=[Depends(verify_token)])
@@ -35,18 +37,26 @@ async def release_creature(
             detail="Set confirm=true to release the creature.",
         )
 
-    result = await session.execute(select(CreatureStateRow).limit(1))
-    creature = result.scalar_one_or_none()
+    store = request.app.state.store
+    creature = await store.get()
     if creature is None:
         raise HTTPException(status_code=404, detail="No creature exists")
 
     name = creature.name
 
-    await session.execute(delete(CreatureMemoryRow))
-    await session.execute(delete(InteractionLogRow))
-    await session.execute(delete(LifecycleEventRow))
-    await session.execute(delete(CreatureStateRow))
-    await session.commit()
+    # Queued history rows belong to this creature too
+    async with store.writes.lock:
+        store.writes.discard()
+        store.history.take()
+        await session.execute(delete(CreatureMemoryRow))
+        await session.execute(delete(InteractionLogRow))
+        await session.execute(delete(LifecycleEventRow))
+        await session.execute(delete(HistoryArchiveRow))
+        await session.execute(delete(StatHistoryRow))
+        await session.execute(delete(CreatureStateRow))
+        await session.commit()
+    store.clear()
+    wake_scheduler(request.app.state, reset=True)
 
     data_dir: Path = request.app.state.data_dir
     key_path = data_dir / PRIVATE_KEY_FILENAME
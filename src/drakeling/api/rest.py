@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import time
+from dataclasses import replace
+
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import State
 
-from drakeling.api.app import get_session, verify_token
-from drakeling.daemon.tick import _row_to_creature
+from drakeling.api.app import settle_creature, verify_token, wake_scheduler
 from drakeling.domain.models import LifecycleStage
 from drakeling.llm.prompts import build_rest_prompt
-from drakeling.storage.models import CreatureStateRow, LifecycleEventRow
+from drakeling.storage.models import LifecycleEventRow
 
 router = APIRouter(dependencies=[Depends(verify_token)])
 
@@ -22,45 +23,55 @@ _RESTABLE_STAGES = {
 
 
 @router.post("/rest")
-async def rest(
-    request: Request,
-    session: AsyncSession = Depends(get_session),
-):
-    result = await session.execute(select(CreatureStateRow).limit(1))
-    row = result.scalar_one_or_none()
-    if row is None:
+async def rest(request: Request):
+    return await start_rest(request.app.state)
+
+
+async def start_rest(state: State) -> dict[str, Any]:
+    """Send the creature to rest; shared by ``POST /rest`` and the WebSocket.
+
+    *state* is the app's ``app.state``.
+    """
+    store = state.store
+    if await store.get() is None:
         raise HTTPException(status_code=404, detail="No creature exists")
 
-    if row.lifecycle_stage not in _RESTABLE_STAGES:
+    now = time.time()
+    events = settle_creature(state, now)
+    creature = store.creature
+    if creature.lifecycle_stage not in _RESTABLE_STAGES:
+        if events:
+            await store.flush(*events)
         raise HTTPException(
             status_code=409,
-            detail=f"Cannot rest from {row.lifecycle_stage} stage",
+            detail=f"Cannot rest from {creature.lifecycle_stage.value} stage",
         )
 
-    now = time.time()
-    prev_stage = row.lifecycle_stage
-    row.pre_resting_stage = prev_stage
-    row.lifecycle_stage = LifecycleStage.RESTING.value
-    row.updated_at = now
+    prev_stage = creature.lifecycle_stage
+    creature = replace(
+        creature,
+        pre_resting_stage=prev_stage,
+        lifecycle_stage=LifecycleStage.RESTING,
+    )
+    store.update(creature, now=now)
+    store.resting_entered_at = now
 
-    session.add(LifecycleEventRow(
+    await store.flush(*events, LifecycleEventRow(
         created_at=now,
         event_type="entered_resting",
-        from_stage=prev_stage,
+        from_stage=prev_stage.value,
         to_stage=LifecycleStage.RESTING.value,
         notes="User requested rest",
     ))
+    wake_scheduler(state)
 
     # Optional farewell expression
-    llm = request.app.state.llm
+    llm = state.llm
     response_text = None
     if llm and not llm.budget_exhausted:
-        creature = _row_to_creature(row)
         messages = build_rest_prompt(creature)
         response_text = await llm.call(messages)
 
-    await session.commit()
-
     return {
         "response": response_text,
         "stage": LifecycleStage.RESTING.value,
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+
+from drakeling.api.app import verify_token
+
+router = APIRouter(dependencies=[Depends(verify_token)])
+
+
+@router.get("/stats")
+async def daemon_stats(request: Request):
+    """Background loop timing, batched write and event stream counters."""
+    scheduler = getattr(request.app.state, "scheduler", None)
+    return {
+        "tick_seconds": request.app.state.config.tick_seconds,
+        "tick": scheduler.stats.as_dict() if scheduler is not None else None,
+        "writes": request.app.state.store.writes.as_dict(),
+        "events": request.app.state.store.events.as_dict(),
+    }
@@ -1,35 +1,52 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+import time
+from typing import Any
 
-from drakeling.api.app import get_session, verify_token
-from drakeling.storage.models import CreatureStateRow
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+
+from drakeling.api.app import etag_matches, state_etag, verify_token
+from drakeling.domain.models import Creature
 
 router = APIRouter(dependencies=[Depends(verify_token)])
 
 
 @router.get("/status")
-async def status(request: Request, session: AsyncSession = Depends(get_session)):
-    result = await session.execute(select(CreatureStateRow).limit(1))
-    creature = result.scalar_one_or_none()
+async def status(request: Request, response: Response):
+    creature = await request.app.state.store.get()
     if creature is None:
         raise HTTPException(status_code=404, detail="No creature exists")
 
+    now = time.time()
     llm = getattr(request.app.state, "llm", None)
     budget_remaining = llm.budget_remaining if llm else None
 
+    etag = state_etag(request, now, budget_remaining)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    # Stats as of now, including ticks the loop has not woken for yet
+    scheduler = getattr(request.app.state, "scheduler", None)
+    if scheduler is not None:
+        creature = scheduler.project(creature, now)
+    return status_body(creature, budget_remaining)
+
+
+def status_body(
+    creature: Creature, budget_remaining: int | None,
+) -> dict[str, Any]:
+    ms = creature.mood_state
     return {
         "name": creature.name,
         "colour": creature.colour,
-        "lifecycle_stage": creature.lifecycle_stage,
-        "mood": creature.mood,
-        "energy": creature.energy,
-        "trust": creature.trust,
-        "loneliness": creature.loneliness,
-        "state_curiosity": creature.state_curiosity,
-        "stability": creature.stability,
+        "lifecycle_stage": creature.lifecycle_stage.value,
+        "mood": ms.mood,
+        "energy": ms.energy,
+        "trust": ms.trust,
+        "loneliness": ms.loneliness,
+        "state_curiosity": ms.state_curiosity,
+        "stability": ms.stability,
         "born_at": creature.born_at,
         "cumulative_care_events": creature.cumulative_care_events,
         "cumulative_talk_interactions": creature.cumulative_talk_interactions,
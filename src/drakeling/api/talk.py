@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+import logging
 import time
+from contextlib import aclosing
+from dataclasses import replace
+from typing import Any, AsyncIterator
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, field_validator
-from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from drakeling.api.app import get_session, verify_token
-from drakeling.daemon.tick import _row_to_creature
+from starlette.datastructures import State
+
+from drakeling.api.app import (
+    get_session,
+    settle_creature,
+    verify_token,
+    wake_scheduler,
+)
+from drakeling.api.events import format_event
 from drakeling.domain.decay import apply_talk_boost
-from drakeling.domain.models import LifecycleStage, MoodState
+from drakeling.domain.models import Creature, LifecycleStage
 from drakeling.llm.prompts import build_talk_prompt
-from drakeling.storage.models import CreatureStateRow, InteractionLogRow
+from drakeling.storage.models import InteractionLogRow
+from drakeling.storage.queries import recent_talk
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(dependencies=[Depends(verify_token)])
 
@@ -30,91 +43,192 @@ class TalkRequest(BaseModel):
         return v
 
 
-@router.post("/talk")
-async def talk(
-    body: TalkRequest,
-    request: Request,
-    session: AsyncSession = Depends(get_session),
-):
+async def _start_talk(
+    state: State, message: str, now: float,
+) -> Creature | dict[str, Any]:
+    """Apply and log the user's side of a talk.
+
+    Returns the creature to reply as, or the response body when the talk
+    is refused by the cooldown.
+    """
     from drakeling.api.cooldown import check_talk_cooldown, record_talk
 
     remaining = check_talk_cooldown()
     if remaining is not None:
         return {"cooldown_remaining": round(remaining, 1)}
 
-    result = await session.execute(select(CreatureStateRow).limit(1))
-    row = result.scalar_one_or_none()
-    if row is None:
+    store = state.store
+    if await store.get() is None:
         raise HTTPException(status_code=404, detail="No creature exists")
 
     record_talk()
+    events = settle_creature(state, now)
+    creature = store.creature
 
-    if row.lifecycle_stage == LifecycleStage.EGG.value:
+    if creature.lifecycle_stage == LifecycleStage.EGG:
+        if events:
+            await store.flush(*events)
         raise HTTPException(
             status_code=403,
             detail="The creature has not yet hatched",
         )
 
-    now = time.time()
-    llm = request.app.state.llm
-
     # Apply talk stat boost
-    creature = _row_to_creature(row)
-    new_mood = apply_talk_boost(creature.mood_state, creature.personality)
-    row.mood = new_mood.mood
-    row.energy = new_mood.energy
-    row.trust = new_mood.trust
-    row.trust_floor = new_mood.trust_floor
-    row.loneliness = new_mood.loneliness
-    row.state_curiosity = new_mood.state_curiosity
-    row.stability = new_mood.stability
-    row.cumulative_talk_interactions += 1
-    row.updated_at = now
-
-    # Log user message
-    session.add(InteractionLogRow(
+    creature = replace(
+        creature,
+        mood_state=apply_talk_boost(creature.mood_state, creature.personality),
+        cumulative_talk_interactions=creature.cumulative_talk_interactions + 1,
+    )
+    store.update(creature, now=now)
+    if events:
+        await store.flush(*events)
+
+    # Log user message, then write the log out so history includes it
+    store.writes.add(InteractionLogRow(
         created_at=now,
         source="user",
         interaction_type="talk",
-        content=body.message,
+        content=message,
     ))
+    await store.writes.flush()
+    return creature
 
+
+async def _talk_prompt(
+    session: AsyncSession, creature: Creature, message: str,
+) -> list[dict[str, str]]:
     # Get recent history for context
-    history_result = await session.execute(
-        select(InteractionLogRow)
-        .where(InteractionLogRow.interaction_type == "talk")
-        .order_by(desc(InteractionLogRow.created_at))
-        .limit(10)
-    )
-    history_rows = list(reversed(history_result.scalars().all()))
-    recent_history: list[dict[str, str]] = []
-    for h in history_rows[-10:]:
-        role = "user" if h.source == "user" else "assistant"
-        recent_history.append({"role": role, "content": h.content})
+    recent_history: list[dict[str, str]] = [
+        {"role": "user" if source == "user" else "assistant", "content": content}
+        for source, content in await recent_talk(session, limit=10)
+    ]
+    return build_talk_prompt(creature, message, recent_history)
+
+
+def _talk_reply(
+    state: State, creature: Creature, now: float, response_text: str | None,
+) -> dict[str, Any]:
+    """Log the creature's reply and build the response body."""
+    wake_scheduler(state)
+    if not response_text:
+        return {"response": None, "budget_exhausted": True}
+    state.store.writes.add(InteractionLogRow(
+        created_at=now,
+        source="creature",
+        interaction_type="talk",
+        content=response_text,
+    ))
+    ms = creature.mood_state
+    return {
+        "response": response_text,
+        "state": {
+            "mood": ms.mood, "energy": ms.energy, "trust": ms.trust,
+            "loneliness": ms.loneliness,
+            "state_curiosity": ms.state_curiosity,
+            "stability": ms.stability,
+        },
+    }
+
+
+@router.post("/talk")
+async def talk(
+    body: TalkRequest,
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+):
+    return await run_talk(request.app.state, session, body.message)
+
+
+async def run_talk(
+    state: State, session: AsyncSession, message: str,
+) -> dict[str, Any]:
+    """Talk and wait for the whole reply; shared by ``POST /talk`` and the
+    WebSocket.  *state* is the app's ``app.state`` and *message* validated.
+    """
+    now = time.time()
+    started = await _start_talk(state, message, now)
+    if isinstance(started, dict):
+        return started
+    creature = started
 
     # LLM call
+    llm = state.llm
+    response_text = None
     if llm and not llm.budget_exhausted:
-        creature = _row_to_creature(row)
-        messages = build_talk_prompt(creature, body.message, recent_history)
+        messages = await _talk_prompt(session, creature, message)
         response_text = await llm.call(messages)
+    return _talk_reply(state, creature, now, response_text)
 
-        if response_text:
-            session.add(InteractionLogRow(
-                created_at=now,
-                source="creature",
-                interaction_type="talk",
-                content=response_text,
-            ))
-            await session.commit()
-            return {
-                "response": response_text,
-                "state": {
-                    "mood": row.mood, "energy": row.energy, "trust": row.trust,
-                    "loneliness": row.loneliness,
-                    "state_curiosity": row.state_curiosity,
-                    "stability": row.stability,
-                },
-            }
-
-    await session.commit()
-    return {"response": None, "budget_exhausted": True}
+
+async def talk_tokens(
+    state: State, session: AsyncSession, message: str,
+) -> AsyncIterator[tuple[str, Any]]:
+    """Run a talk, yielding ``("token", text)`` as the reply is generated.
+
+    Always ends with ``("done", body)``, where *body* is what ``/talk``
+    would have returned.  Refusals are raised before anything is yielded.
+    """
+    now = time.time()
+    started = await _start_talk(state, message, now)
+    if isinstance(started, dict):
+        yield "done", started
+        return
+    creature = started
+
+    llm = state.llm
+    response_text = None
+    if llm and not llm.budget_exhausted:
+        messages = await _talk_prompt(session, creature, message)
+        scheduler = getattr(state, "scheduler", None)
+        parts: list[str] = []
+        begun = time.perf_counter()
+        async for text in llm.stream(messages):
+            if not parts:
+                first_token = time.perf_counter() - begun
+                if scheduler is not None:
+                    scheduler.profiler.record(
+                        "talk_first_token", first_token, in_pass=False,
+                    )
+                if state.config.dev_mode:
+                    logger.info("[dev] First token after %.0fms", first_token * 1000)
+            parts.append(text)
+            yield "token", text
+        response_text = "".join(parts)
+    yield "done", _talk_reply(state, creature, now, response_text)
+
+
+async def _talk_events(
+    first: tuple[str, Any], tokens: AsyncIterator[tuple[str, Any]],
+) -> AsyncIterator[str]:
+    async with aclosing(tokens):
+        kind, data = first
+        while True:
+            if kind == "token":
+                yield format_event(None, "token", {"text": data})
+            else:
+                yield format_event(None, "done", data)
+                return
+            kind, data = await anext(tokens)
+
+
+@router.post("/talk/stream")
+async def talk_stream(
+    body: TalkRequest,
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+):
+    """``/talk`` with the reply streamed as server-sent ``token`` events.
+
+    The last event, ``done``, carries the body ``/talk`` returns.  When no
+    reply is generated (cooldown, exhausted budget) that body is returned
+    as plain JSON instead.
+    """
+    tokens = talk_tokens(request.app.state, session, body.message)
+    first = await anext(tokens)
+    if first[0] == "done":
+        return first[1]
+    return StreamingResponse(
+        _talk_events(first, tokens),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
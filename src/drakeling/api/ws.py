@@ -0,0 +1,172 @@
+"""Persistent WebSocket for the terminal UI and other long-lived clients.
+
+One connection carries actions in both directions.  Clients send
+``{"id": ..., "type": "talk" | "care" | "rest", ...}`` and get back a
+``result`` or ``error`` message with the same ``id`` once the action is
+done, however long the LLM takes.  A talk sent with ``"stream": true``
+is answered with ``token`` messages as the reply is generated first.
+Meanwhile the daemon pushes the same events as ``GET /events`` as
+``{"type": "event", ...}`` messages.
+
+Actions call the same service functions as the HTTP endpoints, so
+cooldowns, validation and error codes are identical.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from contextlib import aclosing
+from typing import Any, Awaitable, Callable
+
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from pydantic import ValidationError
+
+from drakeling.api.care import CareRequest, give_care
+from drakeling.api.events import parse_event_id
+from drakeling.api.rest import start_rest
+from drakeling.api.talk import TalkRequest, run_talk, talk_tokens
+from drakeling.daemon.events import follow
+
+logger = logging.getLogger(__name__)
+
+# No router-level token dependency: HTTPBearer cannot read a WebSocket
+router = APIRouter()
+
+# WebSocket pings from the server already keep the connection alive
+EVENT_WAIT_SECONDS = 3600.0
+
+# Actions outlive a closed connection; hold them until they finish
+_running: set[asyncio.Task[None]] = set()
+
+
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+async def _talk(websocket: WebSocket, message: dict[str, Any], send: Send) -> Any:
+    body = TalkRequest(message=message.get("message", ""))
+    state = websocket.app.state
+    async with state.session_factory() as session:
+        if not message.get("stream"):
+            return await run_talk(state, session, body.message)
+        tokens = talk_tokens(state, session, body.message)
+        async with aclosing(tokens):
+            async for kind, data in tokens:
+                if kind == "done":
+                    return data
+                await send({"id": message.get("id"), "type": "token",
+                            "text": data})
+
+
+async def _care(websocket: WebSocket, message: dict[str, Any], send: Send) -> Any:
+    body = CareRequest(type=message.get("care_type", ""))
+    return await give_care(websocket.app.state, body.type)
+
+
+async def _rest(websocket: WebSocket, message: dict[str, Any], send: Send) -> Any:
+    return await start_rest(websocket.app.state)
+
+
+ACTIONS: dict[str, Callable[[WebSocket, dict[str, Any], Send], Awaitable[Any]]] = {
+    "talk": _talk,
+    "care": _care,
+    "rest": _rest,
+}
+
+
+async def handle_message(
+    websocket: WebSocket, message: Any, send: Send,
+) -> dict[str, Any]:
+    """Run one client action and build the reply, errors included."""
+    if not isinstance(message, dict):
+        return {"id": None, "type": "error", "status": 400,
+                "detail": "Messages must be JSON objects"}
+    request_id = message.get("id")
+    action = ACTIONS.get(message.get("type"))
+    if action is None:
+        return {"id": request_id, "type": "error", "status": 400,
+                "detail": f"Unknown message type: {message.get('type')}"}
+    try:
+        data = await action(websocket, message, send)
+    except HTTPException as exc:
+        return {"id": request_id, "type": "error",
+                "status": exc.status_code, "detail": exc.detail}
+    except ValidationError as exc:
+        detail = "; ".join(err["msg"] for err in exc.errors())
+        return {"id": request_id, "type": "error", "status": 422,
+                "detail": detail}
+    return {"id": request_id, "type": "result", "data": data}
+
+
+def _authorised(websocket: WebSocket) -> bool:
+    scheme, _, token = websocket.headers.get("authorization", "").partition(" ")
+    return scheme.lower() == "bearer" and token == websocket.app.state.api_token
+
+
+@router.websocket("/ws")
+async def ws(websocket: WebSocket, last_event_id: str | None = None):
+    if not _authorised(websocket):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+
+    send_lock = asyncio.Lock()
+
+    async def send(payload: dict[str, Any]) -> None:
+        async with send_lock:
+            await websocket.send_json(payload)
+
+    async def push_events() -> None:
+        store = websocket.app.state.store
+        await store.get()
+        events = follow(
+            store.events, parse_event_id(last_event_id),
+            keepalive=EVENT_WAIT_SECONDS,
+        )
+        async with aclosing(events):
+            async for event in events:
+                if event is not None:
+                    await send({"type": "event", "event_id": event.id,
+                                "event": event.type, "data": event.data})
+
+    async def send_quietly(payload: dict[str, Any]) -> None:
+        # A client that leaves mid-reply must not abort the action
+        try:
+            await send(payload)
+        except Exception:
+            pass
+
+    async def run_action(message: Any) -> None:
+        try:
+            reply = await handle_message(websocket, message, send_quietly)
+        except Exception:
+            logger.exception("WebSocket action error")
+            request_id = message.get("id") if isinstance(message, dict) else None
+            reply = {"id": request_id, "type": "error", "status": 500,
+                     "detail": "Internal error"}
+        await send_quietly(reply)
+
+    pusher = asyncio.create_task(push_events())
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except json.JSONDecodeError:
+                await send({"id": None, "type": "error", "status": 400,
+                            "detail": "Invalid JSON"})
+                continue
+            # Each action in its own task, so a slow reply never holds up
+            # the next message or the event push
+            task = asyncio.create_task(run_action(message))
+            _running.add(task)
+            task.add_done_callback(_running.discard)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        pusher.cancel()
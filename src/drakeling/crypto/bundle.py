@@ -40,9 +40,18 @@ def _derive_key(passphrase: str, salt: bytes) -> bytes:
     return kdf.derive(passphrase.encode("utf-8"))
 
 
-def export_bundle(data_dir: Path, passphrase: str) -> bytes:
-    """Create an encrypted .drakeling bundle from the current creature data."""
-    db_path = data_dir / DB_FILENAME
+def export_bundle(
+    data_dir: Path,
+    passphrase: str,
+    *,
+    db_path: Path | None = None,
+) -> bytes:
+    """Create an encrypted .drakeling bundle from the current creature data.
+
+    *db_path* overrides the database file to bundle, e.g. a snapshot taken
+    with ``storage.snapshot.snapshot_database``.
+    """
+    db_path = db_path or data_dir / DB_FILENAME
     key_path = data_dir / PRIVATE_KEY_FILENAME
 
     if not db_path.exists():
@@ -6,6 +6,17 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+from drakeling.storage.database import (
+    DEFAULT_SQLITE_PROFILE,
+    SQLITE_PROFILES,
+    SQLitePragmas,
+)
+
+_SQLITE_DEFAULTS = SQLITE_PROFILES[DEFAULT_SQLITE_PROFILE]
+
+# History tables retention may archive; see daemon.retention
+RETENTION_TABLE_NAMES = ("interaction_log", "creature_memory", "lifecycle_events")
+
 
 def load_dotenv_from_data_dir(data_dir: Path) -> None:
     """Load .env from the platform data directory if it exists."""
@@ -43,10 +54,33 @@ class DrakelingConfig:
     # Background loop
     tick_seconds: int = 60
     min_reflection_interval: int = 600
+    state_flush_seconds: int = 30
+
+    # Batched history writes
+    write_flush_ms: int = 500
+    write_batch_rows: int = 100
 
     # Network
     port: int = 52780
 
+    # SQLite connection pragmas (defaults are the "balanced" profile)
+    sqlite_profile: str = DEFAULT_SQLITE_PROFILE
+    sqlite_journal_mode: str = _SQLITE_DEFAULTS.journal_mode
+    sqlite_synchronous: str = _SQLITE_DEFAULTS.synchronous
+    sqlite_mmap_size: int = _SQLITE_DEFAULTS.mmap_size
+    sqlite_cache_size: int = _SQLITE_DEFAULTS.cache_size
+    sqlite_temp_store: str = _SQLITE_DEFAULTS.temp_store
+    sqlite_busy_timeout: int = _SQLITE_DEFAULTS.busy_timeout
+    sqlite_auto_vacuum: str = _SQLITE_DEFAULTS.auto_vacuum
+
+    # History retention (0 keeps everything)
+    retention_days: int = 0
+    retention_tables: tuple[str, ...] = ("interaction_log",)
+
+    # Local snapshots (0 hours disables)
+    snapshot_hours: int = 0
+    snapshot_keep: int = 7
+
     # Runtime flags (set programmatically, not from env)
     dev_mode: bool = field(default=False, repr=False)
     allow_import: bool = field(default=False, repr=False)
@@ -57,6 +91,28 @@ class DrakelingConfig:
     ) -> DrakelingConfig:
         use_gw = _env_bool("DRAKELING_USE_OPENCLAW_GATEWAY")
         tick = max(10, int(os.environ.get("DRAKELING_TICK_SECONDS", "60")))
+        sqlite_profile = os.environ.get(
+            "DRAKELING_SQLITE_PROFILE", DEFAULT_SQLITE_PROFILE
+        ).lower()
+        if sqlite_profile not in SQLITE_PROFILES:
+            raise ValueError(
+                f"Invalid DRAKELING_SQLITE_PROFILE: {sqlite_profile}. "
+                "Must be one of: " + ", ".join(SQLITE_PROFILES)
+            )
+        base = SQLITE_PROFILES[sqlite_profile]
+        retention_tables = tuple(
+            name.strip().lower()
+            for name in os.environ.get(
+                "DRAKELING_RETENTION_TABLES", "interaction_log"
+            ).split(",")
+            if name.strip()
+        )
+        for name in retention_tables:
+            if name not in RETENTION_TABLE_NAMES:
+                raise ValueError(
+                    f"Invalid DRAKELING_RETENTION_TABLES entry: {name}. "
+                    "Must be one of: " + ", ".join(RETENTION_TABLE_NAMES)
+                )
         return cls(
             llm_base_url=os.environ.get("DRAKELING_LLM_BASE_URL", ""),
             llm_api_key=os.environ.get("DRAKELING_LLM_API_KEY", ""),
@@ -81,7 +137,60 @@ class DrakelingConfig:
             min_reflection_interval=int(
                 os.environ.get("DRAKELING_MIN_REFLECTION_INTERVAL", "600")
             ),
+            state_flush_seconds=max(
+                1, int(os.environ.get("DRAKELING_STATE_FLUSH_SECONDS", "30"))
+            ),
+            write_flush_ms=max(
+                10, int(os.environ.get("DRAKELING_WRITE_FLUSH_MS", "500"))
+            ),
+            write_batch_rows=max(
+                1, int(os.environ.get("DRAKELING_WRITE_BATCH_ROWS", "100"))
+            ),
             port=int(os.environ.get("DRAKELING_PORT", "52780")),
+            sqlite_profile=sqlite_profile,
+            sqlite_journal_mode=os.environ.get(
+                "DRAKELING_SQLITE_JOURNAL_MODE", base.journal_mode
+            ),
+            sqlite_synchronous=os.environ.get(
+                "DRAKELING_SQLITE_SYNCHRONOUS", base.synchronous
+            ),
+            sqlite_mmap_size=int(
+                os.environ.get("DRAKELING_SQLITE_MMAP_SIZE", base.mmap_size)
+            ),
+            sqlite_cache_size=int(
+                os.environ.get("DRAKELING_SQLITE_CACHE_SIZE", base.cache_size)
+            ),
+            sqlite_temp_store=os.environ.get(
+                "DRAKELING_SQLITE_TEMP_STORE", base.temp_store
+            ),
+            sqlite_busy_timeout=int(
+                os.environ.get("DRAKELING_SQLITE_BUSY_TIMEOUT", base.busy_timeout)
+            ),
+            sqlite_auto_vacuum=os.environ.get(
+                "DRAKELING_SQLITE_AUTO_VACUUM", base.auto_vacuum
+            ),
+            retention_days=max(
+                0, int(os.environ.get("DRAKELING_RETENTION_DAYS", "0"))
+            ),
+            retention_tables=retention_tables,
+            snapshot_hours=max(
+                0, int(os.environ.get("DRAKELING_SNAPSHOT_HOURS", "0"))
+            ),
+            snapshot_keep=max(
+                1, int(os.environ.get("DRAKELING_SNAPSHOT_KEEP", "7"))
+            ),
             dev_mode=dev_mode,
             allow_import=allow_import,
         )
+
+    def sqlite_pragmas(self) -> SQLitePragmas:
+        """Pragmas to apply on every database connection."""
+        return SQLitePragmas(
+            journal_mode=self.sqlite_journal_mode,
+            synchronous=self.sqlite_synchronous,
+            mmap_size=self.sqlite_mmap_size,
+            cache_size=self.sqlite_cache_size,
+            temp_store=self.sqlite_temp_store,
+            busy_timeout=self.sqlite_busy_timeout,
+            auto_vacuum=self.sqlite_auto_vacuum,
+        )
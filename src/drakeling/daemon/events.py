@@ -0,0 +1,258 @@
+"""Push notifications for connected clients.
+
+:class:`EventBus` turns changes to the live creature into a numbered
+stream of small events: ``state`` carries only the stats that moved,
+``attention`` fires when the needs-attention result changes, and
+``lifecycle`` and ``reflection`` are published once their rows are
+committed.  ``creature`` announces that the creature was born, replaced
+or released and carries the whole new state.
+
+Recent events are kept in a ring buffer so a client that reconnects with
+the last id it saw gets exactly what it missed; anyone further behind is
+sent a fresh snapshot instead.  Ids start at the bus's creation time in
+milliseconds, so they keep increasing across daemon restarts and an id
+from a previous run is never mistaken for a current one.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+from drakeling.domain.attention import evaluate_attention
+from drakeling.domain.models import Creature
+from drakeling.storage.models import CreatureMemoryRow, LifecycleEventRow
+
+if TYPE_CHECKING:
+    from drakeling.daemon.state import CreatureStore
+    from drakeling.daemon.tick import TickScheduler
+
+logger = logging.getLogger(__name__)
+
+EVENT_BUFFER = 256
+SUBSCRIBER_QUEUE = 64
+STAT_PLACES = 3
+PROJECT_INTERVAL_SECONDS = 15
+
+STAT_NAMES = (
+    "mood", "energy", "trust", "loneliness", "state_curiosity", "stability",
+)
+
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    type: str
+    data: dict[str, Any]
+
+
+def creature_state(creature: Creature) -> dict[str, Any]:
+    """The fields of *creature* that clients display, stats rounded."""
+    ms = creature.mood_state
+    state: dict[str, Any] = {
+        "name": creature.name,
+        "colour": str(creature.colour),
+        "lifecycle_stage": creature.lifecycle_stage.value,
+    }
+    for name in STAT_NAMES:
+        state[name] = round(getattr(ms, name), STAT_PLACES)
+    state["cumulative_care_events"] = creature.cumulative_care_events
+    state["cumulative_talk_interactions"] = creature.cumulative_talk_interactions
+    return state
+
+
+def attention_state(creature: Creature, now: float) -> dict[str, Any]:
+    reason, urgency = evaluate_attention(creature, now)
+    return {
+        "needs_attention": reason is not None,
+        "reason": reason,
+        "urgency": urgency,
+    }
+
+
+class EventBus:
+    """Numbered, buffered fan-out of creature changes.
+
+    Subscribers get a bounded queue each.  A subscriber that falls so far
+    behind that its queue fills is sent ``None`` in place of the events it
+    missed, meaning "resynchronise from a snapshot".
+    """
+
+    def __init__(self, *, buffer: int = EVENT_BUFFER) -> None:
+        self._events: deque[Event] = deque(maxlen=buffer)
+        self._next_id = int(time.time() * 1000)
+        self._subscribers: set[asyncio.Queue[Event | None]] = set()
+        self._state: dict[str, Any] | None = None
+        self._attention: dict[str, Any] | None = None
+        self.published = 0
+        self.resyncs = 0
+
+    @property
+    def last_id(self) -> int:
+        """Id of the newest event, or one less than the first to come."""
+        return self._next_id - 1
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue[Event | None]:
+        queue: asyncio.Queue[Event | None] = asyncio.Queue(SUBSCRIBER_QUEUE)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[Event | None]) -> None:
+        self._subscribers.discard(queue)
+
+    def since(self, last_id: int) -> list[Event] | None:
+        """Buffered events newer than *last_id*.
+
+        Returns None when *last_id* is older than the buffer reaches, or
+        was never issued by this bus, so the caller needs a snapshot.
+        """
+        oldest = self._events[0].id if self._events else self._next_id
+        if last_id < oldest - 1 or last_id > self.last_id:
+            return None
+        return [event for event in self._events if event.id > last_id]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Everything a client needs to start from the current id."""
+        return {"creature": self._state, "attention": self._attention}
+
+    def publish(self, type: str, data: dict[str, Any]) -> Event:
+        event = Event(self._next_id, type, data)
+        self._next_id += 1
+        self._events.append(event)
+        self.published += 1
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+                self.resyncs += 1
+        return event
+
+    def reset(self, creature: Creature | None, now: float) -> None:
+        """Announce a new (or no) creature with its complete state."""
+        if creature is None:
+            self._state = self._attention = None
+        else:
+            self._state = creature_state(creature)
+            self._attention = attention_state(creature, now)
+        self.publish("creature", self.snapshot())
+
+    def creature_changed(self, creature: Creature, now: float) -> None:
+        """Publish whatever about *creature* differs from the last event."""
+        state = creature_state(creature)
+        if self._state is None:
+            changed = state
+        else:
+            changed = {
+                key: value for key, value in state.items()
+                if self._state.get(key) != value
+            }
+        if changed:
+            self._state = state
+            self.publish("state", changed)
+
+        attention = attention_state(creature, now)
+        if attention != self._attention:
+            self._attention = attention
+            self.publish("attention", attention)
+
+    def rows_committed(self, rows: list[Any]) -> None:
+        """Publish lifecycle events and reflections once they are stored."""
+        for row in rows:
+            if isinstance(row, LifecycleEventRow):
+                self.publish("lifecycle", {
+                    "created_at": row.created_at,
+                    "event_type": row.event_type,
+                    "from_stage": row.from_stage,
+                    "to_stage": row.to_stage,
+                })
+            elif (
+                isinstance(row, CreatureMemoryRow)
+                and row.memory_type == "reflection"
+            ):
+                self.publish("reflection", {
+                    "created_at": row.created_at,
+                    "content": row.content,
+                    "lifecycle_stage": row.lifecycle_stage,
+                })
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "last_id": self.last_id,
+            "subscribers": self.subscribers,
+            "published": self.published,
+            "resyncs": self.resyncs,
+        }
+
+
+async def follow(
+    bus: EventBus,
+    last_event_id: int | None = None,
+    *,
+    keepalive: float,
+) -> AsyncIterator[Event | None]:
+    """Yield the events after *last_event_id*, then live ones, forever.
+
+    Without a resumable id this starts with a ``snapshot`` event, as it
+    does again whenever the subscriber falls behind.  Yields None after
+    *keepalive* seconds without an event.
+    """
+    queue = bus.subscribe()
+    try:
+        backlog = bus.since(last_event_id) if last_event_id is not None else None
+        if backlog is None:
+            sent = bus.last_id
+            yield Event(sent, "snapshot", bus.snapshot())
+        else:
+            sent = last_event_id
+            for event in backlog:
+                sent = event.id
+                yield event
+
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), keepalive)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if event is None:
+                sent = bus.last_id
+                yield Event(sent, "snapshot", bus.snapshot())
+            elif event.id > sent:
+                sent = event.id
+                yield event
+    finally:
+        bus.unsubscribe(queue)
+
+
+async def start_projection_loop(
+    store: CreatureStore,
+    scheduler: TickScheduler,
+    interval: float = PROJECT_INTERVAL_SECONDS,
+) -> None:
+    """Publish decay between ticks while anyone is listening.
+
+    The tick loop only settles the creature when something observable is
+    due, so without this a connected client would see stats frozen for
+    up to an hour of idle ticks.
+    """
+    events = store.events
+    while True:
+        await asyncio.sleep(interval)
+        creature = store.creature
+        if not events.subscribers or creature is None:
+            continue
+        try:
+            now = time.time()
+            events.creature_changed(scheduler.project(creature, now), now)
+        except Exception:
+            logger.exception("Event projection error")
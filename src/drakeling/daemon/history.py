@@ -0,0 +1,234 @@
+"""Round-robin stat history at minute, hour and day resolution.
+
+Every tick contributes one sample of the creature's stats to a bucket at
+each resolution.  Samples are averaged in memory and merged into
+``stat_history`` by an upsert whenever the creature state is flushed, so
+recording costs nothing on the tick itself.  Finer resolutions are pruned
+once they fall out of their window, like an RRD archive.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Row, bindparam, delete, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from drakeling.domain.decay import apply_decay_span
+from drakeling.domain.models import Creature, LifecycleStage, MoodState
+from drakeling.storage.models import StatHistoryRow
+
+STAT_FIELDS = (
+    "mood", "energy", "trust", "loneliness", "state_curiosity", "stability",
+)
+
+# Name -> (bucket seconds, seconds kept; None keeps forever)
+RESOLUTIONS: dict[str, tuple[int, int | None]] = {
+    "minute": (60, 86_400),
+    "hour": (3_600, 30 * 86_400),
+    "day": (86_400, None),
+}
+
+# Ticks sampled when catching up after downtime; older ones are skipped
+MAX_BACKFILL_TICKS = 1_440
+PRUNE_INTERVAL_SECONDS = 3_600
+
+_table = StatHistoryRow.__table__
+_insert = insert(_table)
+_UPSERT = _insert.on_conflict_do_update(
+    index_elements=["resolution", "bucket_start"],
+    set_={
+        **{
+            name: (
+                _table.c[name] * _table.c.samples
+                + _insert.excluded[name] * _insert.excluded.samples
+            ) / (_table.c.samples + _insert.excluded.samples)
+            for name in STAT_FIELDS
+        },
+        "samples": _table.c.samples + _insert.excluded.samples,
+    },
+)
+
+
+class StatHistory:
+    """Pending stat samples, averaged per bucket until written."""
+
+    def __init__(self) -> None:
+        # (resolution seconds, bucket start) -> stat sums + sample count
+        self._open: dict[tuple[int, float], list[float]] = {}
+        self._pruned_at = 0.0
+
+    @property
+    def pending(self) -> int:
+        return len(self._open)
+
+    def record(self, state: MoodState, at: float) -> None:
+        """Add one sample taken at *at*."""
+        values = [getattr(state, name) for name in STAT_FIELDS]
+        for seconds, _ in RESOLUTIONS.values():
+            key = (seconds, at - at % seconds)
+            acc = self._open.get(key)
+            if acc is None:
+                self._open[key] = [*values, 1]
+            else:
+                for i, value in enumerate(values):
+                    acc[i] += value
+                acc[-1] += 1
+
+    def record_spans(
+        self,
+        spans: list[tuple[Creature, int]],
+        first_tick_at: float,
+        tick_seconds: float,
+    ) -> None:
+        """Sample every tick of consecutive *spans* starting at *first_tick_at*.
+
+        Each span is ``(creature, ticks)`` as collected by
+        :func:`~drakeling.domain.lifecycle.advance_ticks`: *ticks* ticks
+        decayed from *creature* within its stage.  Intermediate states are
+        projected with closed-form decay; only the last
+        ``MAX_BACKFILL_TICKS`` ticks overall are sampled.
+        """
+        total = sum(n for _, n in spans)
+        skip = max(0, total - MAX_BACKFILL_TICKS)
+        at = first_tick_at
+        for creature, n_ticks in spans:
+            for k in range(1, n_ticks + 1):
+                if skip:
+                    skip -= 1
+                else:
+                    state = creature.mood_state
+                    if creature.lifecycle_stage != LifecycleStage.EGG:
+                        state = apply_decay_span(
+                            creature.mood_state,
+                            creature.lifecycle_stage,
+                            creature.personality,
+                            k,
+                        )
+                    self.record(state, at)
+                at += tick_seconds
+
+    def copy(self) -> StatHistory:
+        """An independent copy of the pending buckets."""
+        other = StatHistory()
+        other._open = {key: list(acc) for key, acc in self._open.items()}
+        return other
+
+    def merged(
+        self,
+        rows: list[Row],
+        resolution: str,
+        start: float,
+        end: float,
+    ) -> list[tuple[float, ...]]:
+        """Fold pending buckets at *resolution* into *rows* from
+        :func:`query_stats`; ``(bucket_start, *STAT_FIELDS)``, oldest first.
+        """
+        seconds, _ = RESOLUTIONS[resolution]
+        first = start - start % seconds
+        buckets = {
+            row.bucket_start: [
+                *(getattr(row, name) * row.samples for name in STAT_FIELDS),
+                row.samples,
+            ]
+            for row in rows
+        }
+        for (res, bucket_start), acc in self._open.items():
+            if res != seconds or not first <= bucket_start <= end:
+                continue
+            merged = buckets.setdefault(bucket_start, [0.0] * len(acc))
+            for i, value in enumerate(acc):
+                merged[i] += value
+        return [
+            (bucket_start, *(total / acc[-1] for total in acc[:-1]))
+            for bucket_start, acc in sorted(buckets.items())
+        ]
+
+    def take(self) -> list[dict[str, Any]]:
+        """Remove pending buckets as upsert parameters (stat averages)."""
+        entries = []
+        for (seconds, bucket_start), acc in self._open.items():
+            n = acc[-1]
+            entries.append({
+                "resolution": seconds,
+                "bucket_start": bucket_start,
+                **{name: acc[i] / n for i, name in enumerate(STAT_FIELDS)},
+                "samples": int(n),
+            })
+        self._open = {}
+        return entries
+
+    def requeue(self, entries: list[dict[str, Any]]) -> None:
+        """Merge back buckets whose write failed."""
+        for entry in entries:
+            key = (entry["resolution"], entry["bucket_start"])
+            n = entry["samples"]
+            sums = [entry[name] * n for name in STAT_FIELDS]
+            acc = self._open.get(key)
+            if acc is None:
+                self._open[key] = [*sums, n]
+            else:
+                for i, value in enumerate(sums):
+                    acc[i] += value
+                acc[-1] += n
+
+    async def write(
+        self,
+        session: AsyncSession,
+        entries: list[dict[str, Any]],
+        now: float,
+    ) -> None:
+        """Merge *entries* into ``stat_history`` and prune expired rows.
+
+        The caller commits.
+        """
+        if entries:
+            await session.execute(_UPSERT, entries)
+        if now - self._pruned_at >= PRUNE_INTERVAL_SECONDS:
+            for seconds, keep in RESOLUTIONS.values():
+                if keep is None:
+                    continue
+                await session.execute(
+                    delete(StatHistoryRow)
+                    .where(StatHistoryRow.resolution == seconds)
+                    .where(StatHistoryRow.bucket_start < now - keep)
+                )
+            self._pruned_at = now
+
+
+def pick_resolution(start: float, now: float) -> str:
+    """Finest resolution whose window still covers *start*."""
+    for name, (_, keep) in RESOLUTIONS.items():
+        if keep is None or start >= now - keep:
+            return name
+    return "day"
+
+
+_QUERY = (
+    select(
+        StatHistoryRow.bucket_start,
+        *(StatHistoryRow.__table__.c[name] for name in STAT_FIELDS),
+        StatHistoryRow.samples,
+    )
+    .where(StatHistoryRow.resolution == bindparam("resolution"))
+    .where(StatHistoryRow.bucket_start >= bindparam("start"))
+    .where(StatHistoryRow.bucket_start <= bindparam("end"))
+    .order_by(StatHistoryRow.bucket_start)
+)
+
+
+async def query_stats(
+    session: AsyncSession,
+    resolution: str,
+    start: float,
+    end: float,
+) -> list[Row]:
+    """``(bucket_start, *STAT_FIELDS, samples)`` rows at *resolution*
+    covering [*start*, *end*], oldest first."""
+    seconds, _ = RESOLUTIONS[resolution]
+    result = await session.execute(_QUERY, {
+        "resolution": seconds,
+        "start": start - start % seconds,
+        "end": end,
+    })
+    return list(result.all())
@@ -12,7 +12,13 @@ from drakeling.crypto.token import ensure_api_token
 from drakeling.daemon.config import DrakelingConfig, load_dotenv_from_data_dir
 from drakeling.daemon.setup import check_llm_setup
 from drakeling.daemon.startup import check_machine_binding
-from drakeling.storage.database import get_engine, get_session_factory, run_migrations
+from drakeling.storage.database import (
+    ensure_auto_vacuum,
+    get_engine,
+    get_read_engine,
+    get_session_factory,
+    run_migrations,
+)
 from drakeling.storage.paths import get_data_dir
 
 
@@ -71,9 +77,17 @@ async def _startup() -> None:
     if token_just_created and not config.dev_mode:
         _print_token_info(token_path, api_token)
 
-    engine = get_engine(data_dir)
+    engine = get_engine(data_dir, config.sqlite_pragmas())
     await run_migrations(engine)
+    # Converting rewrites the whole file; only worth it if retention frees pages
+    if config.retention_days > 0 and await ensure_auto_vacuum(
+        engine, config.sqlite_pragmas()
+    ):
+        print(f"Converted database to auto_vacuum={config.sqlite_auto_vacuum}")
     session_factory = get_session_factory(engine)
+    read_session_factory = get_session_factory(
+        get_read_engine(data_dir, config.sqlite_pragmas())
+    )
 
     async with session_factory() as session:
         await check_machine_binding(data_dir, session)
@@ -98,32 +112,44 @@ async def _startup() -> None:
 
     llm = LLMWrapper(config)
 
+    from drakeling.daemon.state import CreatureStore
+    from drakeling.daemon.tick import TickScheduler
+    from drakeling.daemon.writes import WriteQueue
+
+    writes = WriteQueue(session_factory, max_rows=config.write_batch_rows)
+    store = CreatureStore(session_factory, writes)
+    scheduler = TickScheduler(config)
+
     async def _on_budget_exhausted():
         """Transition creature to exhausted stage when daily budget runs out."""
         import time as _t
-        from sqlalchemy import select as _sel
-        from drakeling.storage.models import CreatureStateRow as _CSR
+        from dataclasses import replace as _replace
         from drakeling.storage.models import LifecycleEventRow as _LER
         from drakeling.domain.models import LifecycleStage as _LS
 
-        async with session_factory() as sess:
-            res = await sess.execute(_sel(_CSR).limit(1))
-            row = res.scalar_one_or_none()
-            if row is None or row.lifecycle_stage == _LS.EXHAUSTED.value:
-                return
-            now = _t.time()
-            row.pre_exhausted_stage = row.lifecycle_stage
-            row.lifecycle_stage = _LS.EXHAUSTED.value
-            row.updated_at = now
-            sess.add(_LER(
-                created_at=now,
-                event_type="budget_exhausted",
-                from_stage=row.pre_exhausted_stage,
-                to_stage=_LS.EXHAUSTED.value,
-            ))
-            await sess.commit()
-            if config.dev_mode:
-                print(f"[dev] Budget exhausted — entering exhausted stage")
+        creature = await store.get()
+        if creature is None or creature.lifecycle_stage == _LS.EXHAUSTED:
+            return
+        now = _t.time()
+        events = scheduler.settle(store, now)
+        creature = store.creature
+        if creature.lifecycle_stage == _LS.EXHAUSTED:
+            await store.flush(*events)
+            return
+        store.update(_replace(
+            creature,
+            pre_exhausted_stage=creature.lifecycle_stage,
+            lifecycle_stage=_LS.EXHAUSTED,
+        ), now=now)
+        await store.flush(*events, _LER(
+            created_at=now,
+            event_type="budget_exhausted",
+            from_stage=creature.lifecycle_stage.value,
+            to_stage=_LS.EXHAUSTED.value,
+        ))
+        scheduler.wake()
+        if config.dev_mode:
+            print(f"[dev] Budget exhausted — entering exhausted stage")
 
     llm.set_budget_exhausted_callback(_on_budget_exhausted)
 
@@ -153,15 +179,42 @@ async def _startup() -> None:
         config=config,
         session_factory=session_factory,
         data_dir=data_dir,
+        store=store,
+        read_session_factory=read_session_factory,
     )
     app.state.llm = llm
+    app.state.scheduler = scheduler
 
     # Start background tick loop
     from drakeling.daemon.tick import start_tick_loop
 
     tick_task = asyncio.create_task(
-        start_tick_loop(session_factory, config, llm)
+        start_tick_loop(store, config, llm, scheduler)
+    )
+    flush_task = asyncio.create_task(
+        store.run_flusher(config.state_flush_seconds)
+    )
+    writes_task = asyncio.create_task(
+        writes.run(config.write_flush_ms / 1000)
     )
+    from drakeling.daemon.events import start_projection_loop
+
+    events_task = asyncio.create_task(start_projection_loop(store, scheduler))
+    retention_task = None
+    if config.retention_days > 0:
+        from drakeling.daemon.retention import start_retention_loop
+
+        retention_task = asyncio.create_task(
+            start_retention_loop(session_factory, config)
+        )
+
+    snapshot_task = None
+    if config.snapshot_hours > 0:
+        from drakeling.daemon.snapshots import start_snapshot_loop
+
+        snapshot_task = asyncio.create_task(
+            start_snapshot_loop(store, session_factory, data_dir, config)
+        )
 
     server_config = uvicorn.Config(
         app,
@@ -175,6 +228,14 @@ async def _startup() -> None:
         await server.serve()
     finally:
         tick_task.cancel()
+        flush_task.cancel()
+        writes_task.cancel()
+        events_task.cancel()
+        if retention_task is not None:
+            retention_task.cancel()
+        if snapshot_task is not None:
+            snapshot_task.cancel()
+        await store.flush()
         await llm.close()
 
 
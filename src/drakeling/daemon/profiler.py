@@ -0,0 +1,107 @@
+"""Per-phase timing for the background tick loop.
+
+Each phase of a tick pass is timed with ``perf_counter`` and kept in a
+rolling window, so diagnostics reflect recent behaviour rather than the
+whole uptime of the daemon.
+"""
+from __future__ import annotations
+
+import bisect
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+# Upper bucket edges in milliseconds; the last bucket is open-ended
+BUCKET_EDGES_MS: tuple[float, ...] = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class PhaseHistogram:
+    """Rolling window of durations (seconds) for one phase."""
+
+    def __init__(self, window: int) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self.total_count = 0
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self.total_count += 1
+
+    def _percentile(self, ordered: list[float], q: float) -> float:
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
+
+    def summary(self) -> dict[str, Any]:
+        """Percentiles and bucket counts over the window, in milliseconds."""
+        ordered = sorted(s * 1000.0 for s in self._samples)
+        buckets = [0] * (len(BUCKET_EDGES_MS) + 1)
+        for ms in ordered:
+            buckets[bisect.bisect_left(BUCKET_EDGES_MS, ms)] += 1
+        labels = [f"le_{edge:g}ms" for edge in BUCKET_EDGES_MS] + ["inf"]
+        if not ordered:
+            stats = {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        else:
+            stats = {
+                "mean_ms": sum(ordered) / len(ordered),
+                "p50_ms": self._percentile(ordered, 0.50),
+                "p95_ms": self._percentile(ordered, 0.95),
+                "max_ms": ordered[-1],
+            }
+        return {
+            "count": len(ordered),
+            "total_count": self.total_count,
+            **stats,
+            "last_ms": self._samples[-1] * 1000.0 if self._samples else 0.0,
+            "buckets": dict(zip(labels, buckets)),
+        }
+
+
+class TickProfiler:
+    """Collects per-phase durations for tick passes.
+
+    Use :meth:`phase` as a context manager around each step of a pass.
+    :attr:`last_pass` holds the durations of the most recent pass.
+    """
+
+    def __init__(self, window: int = 256) -> None:
+        self.window = window
+        self._phases: dict[str, PhaseHistogram] = {}
+        self.last_pass: dict[str, float] = {}
+
+    def begin_pass(self) -> None:
+        self.last_pass = {}
+
+    def record(self, name: str, seconds: float, *, in_pass: bool = True) -> None:
+        """Add a sample for *name*.
+
+        Pass ``in_pass=False`` for work that runs outside a tick pass, such
+        as a background reflection, so it is kept out of :attr:`last_pass`.
+        """
+        hist = self._phases.get(name)
+        if hist is None:
+            hist = self._phases[name] = PhaseHistogram(self.window)
+        hist.add(seconds)
+        if in_pass:
+            self.last_pass[name] = self.last_pass.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str, *, in_pass: bool = True) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, in_pass=in_pass)
+
+    def format_last_pass(self) -> str:
+        return " ".join(
+            f"{name}={seconds * 1000.0:.2f}ms"
+            for name, seconds in self.last_pass.items()
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "window": self.window,
+            "phases": {
+                name: hist.summary() for name, hist in self._phases.items()
+            },
+        }
@@ -0,0 +1,168 @@
+"""History retention: archive old rows in small batches, then reclaim space.
+
+Retention is opt-in.  Rows older than the retention window are moved out
+of the configured history tables (only ``interaction_log`` by default)
+into ``history_archive`` as zlib-compressed JSON, a few hundred at a time.
+Each batch is its own short transaction, with a pause in between, so the
+write lock is never held for long and API writes interleave freely.
+Freed pages are then returned to the filesystem with
+``PRAGMA incremental_vacuum``, also in steps.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import zlib
+from typing import Any
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from drakeling.daemon.config import DrakelingConfig
+from drakeling.storage.models import (
+    CreatureMemoryRow,
+    HistoryArchiveRow,
+    InteractionLogRow,
+    LifecycleEventRow,
+)
+
+logger = logging.getLogger(__name__)
+
+RETENTION_TABLES = {
+    model.__tablename__: model
+    for model in (InteractionLogRow, CreatureMemoryRow, LifecycleEventRow)
+}
+BATCH_ROWS = 500
+VACUUM_PAGES = 256
+BATCH_PAUSE_SECONDS = 0.05
+RETENTION_INTERVAL_SECONDS = 3_600
+
+
+def _row_to_dict(row: Any) -> dict[str, Any]:
+    return {c.key: getattr(row, c.key) for c in row.__mapper__.column_attrs}
+
+
+def decode_archive(payload: bytes) -> list[dict[str, Any]]:
+    """Return the rows stored in a ``history_archive`` payload."""
+    return json.loads(zlib.decompress(payload))
+
+
+async def archive_batch(
+    session_factory: async_sessionmaker[AsyncSession],
+    model: Any,
+    cutoff: float,
+    now: float,
+    limit: int = BATCH_ROWS,
+) -> int:
+    """Move up to *limit* rows older than *cutoff* into the archive.
+
+    Rows are taken in id order, which follows insertion time, so the scan
+    stops at the first batch of old rows.  Returns the number moved.
+    """
+    async with session_factory() as session:
+        rows = (await session.execute(
+            select(model)
+            .where(model.created_at < cutoff)
+            .order_by(model.id)
+            .limit(limit)
+        )).scalars().all()
+        if not rows:
+            return 0
+        payload = json.dumps(
+            [_row_to_dict(row) for row in rows], separators=(",", ":"),
+        ).encode()
+        session.add(HistoryArchiveRow(
+            archived_at=now,
+            source_table=model.__tablename__,
+            first_created_at=min(row.created_at for row in rows),
+            last_created_at=max(row.created_at for row in rows),
+            row_count=len(rows),
+            payload=zlib.compress(payload),
+        ))
+        await session.execute(
+            delete(model).where(model.id.in_([row.id for row in rows]))
+        )
+        await session.commit()
+    return len(rows)
+
+
+async def incremental_vacuum(
+    session_factory: async_sessionmaker[AsyncSession],
+    pages: int = VACUUM_PAGES,
+    pause: float = BATCH_PAUSE_SECONDS,
+) -> int:
+    """Release free pages *pages* at a time; returns the number released."""
+    released = 0
+    while True:
+        async with session_factory() as session:
+            free = (await session.execute(
+                text("PRAGMA freelist_count")
+            )).scalar_one()
+            if free == 0:
+                return released
+            await session.execute(
+                text(f"PRAGMA incremental_vacuum({int(pages)})")
+            )
+            await session.commit()
+            after = (await session.execute(
+                text("PRAGMA freelist_count")
+            )).scalar_one()
+        if after >= free:
+            # auto_vacuum is not INCREMENTAL on this database
+            return released
+        released += free - after
+        await asyncio.sleep(pause)
+
+
+async def run_retention(
+    session_factory: async_sessionmaker[AsyncSession],
+    retention_days: int,
+    *,
+    tables: tuple[str, ...] = ("interaction_log",),
+    now: float | None = None,
+    pause: float = BATCH_PAUSE_SECONDS,
+) -> dict[str, int]:
+    """Archive rows of *tables* older than *retention_days*.
+
+    Returns rows archived per table and the number of pages reclaimed.
+    """
+    if now is None:
+        now = time.time()
+    cutoff = now - retention_days * 86_400
+    result: dict[str, int] = {}
+    for name in tables:
+        model = RETENTION_TABLES[name]
+        moved = 0
+        while True:
+            n = await archive_batch(
+                session_factory, model, cutoff, now, limit=BATCH_ROWS,
+            )
+            moved += n
+            if n < BATCH_ROWS:
+                break
+            await asyncio.sleep(pause)
+        result[model.__tablename__] = moved
+    result["pages_reclaimed"] = await incremental_vacuum(
+        session_factory, pause=pause,
+    )
+    return result
+
+
+async def start_retention_loop(
+    session_factory: async_sessionmaker[AsyncSession],
+    config: DrakelingConfig,
+) -> None:
+    """Apply the retention policy once an hour, forever."""
+    while True:
+        try:
+            result = await run_retention(
+                session_factory, config.retention_days,
+                tables=config.retention_tables,
+            )
+            if config.dev_mode and any(result.values()):
+                logger.info("[dev] Retention: %s", result)
+        except Exception:
+            logger.exception("Retention error")
+        await asyncio.sleep(RETENTION_INTERVAL_SECONDS)
@@ -0,0 +1,58 @@
+"""Scheduled local snapshots of the database, with rotation."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from drakeling.daemon.config import DrakelingConfig
+from drakeling.daemon.state import CreatureStore
+from drakeling.storage.snapshot import (
+    SNAPSHOT_DIRNAME,
+    list_snapshots,
+    take_snapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def seconds_until_due(data_dir: Path, interval: float, now: float) -> float:
+    """Time left before the next snapshot, from the newest one on disk."""
+    snapshots = list_snapshots(data_dir / SNAPSHOT_DIRNAME)
+    if not snapshots:
+        return 0.0
+    return max(0.0, snapshots[-1].stat().st_mtime + interval - now)
+
+
+async def start_snapshot_loop(
+    store: CreatureStore,
+    session_factory: async_sessionmaker[AsyncSession],
+    data_dir: Path,
+    config: DrakelingConfig,
+) -> None:
+    """Snapshot every ``snapshot_hours``, keeping ``snapshot_keep`` files.
+
+    The schedule follows the newest snapshot on disk, so restarting the
+    daemon neither skips nor repeats one.
+    """
+    interval = config.snapshot_hours * 3_600
+    while True:
+        await asyncio.sleep(seconds_until_due(data_dir, interval, time.time()))
+        written = False
+        try:
+            if await store.get() is not None:
+                # Capture in-memory state and queued history too
+                await store.flush()
+                path = await take_snapshot(
+                    session_factory, data_dir, keep=config.snapshot_keep,
+                )
+                written = True
+                if config.dev_mode:
+                    logger.info("[dev] Snapshot written: %s", path)
+        except Exception:
+            logger.exception("Snapshot error")
+        if not written:
+            await asyncio.sleep(interval)
@@ -3,11 +3,10 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from drakeling.crypto.identity import verify_binding
-from drakeling.storage.models import CreatureStateRow
+from drakeling.storage.queries import creature_identity
 
 
 async def check_machine_binding(data_dir: Path, session: AsyncSession) -> None:
@@ -16,8 +15,7 @@ async def check_machine_binding(data_dir: Path, session: AsyncSession) -> None:
     Prints a clear error and exits if the check fails.
     Called at daemon startup when a creature already exists.
     """
-    result = await session.execute(select(CreatureStateRow).limit(1))
-    creature = result.scalar_one_or_none()
+    creature = await creature_identity(session)
     if creature is None:
         return  # No creature yet — nothing to check
 
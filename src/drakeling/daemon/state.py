@@ -0,0 +1,233 @@
+"""Daemon-owned, authoritative in-memory creature state.
+
+The live ``Creature`` is held here and served to every endpoint and to the
+tick loop without touching SQLite.  Stat changes are written behind to
+``creature_state`` on a fixed interval; lifecycle events and shutdown
+flush immediately so the row never lags a stage change.  History rows
+queued on :attr:`CreatureStore.writes` and stat samples on
+:attr:`CreatureStore.history` ride along with every flush, and every
+change is announced to connected clients on :attr:`CreatureStore.events`.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from drakeling.daemon.events import EventBus
+from drakeling.daemon.history import StatHistory
+from drakeling.daemon.writes import WriteQueue
+from drakeling.domain.models import (
+    Creature,
+    LifecycleStage,
+    MoodState,
+    PersonalityProfile,
+)
+from drakeling.storage.models import CreatureStateRow
+
+logger = logging.getLogger(__name__)
+
+
+def _row_to_creature(row: CreatureStateRow) -> Creature:
+    return Creature(
+        name=row.name,
+        colour=row.colour,
+        personality=PersonalityProfile(
+            seed=row.personality_seed,
+            trait_curiosity=row.trait_curiosity,
+            trait_sociability=row.trait_sociability,
+            trait_confidence=row.trait_confidence,
+            trait_emotional_sensitivity=row.trait_emotional_sensitivity,
+            trait_autonomy_preference=row.trait_autonomy_preference,
+            trait_loneliness_rate=row.trait_loneliness_rate,
+        ),
+        mood_state=MoodState(
+            mood=row.mood,
+            energy=row.energy,
+            trust=row.trust,
+            trust_floor=row.trust_floor,
+            loneliness=row.loneliness,
+            state_curiosity=row.state_curiosity,
+            stability=row.stability,
+        ),
+        lifecycle_stage=LifecycleStage(row.lifecycle_stage),
+        pre_exhausted_stage=(
+            LifecycleStage(row.pre_exhausted_stage)
+            if row.pre_exhausted_stage
+            else None
+        ),
+        pre_resting_stage=(
+            LifecycleStage(row.pre_resting_stage)
+            if row.pre_resting_stage
+            else None
+        ),
+        born_at=row.born_at,
+        hatched_at=row.hatched_at,
+        public_key_hex=row.public_key_hex,
+        cumulative_care_events=row.cumulative_care_events,
+        cumulative_talk_interactions=row.cumulative_talk_interactions,
+        last_reflection_at=row.last_reflection_at,
+    )
+
+
+def _creature_to_values(creature: Creature) -> dict[str, Any]:
+    """Column values for the mutable part of ``creature_state``."""
+    ms = creature.mood_state
+    return {
+        "mood": ms.mood,
+        "energy": ms.energy,
+        "trust": ms.trust,
+        "trust_floor": ms.trust_floor,
+        "loneliness": ms.loneliness,
+        "state_curiosity": ms.state_curiosity,
+        "stability": ms.stability,
+        "lifecycle_stage": creature.lifecycle_stage.value,
+        "pre_exhausted_stage": (
+            creature.pre_exhausted_stage.value
+            if creature.pre_exhausted_stage
+            else None
+        ),
+        "pre_resting_stage": (
+            creature.pre_resting_stage.value
+            if creature.pre_resting_stage
+            else None
+        ),
+        "hatched_at": creature.hatched_at,
+        "cumulative_care_events": creature.cumulative_care_events,
+        "cumulative_talk_interactions": creature.cumulative_talk_interactions,
+        "last_reflection_at": creature.last_reflection_at,
+    }
+
+
+class CreatureStore:
+    """Authoritative copy of the creature, persisted write-behind.
+
+    Readers call :meth:`get`; writers build a new ``Creature`` and hand it
+    to :meth:`update`, which marks the store dirty.  :meth:`flush` writes
+    the state in a single UPDATE together with any rows that must land in
+    the same transaction, such as lifecycle events, and whatever is waiting
+    in :attr:`writes` and :attr:`history`.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        writes: WriteQueue | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self.writes = writes or WriteQueue(session_factory)
+        self.history = StatHistory()
+        self.events = EventBus()
+        self._creature: Creature | None = None
+        self._row_id: int | None = None
+        self._loaded = False
+        self._dirty = False
+        self.updated_at: float = 0.0
+        self.resting_entered_at: float | None = None
+        # Bumped on every change; starts at the clock so that it keeps
+        # increasing across restarts
+        self.version = int(time.time() * 1000)
+
+    @property
+    def creature(self) -> Creature | None:
+        """The live creature, or None if none exists (or not yet loaded)."""
+        return self._creature
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    async def get(self) -> Creature | None:
+        """Return the live creature, loading it on first use."""
+        if not self._loaded:
+            await self.load()
+        return self._creature
+
+    async def load(self) -> None:
+        """(Re)load the creature from the database, discarding memory."""
+        async with self._session_factory() as session:
+            result = await session.execute(select(CreatureStateRow).limit(1))
+            row = result.scalar_one_or_none()
+        self.adopt(row)
+
+    def adopt(self, row: CreatureStateRow | None) -> None:
+        """Take *row*, freshly written by the caller, as the live state."""
+        self._loaded = True
+        self._dirty = False
+        self.resting_entered_at = None
+        self.version += 1
+        if row is None:
+            self._creature = None
+            self._row_id = None
+            self.updated_at = 0.0
+        else:
+            self._creature = _row_to_creature(row)
+            self._row_id = row.id
+            self.updated_at = row.updated_at
+            self.resting_entered_at = row.resting_entered_at
+        self.events.reset(self._creature, time.time())
+
+    def clear(self) -> None:
+        """Forget the creature after it was deleted from the database."""
+        self.adopt(None)
+
+    def update(self, creature: Creature, *, now: float) -> None:
+        """Replace the live creature and schedule it for writing."""
+        self._creature = creature
+        self.updated_at = now
+        self._dirty = True
+        self.version += 1
+        # Exhaustion pauses a rest rather than ending it: the creature goes
+        # back to RESTING when the budget resets and must still wake on time
+        if creature.lifecycle_stage != LifecycleStage.RESTING and not (
+            creature.lifecycle_stage == LifecycleStage.EXHAUSTED
+            and creature.pre_exhausted_stage == LifecycleStage.RESTING
+        ):
+            self.resting_entered_at = None
+        self.events.creature_changed(creature, now)
+
+    async def flush(self, *rows: Any) -> None:
+        """Write dirty state, plus *rows* and queued rows, in one transaction."""
+        async with self.writes.lock:
+            self.writes.add(*rows)
+            if not (self._dirty or self.writes.pending or self.history.pending):
+                return
+            values = None
+            if self._dirty and self._creature is not None:
+                values = _creature_to_values(self._creature)
+                values["resting_entered_at"] = self.resting_entered_at
+                values["updated_at"] = self.updated_at
+            self._dirty = False
+            queued = self.writes.take()
+            samples = self.history.take()
+            try:
+                async with self._session_factory() as session:
+                    if values is not None:
+                        await session.execute(
+                            update(CreatureStateRow)
+                            .where(CreatureStateRow.id == self._row_id)
+                            .values(**values)
+                        )
+                    await self.writes.write(session, queued)
+                    await self.history.write(session, samples, time.time())
+                    await session.commit()
+            except Exception:
+                self._dirty = self._dirty or values is not None
+                self.writes.requeue(queued)
+                self.history.requeue(samples)
+                raise
+            self.events.rows_committed(queued)
+
+    async def run_flusher(self, interval: float) -> None:
+        """Flush dirty state every *interval* seconds, forever."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("State flush error")
+
@@ -3,179 +3,396 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import operator
 import time
-
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, time as dt_time, timedelta
+from typing import Any
 
 from drakeling.daemon.config import DrakelingConfig
-from drakeling.domain.decay import apply_tick_decay
-from drakeling.domain.lifecycle import evaluate_transitions
-from drakeling.domain.models import (
-    Creature,
-    LifecycleStage,
-    MoodState,
-    PersonalityProfile,
-)
+from drakeling.daemon.history import StatHistory
+from drakeling.daemon.profiler import TickProfiler
+from drakeling.daemon.state import CreatureStore
+from drakeling.domain.decay import apply_decay_span
+from drakeling.domain.forecast import ticks_until_change
+from drakeling.domain.lifecycle import advance_ticks
+from drakeling.domain.models import Creature, CreatureEvent, LifecycleStage
 from drakeling.llm.prompts import build_reflection_prompt
 from drakeling.llm.wrapper import LLMWrapper
-from drakeling.storage.models import (
-    CreatureMemoryRow,
-    CreatureStateRow,
-    LifecycleEventRow,
-)
+from drakeling.storage.models import CreatureMemoryRow, LifecycleEventRow
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long the loop sleeps when nothing is forecast to change
+MAX_IDLE_TICKS = 60
 
-def _row_to_creature(row: CreatureStateRow) -> Creature:
-    return Creature(
-        name=row.name,
-        colour=row.colour,
-        personality=PersonalityProfile(
-            seed=row.personality_seed,
-            trait_curiosity=row.trait_curiosity,
-            trait_sociability=row.trait_sociability,
-            trait_confidence=row.trait_confidence,
-            trait_emotional_sensitivity=row.trait_emotional_sensitivity,
-            trait_autonomy_preference=row.trait_autonomy_preference,
-            trait_loneliness_rate=row.trait_loneliness_rate,
-        ),
-        mood_state=MoodState(
-            mood=row.mood,
-            energy=row.energy,
-            trust=row.trust,
-            trust_floor=row.trust_floor,
-            loneliness=row.loneliness,
-            state_curiosity=row.state_curiosity,
-            stability=row.stability,
-        ),
-        lifecycle_stage=LifecycleStage(row.lifecycle_stage),
-        pre_exhausted_stage=(
-            LifecycleStage(row.pre_exhausted_stage)
-            if row.pre_exhausted_stage
-            else None
-        ),
-        pre_resting_stage=(
-            LifecycleStage(row.pre_resting_stage)
-            if row.pre_resting_stage
-            else None
-        ),
-        born_at=row.born_at,
-        hatched_at=row.hatched_at,
-        public_key_hex=row.public_key_hex,
-        cumulative_care_events=row.cumulative_care_events,
-        cumulative_talk_interactions=row.cumulative_talk_interactions,
-        last_reflection_at=row.last_reflection_at,
-    )
+# A resting creature only reflects once it is this lonely
+RESTING_REFLECTION_LONELINESS = 0.8
 
 
-def _apply_mood_to_row(row: CreatureStateRow, ms: MoodState) -> None:
-    row.mood = ms.mood
-    row.energy = ms.energy
-    row.trust = ms.trust
-    row.trust_floor = ms.trust_floor
-    row.loneliness = ms.loneliness
-    row.state_curiosity = ms.state_curiosity
-    row.stability = ms.stability
-
-
-async def _get_resting_entered_at(session: AsyncSession) -> float | None:
-    """Find the timestamp of the most recent entered_resting event."""
-    from sqlalchemy import desc
-    result = await session.execute(
-        select(LifecycleEventRow.created_at)
-        .where(LifecycleEventRow.event_type == "entered_resting")
-        .order_by(desc(LifecycleEventRow.created_at))
-        .limit(1)
+def _event_row(event: CreatureEvent) -> LifecycleEventRow:
+    return LifecycleEventRow(
+        created_at=event.created_at,
+        event_type=event.event_type,
+        from_stage=event.from_stage.value if event.from_stage else None,
+        to_stage=event.to_stage.value if event.to_stage else None,
+        notes=event.notes,
     )
-    val = result.scalar_one_or_none()
-    return val
 
 
-async def _do_tick(
-    session_factory: async_sessionmaker[AsyncSession],
-    config: DrakelingConfig,
-    llm: LLMWrapper,
-) -> None:
-    now = time.time()
+def _next_midnight(now: float) -> float:
+    tomorrow = datetime.fromtimestamp(now).date() + timedelta(days=1)
+    return datetime.combine(tomorrow, dt_time.min).timestamp()
 
-    async with session_factory() as session:
-        result = await session.execute(select(CreatureStateRow).limit(1))
-        row = result.scalar_one_or_none()
-        if row is None:
-            return
 
-        creature = _row_to_creature(row)
-        stage = creature.lifecycle_stage
+@dataclass
+class TickStats:
+    """Timing counters for the background loop, in seconds.
+
+    *lag* is how late a pass started relative to its deadline; a pass
+    *overruns* when it is still running at the deadline of the next one,
+    and every whole tick of lag counts as a *missed* tick.
+    """
+
+    passes: int = 0
+    overruns: int = 0
+    missed_ticks: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+
+    def record_pass(self, duration: float, *, overran: bool) -> None:
+        self.passes += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+        if overran:
+            self.overruns += 1
+
+    def record_lag(self, lag: float, tick_seconds: float) -> None:
+        lag = max(0.0, lag)
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self.missed_ticks += int(lag // tick_seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["mean_duration"] = (
+            self.total_duration / self.passes if self.passes else 0.0
+        )
+        return data
+
+
+class TickScheduler:
+    """Decides when the background loop next needs to run.
 
-        # Check for budget reset (midnight) -> restore from exhausted
-        if stage == LifecycleStage.EXHAUSTED and not llm.budget_exhausted:
-            prev_stage = creature.pre_exhausted_stage
-            if prev_stage:
-                row.lifecycle_stage = prev_stage.value
-                row.pre_exhausted_stage = None
-                session.add(LifecycleEventRow(
-                    created_at=now,
-                    event_type="budget_restored",
-                    from_stage=LifecycleStage.EXHAUSTED.value,
-                    to_stage=prev_stage.value,
-                ))
-                creature.lifecycle_stage = prev_stage
-                stage = prev_stage
-                if config.dev_mode:
-                    logger.info("[dev] Budget restored — exiting exhausted stage")
-
-        # Skip decay for egg stage (creature hasn't hatched yet)
-        if stage != LifecycleStage.EGG:
-            new_mood = apply_tick_decay(
-                creature.mood_state, stage, creature.personality
+    Ticks land on a fixed grid ``tick_seconds`` apart.  Instead of waking on
+    every grid point, the loop sleeps until the first tick on which
+    something observable can change (a lifecycle transition, a
+    needs-attention threshold, a due reflection or the midnight budget
+    reset), or until an API mutation calls :meth:`wake`.  Decay for the
+    skipped ticks is applied in closed form when they are next settled,
+    and reads use :meth:`project` to see it in the meantime.
+    """
+
+    def __init__(self, config: DrakelingConfig) -> None:
+        self._config = config
+        self._wakeup = asyncio.Event()
+        self.last_tick_at: float | None = None
+        self.stats = TickStats()
+        self.profiler = TickProfiler()
+        self._reflection: asyncio.Task[None] | None = None
+
+    def wake(self) -> None:
+        """Interrupt the current sleep so the schedule is recomputed."""
+        self._wakeup.set()
+
+    def reset(self) -> None:
+        """Forget the tick grid, e.g. after the creature was replaced."""
+        self.last_tick_at = None
+        self.wake()
+
+    async def sleep_until(self, deadline: float) -> bool:
+        """Sleep until the monotonic *deadline* or until :meth:`wake`.
+
+        Returns True if woken early.  A timed wake-up records how late it
+        came in :attr:`stats`.
+        """
+        timeout = max(0.0, deadline - time.monotonic())
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            woken = True
+        except TimeoutError:
+            woken = False
+            self.stats.record_lag(
+                time.monotonic() - deadline, self._config.tick_seconds,
             )
-            _apply_mood_to_row(row, new_mood)
-            creature.mood_state = new_mood
+        self._wakeup.clear()
+        return woken
+
+    @property
+    def reflecting(self) -> bool:
+        """True while a background reflection is waiting on the LLM."""
+        return self._reflection is not None and not self._reflection.done()
+
+    def start_reflection(
+        self, store: CreatureStore, llm: LLMWrapper, now: float,
+    ) -> asyncio.Task[None]:
+        """Run a reflection for the live creature in its own task."""
+        self._reflection = asyncio.create_task(_reflect(store, llm, self, now))
+        return self._reflection
 
-        # Evaluate lifecycle transitions
-        resting_at = await _get_resting_entered_at(session) if stage == LifecycleStage.RESTING else None
-        event = evaluate_transitions(creature, now, resting_entered_at=resting_at)
+    def cancel_reflection(self) -> None:
+        if self._reflection is not None:
+            self._reflection.cancel()
+            self._reflection = None
 
-        if event is not None:
-            row.lifecycle_stage = event.to_stage.value if event.to_stage else row.lifecycle_stage
+    def owed_ticks(self, now: float) -> int:
+        """Ticks due by *now* that have not been applied yet."""
+        if self.last_tick_at is None:
+            return 0
+        return max(0, int((now - self.last_tick_at) // self._config.tick_seconds))
 
-            if event.event_type == "egg_to_hatched":
-                row.hatched_at = now
+    def take_ticks(self, now: float, fallback: float) -> int:
+        """Return the number of ticks owed at *now* and mark them applied.
 
+        *fallback* seeds the grid when it is unknown (right after startup),
+        normally the row's ``updated_at``, so downtime is caught up.
+        """
+        if self.last_tick_at is None:
+            self.last_tick_at = fallback
+        n_ticks = self.owed_ticks(now)
+        self.last_tick_at += n_ticks * self._config.tick_seconds
+        return n_ticks
+
+    def project(self, creature: Creature, now: float) -> Creature:
+        """Return *creature* with decay for owed ticks applied, read-only.
+
+        The loop always wakes on the tick a transition fires, so owed ticks
+        never cross a stage change and decay alone is exact.
+        """
+        n_ticks = self.owed_ticks(now)
+        if n_ticks == 0 or creature.lifecycle_stage == LifecycleStage.EGG:
+            return creature
+        return replace(
+            creature,
+            mood_state=apply_decay_span(
+                creature.mood_state,
+                creature.lifecycle_stage,
+                creature.personality,
+                n_ticks,
+            ),
+        )
+
+    def settle(self, store: CreatureStore, now: float) -> list[LifecycleEventRow]:
+        """Apply owed ticks to the live creature in *store*.
+
+        Called by the loop and ahead of every API mutation, so boosts land
+        on up-to-date stats: loneliness reset by care, for example, must not
+        be followed by growth that happened before it.  Returns lifecycle
+        event rows for the caller to flush with the state.
+        """
+        creature = store.creature
+        if creature is None:
+            return []
+        n_ticks = self.take_ticks(now, store.updated_at)
+        if n_ticks == 0:
+            return []
+
+        tick = self._config.tick_seconds
+        spans: list[tuple[Creature, int]] = []
+        creature, events = advance_ticks(
+            creature, n_ticks, self.last_tick_at, tick,
+            resting_entered_at=store.resting_entered_at,
+            spans=spans,
+        )
+        store.history.record_spans(
+            spans, self.last_tick_at - (n_ticks - 1) * tick, tick,
+        )
+        store.update(creature, now=now)
+
+        if self._config.dev_mode and n_ticks > 1:
+            logger.info("[dev] Caught up %d ticks", n_ticks)
+
+        for event in events:
             if event.event_type == "entered_resting":
-                row.pre_resting_stage = event.from_stage.value if event.from_stage else None
+                store.resting_entered_at = event.created_at
+            if self._config.dev_mode:
+                logger.info("[dev] Lifecycle: %s", event.event_type)
+        return [_event_row(event) for event in events]
 
-            if event.event_type == "exited_resting":
-                row.pre_resting_stage = None
+    def pending_history(self, store: CreatureStore, now: float) -> StatHistory:
+        """``store.history`` plus samples for the ticks owed at *now*.
 
-            session.add(LifecycleEventRow(
+        Read-only counterpart of :meth:`settle` for serving history: owed
+        ticks are sampled into a copy and neither the store nor the tick
+        grid changes.
+        """
+        creature = store.creature
+        n_ticks = self.owed_ticks(now)
+        if creature is None or n_ticks == 0:
+            return store.history
+        tick = self._config.tick_seconds
+        last = self.last_tick_at + n_ticks * tick
+        spans: list[tuple[Creature, int]] = []
+        advance_ticks(
+            creature, n_ticks, last, tick,
+            resting_entered_at=store.resting_entered_at,
+            spans=spans,
+        )
+        history = store.history.copy()
+        history.record_spans(spans, self.last_tick_at + tick, tick)
+        return history
+
+    def next_delay(
+        self,
+        creature: Creature,
+        now: float,
+        *,
+        resting_entered_at: float | None = None,
+    ) -> float:
+        """Seconds from *now* until the loop next needs to run."""
+        tick = self._config.tick_seconds
+        anchor = self.last_tick_at if self.last_tick_at is not None else now
+        stage = creature.lifecycle_stage
+        # _should_reflect's resting trigger is a crossing like any other
+        extra = []
+        if not self._config.dev_mode and stage == LifecycleStage.RESTING:
+            extra.append(
+                ("loneliness", RESTING_REFLECTION_LONELINESS, operator.gt)
+            )
+        n_ticks = ticks_until_change(
+            creature, anchor, tick,
+            resting_entered_at=resting_entered_at,
+            max_ticks=MAX_IDLE_TICKS,
+            extra_thresholds=extra,
+        )
+        deadline = anchor + n_ticks * tick
+
+        if not self._config.dev_mode and stage not in (
+            LifecycleStage.EXHAUSTED, LifecycleStage.EGG,
+        ):
+            reflect_at = (
+                (creature.last_reflection_at or 0.0)
+                + self._config.min_reflection_interval
+            )
+            if reflect_at > now:
+                owed = -(-(reflect_at - anchor) // tick)
+                deadline = min(deadline, anchor + owed * tick)
+
+        if stage == LifecycleStage.EXHAUSTED:
+            deadline = min(deadline, _next_midnight(now))
+
+        return max(0.0, deadline - now)
+
+
+async def _do_tick(
+    store: CreatureStore,
+    config: DrakelingConfig,
+    llm: LLMWrapper,
+    scheduler: TickScheduler,
+) -> float:
+    """Run one pass of the background loop.
+
+    Applies every tick owed since the previous pass to the in-memory
+    creature and returns the number of seconds until the next pass is
+    needed.  Stat changes are left to the store's write-behind; lifecycle
+    events are flushed straight away.  A due reflection is started as a
+    separate task so a slow LLM never holds up the pass.
+    """
+    now = time.time()
+    profiler = scheduler.profiler
+    profiler.begin_pass()
+
+    with profiler.phase("load"):
+        creature = await store.get()
+    if creature is None:
+        scheduler.last_tick_at = None
+        return MAX_IDLE_TICKS * config.tick_seconds
+
+    # Decay (skipped for eggs) and lifecycle transitions for every
+    # owed tick, chaining transitions that fire part-way through.  This
+    # comes before the budget restore so ticks owed while exhausted decay
+    # at exhausted rates, and so the first pass after startup still
+    # catches up from the row's updated_at.
+    with profiler.phase("settle"):
+        rows: list[Any] = scheduler.settle(store, now)
+    creature = store.creature
+
+    # Check for budget reset (midnight) -> restore from exhausted
+    if creature.lifecycle_stage == LifecycleStage.EXHAUSTED and not llm.budget_exhausted:
+        prev_stage = creature.pre_exhausted_stage
+        if prev_stage:
+            rows.append(LifecycleEventRow(
                 created_at=now,
-                event_type=event.event_type,
-                from_stage=event.from_stage.value if event.from_stage else None,
-                to_stage=event.to_stage.value if event.to_stage else None,
-                notes=event.notes,
+                event_type="budget_restored",
+                from_stage=LifecycleStage.EXHAUSTED.value,
+                to_stage=prev_stage.value,
             ))
-
+            store.update(
+                replace(creature, lifecycle_stage=prev_stage, pre_exhausted_stage=None),
+                now=now,
+            )
+            creature = store.creature
             if config.dev_mode:
-                logger.info("[dev] Lifecycle: %s", event.event_type)
+                logger.info("[dev] Budget restored — exiting exhausted stage")
 
-        # Background reflection
-        if not config.dev_mode and _should_reflect(creature, config, llm, now):
-            messages = build_reflection_prompt(creature)
-            response = await llm.call(messages)
-            if response:
-                session.add(CreatureMemoryRow(
-                    created_at=now,
-                    memory_type="reflection",
-                    content=response,
-                    lifecycle_stage=row.lifecycle_stage,
-                ))
-                row.last_reflection_at = now
+    if rows:
+        with profiler.phase("flush"):
+            await store.flush(*rows)
 
-        row.updated_at = now
-        await session.commit()
+    # Background reflection
+    if (
+        not config.dev_mode
+        and not scheduler.reflecting
+        and _should_reflect(creature, config, llm, now)
+    ):
+        scheduler.start_reflection(store, llm, now)
+
+    creature = store.creature
+    if creature is None:
+        return MAX_IDLE_TICKS * config.tick_seconds
+    with profiler.phase("forecast"):
+        return scheduler.next_delay(
+            creature, now, resting_entered_at=store.resting_entered_at,
+        )
+
+
+async def _reflect(
+    store: CreatureStore,
+    llm: LLMWrapper,
+    scheduler: TickScheduler,
+    now: float,
+) -> None:
+    """Ask the LLM for a reflection and store it as a memory."""
+    creature = store.creature
+    if creature is None:
+        return
+    profiler = scheduler.profiler
+    try:
+        with profiler.phase("reflection_llm", in_pass=False):
+            response = await llm.call(build_reflection_prompt(creature))
+        # The creature may have been released or replaced meanwhile
+        if not response or store.creature is None or (
+            store.creature.public_key_hex != creature.public_key_hex
+        ):
+            return
+        done_at = time.time()
+        store.update(
+            replace(store.creature, last_reflection_at=now), now=done_at,
+        )
+        with profiler.phase("reflection_flush", in_pass=False):
+            await store.flush(CreatureMemoryRow(
+                created_at=now,
+                memory_type="reflection",
+                content=response,
+                lifecycle_stage=store.creature.lifecycle_stage.value,
+            ))
+        scheduler.wake()
+    except Exception:
+        logger.exception("Reflection error")
 
 
 def _should_reflect(
@@ -187,7 +404,10 @@ def _should_reflect(
     stage = creature.lifecycle_stage
     if stage in (LifecycleStage.EXHAUSTED, LifecycleStage.EGG):
         return False
-    if stage == LifecycleStage.RESTING and creature.mood_state.loneliness <= 0.8:
+    if (
+        stage == LifecycleStage.RESTING
+        and creature.mood_state.loneliness <= RESTING_REFLECTION_LONELINESS
+    ):
         return False
     last = creature.last_reflection_at or 0.0
     if now - last < config.min_reflection_interval:
@@ -198,14 +418,41 @@ def _should_reflect(
 
 
 async def start_tick_loop(
-    session_factory: async_sessionmaker[AsyncSession],
+    store: CreatureStore,
     config: DrakelingConfig,
     llm: LLMWrapper,
+    scheduler: TickScheduler,
 ) -> None:
-    """Run the background tick loop forever."""
-    while True:
-        try:
-            await _do_tick(session_factory, config, llm)
-        except Exception:
-            logger.exception("Tick loop error")
-        await asyncio.sleep(config.tick_seconds)
+    """Run the background tick loop forever.
+
+    Deadlines are fixed on the monotonic clock from the start of each
+    pass, so time spent in the pass shortens the following sleep instead
+    of pushing the schedule back.
+    """
+    try:
+        while True:
+            started = time.monotonic()
+            delay: float = config.tick_seconds
+            try:
+                delay = await _do_tick(store, config, llm, scheduler)
+            except Exception:
+                logger.exception("Tick loop error")
+            deadline = started + delay
+            finished = time.monotonic()
+            overran = finished > deadline
+            scheduler.stats.record_pass(finished - started, overran=overran)
+            if config.dev_mode:
+                if overran:
+                    logger.info(
+                        "[dev] Tick overran its deadline by %.1fs",
+                        finished - deadline,
+                    )
+                logger.info(
+                    "[dev] Tick phases: %s", scheduler.profiler.format_last_pass(),
+                )
+                logger.info(
+                    "[dev] Next tick in %.0fs", max(0.0, deadline - finished),
+                )
+            await scheduler.sleep_until(deadline)
+    finally:
+        scheduler.cancel_reflection()
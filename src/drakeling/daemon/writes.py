@@ -0,0 +1,138 @@
+"""Batched writes for history rows (interaction log, memories, events).
+
+Endpoints hand finished ORM rows to a :class:`WriteQueue` instead of
+committing them one by one.  Queued rows are grouped by table and written
+with a single ``executemany`` INSERT per table, on a short interval or as
+soon as the queue reaches its size threshold, so a burst of care or talk
+calls costs one commit rather than one each.
+
+``CreatureStore.flush`` drains the queue into its own transaction, and
+anything that reads history back calls :meth:`WriteQueue.flush` first, so
+readers never miss a row that was accepted.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any
+
+from sqlalchemy import Table, insert, inspect
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+WRITE_BATCH_ROWS = 100
+
+
+def _row_values(row: Any) -> tuple[Table, dict[str, Any]]:
+    """The table and column values of an unsaved ORM row."""
+    mapper = inspect(row).mapper
+    values = {
+        attr.key: getattr(row, attr.key)
+        for attr in mapper.column_attrs
+    }
+    # Leave autoincrement keys to SQLite
+    for column in mapper.primary_key:
+        if values.get(column.key) is None:
+            values.pop(column.key, None)
+    return mapper.local_table, values
+
+
+class WriteQueue:
+    """Coalesces history rows and writes them in batches.
+
+    All writes that include queued rows hold :attr:`lock`, so rows reach
+    each table in the order they were queued.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        max_rows: int = WRITE_BATCH_ROWS,
+    ) -> None:
+        self._session_factory = session_factory
+        self.max_rows = max_rows
+        self._pending: list[Any] = []
+        self._full = asyncio.Event()
+        self.lock = asyncio.Lock()
+        self.batches = 0
+        self.rows_written = 0
+        self.largest_batch = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def add(self, *rows: Any) -> None:
+        """Queue *rows* for the next batch."""
+        self._pending.extend(rows)
+        if len(self._pending) >= self.max_rows:
+            self._full.set()
+
+    def take(self) -> list[Any]:
+        """Remove and return every queued row."""
+        rows, self._pending = self._pending, []
+        self._full.clear()
+        return rows
+
+    def requeue(self, rows: list[Any]) -> None:
+        """Put back rows whose write failed, ahead of newer ones."""
+        self._pending[:0] = rows
+
+    def discard(self) -> int:
+        """Drop every queued row; returns how many were dropped."""
+        return len(self.take())
+
+    async def write(self, session: AsyncSession, rows: list[Any]) -> None:
+        """INSERT *rows* in *session*, one ``executemany`` per table.
+
+        The caller commits; statistics are updated here, assuming it will.
+        """
+        if not rows:
+            return
+        by_table: dict[Table, list[dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            table, values = _row_values(row)
+            by_table[table].append(values)
+        for table, values in by_table.items():
+            await session.execute(insert(table), values)
+        self.batches += 1
+        self.rows_written += len(rows)
+        self.largest_batch = max(self.largest_batch, len(rows))
+
+    async def flush(self) -> int:
+        """Write every queued row now; returns the number written."""
+        async with self.lock:
+            rows = self.take()
+            if not rows:
+                return 0
+            try:
+                async with self._session_factory() as session:
+                    await self.write(session, rows)
+                    await session.commit()
+            except Exception:
+                self.requeue(rows)
+                raise
+            return len(rows)
+
+    async def run(self, interval: float) -> None:
+        """Flush every *interval* seconds, or sooner when the queue fills."""
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Write queue flush error")
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "pending": self.pending,
+            "batches": self.batches,
+            "rows_written": self.rows_written,
+            "largest_batch": self.largest_batch,
+        }
@@ -0,0 +1,63 @@
+"""Needs-attention evaluation per Spec Section 14.5.
+
+Pure function: takes creature state and current time, returns a reason and
+urgency, or ``(None, None)`` when the creature is content.
+"""
+from __future__ import annotations
+
+import operator
+import time as _time
+from typing import Callable
+
+from drakeling.domain.lifecycle import EGG_TO_HATCHED_TIME
+from drakeling.domain.models import Creature, LifecycleStage
+
+LONELY_THRESHOLD = 0.7
+LONELY_HIGH_THRESHOLD = 0.9
+LOW_MOOD_THRESHOLD = 0.2
+LOW_MOOD_HIGH_THRESHOLD = 0.1
+LOW_ENERGY_THRESHOLD = 0.2
+LOW_ENERGY_MEDIUM_THRESHOLD = 0.1
+
+# "Within one tick" is configurable, approximate with 60s
+HATCHING_SOON_WINDOW = 60
+
+# Every (stat, threshold, comparison) whose crossing can change the result
+ATTENTION_THRESHOLDS: tuple[tuple[str, float, Callable[[float, float], bool]], ...] = (
+    ("loneliness", LONELY_THRESHOLD, operator.ge),
+    ("loneliness", LONELY_HIGH_THRESHOLD, operator.ge),
+    ("mood", LOW_MOOD_THRESHOLD, operator.le),
+    ("mood", LOW_MOOD_HIGH_THRESHOLD, operator.le),
+    ("energy", LOW_ENERGY_THRESHOLD, operator.le),
+    ("energy", LOW_ENERGY_MEDIUM_THRESHOLD, operator.le),
+)
+
+
+def evaluate_attention(
+    creature: Creature,
+    now: float | None = None,
+) -> tuple[str | None, str | None]:
+    """Return ``(reason, urgency)`` for the creature's most pressing need.
+
+    Priority order: lonely -> low_mood -> low_energy -> hatching_soon.
+    """
+    if now is None:
+        now = _time.time()
+
+    ms = creature.mood_state
+
+    if ms.loneliness >= LONELY_THRESHOLD:
+        urgency = "high" if ms.loneliness >= LONELY_HIGH_THRESHOLD else "medium"
+        return "lonely", urgency
+    if ms.mood <= LOW_MOOD_THRESHOLD:
+        urgency = "high" if ms.mood <= LOW_MOOD_HIGH_THRESHOLD else "medium"
+        return "low_mood", urgency
+    if ms.energy <= LOW_ENERGY_THRESHOLD:
+        urgency = "medium" if ms.energy <= LOW_ENERGY_MEDIUM_THRESHOLD else "low"
+        return "low_energy", urgency
+    if creature.lifecycle_stage == LifecycleStage.EGG:
+        remaining = EGG_TO_HATCHED_TIME - (now - creature.born_at)
+        if remaining <= HATCHING_SOON_WINDOW and creature.cumulative_care_events >= 1:
+            return "hatching_soon", "low"
+
+    return None, None
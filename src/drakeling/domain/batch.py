@@ -0,0 +1,142 @@
+"""Vectorised stat decay and boost functions over many creatures.
+
+Struct-of-arrays counterpart of ``drakeling.domain.decay``: one NumPy array
+per ``MoodState`` field, one element per creature.  Every function performs
+the same float64 operations in the same order as its scalar twin, so results
+are bit-identical to calling the scalar function once per creature.
+
+Requires NumPy (``pip install drakeling[batch]``).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, fields, replace
+from typing import Iterable
+
+import numpy as np
+
+from drakeling.domain.models import LifecycleStage, MoodState
+
+
+def _clamp(value: np.ndarray, lo: float = 0.0, hi: float = 1.0) -> np.ndarray:
+    # Same order as the scalar max(lo, min(hi, value))
+    return np.maximum(lo, np.minimum(hi, value))
+
+
+@dataclass(frozen=True)
+class MoodStateBatch:
+    """``MoodState`` for *n* creatures, one float64 array per stat."""
+
+    mood: np.ndarray
+    energy: np.ndarray
+    trust: np.ndarray
+    trust_floor: np.ndarray
+    loneliness: np.ndarray
+    state_curiosity: np.ndarray
+    stability: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.mood)
+
+    @classmethod
+    def from_states(cls, states: Iterable[MoodState]) -> MoodStateBatch:
+        states = list(states)
+        return cls(**{
+            f.name: np.fromiter(
+                (getattr(s, f.name) for s in states),
+                dtype=np.float64,
+                count=len(states),
+            )
+            for f in fields(cls)
+        })
+
+    def to_states(self) -> list[MoodState]:
+        names = [f.name for f in fields(self)]
+        columns = [getattr(self, name).tolist() for name in names]
+        return [MoodState(**dict(zip(names, row))) for row in zip(*columns)]
+
+
+def resting_mask(stages: Iterable[LifecycleStage]) -> np.ndarray:
+    """Boolean array, True where the stage is RESTING."""
+    return np.array(
+        [stage == LifecycleStage.RESTING for stage in stages], dtype=bool
+    )
+
+
+def apply_tick_decay(
+    state: MoodStateBatch,
+    resting: np.ndarray,
+    loneliness_rate: np.ndarray,
+) -> MoodStateBatch:
+    """Apply one tick's worth of stat decay/growth to every creature.
+
+    *resting* is a boolean array (see :func:`resting_mask`) and
+    *loneliness_rate* holds each creature's ``trait_loneliness_rate``.
+    """
+    mood = _clamp(state.mood - 0.005)
+    energy = _clamp(state.energy + np.where(resting, 0.006, -0.003))
+
+    trust = _clamp(state.trust - 0.001)
+    trust_floor = state.trust_floor
+    trust = np.where(trust < trust_floor, trust_floor, trust)
+
+    loneliness_delta = 0.008 * (0.5 + loneliness_rate)
+    loneliness = _clamp(state.loneliness + loneliness_delta)
+
+    state_curiosity = _clamp(state.state_curiosity - 0.004)
+    stability = _clamp(state.stability + np.where(resting, 0.01, -0.002))
+
+    return replace(
+        state,
+        mood=mood,
+        energy=energy,
+        trust=trust,
+        trust_floor=trust_floor,
+        loneliness=loneliness,
+        state_curiosity=state_curiosity,
+        stability=stability,
+    )
+
+
+def apply_care_boost(state: MoodStateBatch) -> MoodStateBatch:
+    """Apply stat effects of a care event to every creature."""
+    return replace(
+        state,
+        mood=_clamp(state.mood + 0.05),
+        loneliness=np.zeros_like(state.loneliness),
+    )
+
+
+def apply_feed_boost(state: MoodStateBatch) -> MoodStateBatch:
+    """Apply stat effects of a feed event to every creature."""
+    return replace(
+        state,
+        energy=_clamp(state.energy + 0.08),
+        mood=_clamp(state.mood + 0.03),
+        loneliness=np.zeros_like(state.loneliness),
+    )
+
+
+def apply_talk_boost(
+    state: MoodStateBatch,
+    curiosity: np.ndarray,
+) -> MoodStateBatch:
+    """Apply stat effects of a talk interaction to every creature.
+
+    *curiosity* holds each creature's ``trait_curiosity``.
+    """
+    trust = _clamp(state.trust + 0.02)
+    trust_floor = np.where(
+        trust > 0.8, _clamp(state.trust_floor + 0.01), state.trust_floor
+    )
+
+    curiosity_delta = 0.03 * (1.0 + curiosity)
+    state_curiosity = _clamp(state.state_curiosity + curiosity_delta)
+
+    return replace(
+        state,
+        mood=_clamp(state.mood + 0.05),
+        trust=trust,
+        trust_floor=trust_floor,
+        loneliness=np.zeros_like(state.loneliness),
+        state_curiosity=state_curiosity,
+    )
@@ -52,6 +52,56 @@ def apply_tick_decay(
     )
 
 
+def apply_decay_span(
+    state: MoodState,
+    stage: LifecycleStage,
+    traits: PersonalityProfile,
+    n_ticks: int,
+) -> MoodState:
+    """Apply *n_ticks* ticks of decay/growth in constant time.
+
+    Equal, up to float rounding, to calling ``apply_tick_decay`` *n_ticks*
+    times with a fixed stage.  Every per-tick rate is constant and each
+    stat moves in one direction only, so the per-tick clamp collapses into
+    a single clamp of the linear result.  Trust stops at ``trust_floor``
+    once it reaches it.  The caller is responsible for splitting a span at
+    stage changes.
+    """
+    if n_ticks <= 0:
+        return state
+
+    is_resting = stage == LifecycleStage.RESTING
+
+    mood = _clamp(state.mood - 0.005 * n_ticks)
+    energy = _clamp(
+        state.energy + (0.006 if is_resting else -0.003) * n_ticks
+    )
+
+    trust = _clamp(state.trust - 0.001 * n_ticks)
+    trust_floor = state.trust_floor
+    if trust < trust_floor:
+        trust = trust_floor
+
+    loneliness_delta = 0.008 * (0.5 + traits.trait_loneliness_rate)
+    loneliness = _clamp(state.loneliness + loneliness_delta * n_ticks)
+
+    state_curiosity = _clamp(state.state_curiosity - 0.004 * n_ticks)
+    stability = _clamp(
+        state.stability + (0.01 if is_resting else -0.002) * n_ticks
+    )
+
+    return replace(
+        state,
+        mood=mood,
+        energy=energy,
+        trust=trust,
+        trust_floor=trust_floor,
+        loneliness=loneliness,
+        state_curiosity=state_curiosity,
+        stability=stability,
+    )
+
+
 def apply_care_boost(state: MoodState) -> MoodState:
     """Apply stat effects of a care event."""
     return replace(
@@ -0,0 +1,92 @@
+"""Forecast when a creature's observable state next changes.
+
+Pure functions.  Decay rates are constant within a stage, so every stat
+moves monotonically between transitions and the tick on which a lifecycle
+transition fires or a needs-attention threshold is crossed can be found by
+bisection instead of stepping through each tick.
+"""
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Callable, Sequence
+
+from drakeling.domain.attention import ATTENTION_THRESHOLDS, evaluate_attention
+from drakeling.domain.decay import apply_decay_span
+from drakeling.domain.lifecycle import evaluate_transitions
+from drakeling.domain.models import Creature, LifecycleStage
+
+
+def _first_tick(predicate: Callable[[int], bool], max_ticks: int) -> int | None:
+    """Smallest k in [1, max_ticks] for which a monotone *predicate* holds."""
+    if max_ticks < 1 or not predicate(max_ticks):
+        return None
+    lo, hi = 1, max_ticks
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if predicate(mid):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def ticks_until_change(
+    creature: Creature,
+    now: float,
+    tick_seconds: float,
+    *,
+    resting_entered_at: float | None = None,
+    max_ticks: int,
+    extra_thresholds: Sequence[
+        tuple[str, float, Callable[[float, float], bool]]
+    ] = (),
+) -> int:
+    """Return how many ticks from *now* until something observable changes.
+
+    A change is a lifecycle transition firing or a stat crossing one of the
+    needs-attention thresholds, or one of *extra_thresholds* (same shape as
+    ``ATTENTION_THRESHOLDS``).  Ticks are assumed to land every
+    *tick_seconds* after *now*.  Returns *max_ticks* when nothing changes
+    within that horizon.
+    """
+    stage = creature.lifecycle_stage
+
+    def after(k: int) -> Creature:
+        if stage == LifecycleStage.EGG:
+            return creature
+        return replace(
+            creature,
+            mood_state=apply_decay_span(
+                creature.mood_state, stage, creature.personality, k
+            ),
+        )
+
+    def transition_fires(k: int) -> bool:
+        event = evaluate_transitions(
+            after(k), now + k * tick_seconds,
+            resting_entered_at=resting_entered_at,
+        )
+        return event is not None
+
+    predicates: list[Callable[[int], bool]] = [transition_fires]
+
+    if stage == LifecycleStage.EGG:
+        # Stats are frozen in the egg, only the hatching window moves
+        current = evaluate_attention(creature, now)
+        predicates.append(
+            lambda k: evaluate_attention(creature, now + k * tick_seconds) != current
+        )
+    else:
+        for stat, threshold, compare in (*ATTENTION_THRESHOLDS, *extra_thresholds):
+            side = compare(getattr(creature.mood_state, stat), threshold)
+            predicates.append(
+                lambda k, stat=stat, threshold=threshold, compare=compare, side=side:
+                compare(getattr(after(k).mood_state, stat), threshold) != side
+            )
+
+    best = max_ticks
+    for predicate in predicates:
+        k = _first_tick(predicate, best)
+        if k is not None:
+            best = k
+    return best
@@ -1,11 +1,14 @@
 """Lifecycle transition evaluation per Spec Section 8.1.
 
-Pure function: takes creature state and current time, returns an event or None.
+Pure functions: take creature state and current time, return events.
 """
 from __future__ import annotations
 
 import time as _time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Sequence
 
+from drakeling.domain.decay import apply_decay_span
 from drakeling.domain.models import Creature, CreatureEvent, LifecycleStage
 
 # Thresholds (seconds)
@@ -22,6 +25,98 @@ ENERGY_RESTING_THRESHOLD = 0.15
 ENERGY_WAKE_THRESHOLD = 0.5
 RESTING_MAX_DURATION = 3_600       # 1 hour
 
+# Slack for energy comparisons.  Decay steps such as 0.003 are not exact in
+# binary, so the per-tick loop and the closed-form span can land a rounding
+# error either side of a threshold; both must fire on the same tick.
+ENERGY_EPSILON = 1e-9
+
+
+# Each condition takes (creature, now, resting_entered_at).  Thresholds are
+# read from the module constants at call time so they can be tuned.
+Condition = Callable[[Creature, float, float | None], bool]
+
+
+def _egg_ready(creature: Creature, now: float, _: float | None) -> bool:
+    return (
+        now - creature.born_at >= EGG_TO_HATCHED_TIME
+        and creature.cumulative_care_events >= EGG_TO_HATCHED_CARE
+    )
+
+
+def _hatched_ready(creature: Creature, now: float, _: float | None) -> bool:
+    return (
+        creature.hatched_at is not None
+        and now - creature.hatched_at >= HATCHED_TO_JUVENILE_TIME
+        and creature.cumulative_care_events >= HATCHED_TO_JUVENILE_CARE
+    )
+
+
+def _juvenile_ready(creature: Creature, now: float, _: float | None) -> bool:
+    return (
+        creature.hatched_at is not None
+        and now - creature.hatched_at >= JUVENILE_TO_MATURE_TIME
+        and creature.cumulative_care_events >= JUVENILE_TO_MATURE_CARE
+        and creature.cumulative_talk_interactions >= JUVENILE_TO_MATURE_TALK
+    )
+
+
+def _energy_low(creature: Creature, now: float, _: float | None) -> bool:
+    energy = creature.mood_state.energy
+    return energy < ENERGY_RESTING_THRESHOLD - ENERGY_EPSILON
+
+
+def _rested(
+    creature: Creature, now: float, resting_entered_at: float | None,
+) -> bool:
+    if creature.pre_resting_stage is None:
+        return False
+    if creature.mood_state.energy >= ENERGY_WAKE_THRESHOLD - ENERGY_EPSILON:
+        return True
+    return (
+        resting_entered_at is not None
+        and now - resting_entered_at >= RESTING_MAX_DURATION
+    )
+
+
+@dataclass(frozen=True)
+class Transition:
+    """One row of the transition table.
+
+    A *to_stage* of None sends the creature back to its
+    ``pre_resting_stage``.
+    """
+
+    event_type: str
+    from_stage: LifecycleStage
+    to_stage: LifecycleStage | None
+    condition: Condition
+    notes: str | None = None
+
+
+# Per stage, candidate transitions in priority order
+TRANSITIONS: dict[LifecycleStage, tuple[Transition, ...]] = {
+    LifecycleStage.EGG: (
+        Transition("egg_to_hatched", LifecycleStage.EGG,
+                   LifecycleStage.HATCHED, _egg_ready),
+    ),
+    LifecycleStage.HATCHED: (
+        Transition("hatched_to_juvenile", LifecycleStage.HATCHED,
+                   LifecycleStage.JUVENILE, _hatched_ready),
+    ),
+    LifecycleStage.JUVENILE: (
+        Transition("juvenile_to_mature", LifecycleStage.JUVENILE,
+                   LifecycleStage.MATURE, _juvenile_ready),
+    ),
+    LifecycleStage.MATURE: (
+        Transition("entered_resting", LifecycleStage.MATURE,
+                   LifecycleStage.RESTING, _energy_low,
+                   notes="Energy fell below threshold"),
+    ),
+    LifecycleStage.RESTING: (
+        Transition("exited_resting", LifecycleStage.RESTING, None, _rested),
+    ),
+}
+
 
 def evaluate_transitions(
     creature: Creature,
@@ -37,82 +132,164 @@ def evaluate_transitions(
     if now is None:
         now = _time.time()
 
-    stage = creature.lifecycle_stage
-
-    # egg -> hatched
-    if stage == LifecycleStage.EGG:
-        elapsed = now - creature.born_at
-        if (
-            elapsed >= EGG_TO_HATCHED_TIME
-            and creature.cumulative_care_events >= EGG_TO_HATCHED_CARE
-        ):
-            return CreatureEvent(
-                event_type="egg_to_hatched",
-                from_stage=LifecycleStage.EGG,
-                to_stage=LifecycleStage.HATCHED,
-                created_at=now,
-            )
-        return None
-
-    # hatched -> juvenile
-    if stage == LifecycleStage.HATCHED:
-        if creature.hatched_at is not None:
-            elapsed = now - creature.hatched_at
-            if (
-                elapsed >= HATCHED_TO_JUVENILE_TIME
-                and creature.cumulative_care_events >= HATCHED_TO_JUVENILE_CARE
-            ):
-                return CreatureEvent(
-                    event_type="hatched_to_juvenile",
-                    from_stage=LifecycleStage.HATCHED,
-                    to_stage=LifecycleStage.JUVENILE,
-                    created_at=now,
-                )
-        return None
-
-    # juvenile -> mature
-    if stage == LifecycleStage.JUVENILE:
-        if creature.hatched_at is not None:
-            elapsed = now - creature.hatched_at
-            if (
-                elapsed >= JUVENILE_TO_MATURE_TIME
-                and creature.cumulative_care_events >= JUVENILE_TO_MATURE_CARE
-                and creature.cumulative_talk_interactions >= JUVENILE_TO_MATURE_TALK
-            ):
-                return CreatureEvent(
-                    event_type="juvenile_to_mature",
-                    from_stage=LifecycleStage.JUVENILE,
-                    to_stage=LifecycleStage.MATURE,
-                    created_at=now,
-                )
-        return None
-
-    # mature -> resting (auto, on low energy)
-    if stage == LifecycleStage.MATURE:
-        if creature.mood_state.energy < ENERGY_RESTING_THRESHOLD:
+    for transition in TRANSITIONS.get(creature.lifecycle_stage, ()):
+        if transition.condition(creature, now, resting_entered_at):
             return CreatureEvent(
-                event_type="entered_resting",
-                from_stage=LifecycleStage.MATURE,
-                to_stage=LifecycleStage.RESTING,
+                event_type=transition.event_type,
+                from_stage=transition.from_stage,
+                to_stage=transition.to_stage or creature.pre_resting_stage,
                 created_at=now,
-                notes="Energy fell below threshold",
+                notes=transition.notes,
             )
-        return None
-
-    # resting -> pre_resting_stage (wake)
-    if stage == LifecycleStage.RESTING:
-        wake = False
-        if creature.mood_state.energy >= ENERGY_WAKE_THRESHOLD:
-            wake = True
-        elif resting_entered_at is not None:
-            if now - resting_entered_at >= RESTING_MAX_DURATION:
-                wake = True
-        if wake and creature.pre_resting_stage is not None:
-            return CreatureEvent(
-                event_type="exited_resting",
-                from_stage=LifecycleStage.RESTING,
-                to_stage=creature.pre_resting_stage,
-                created_at=now,
+    return None
+
+
+def _broadcast(values: Sequence[Any], n: int, name: str) -> Sequence[Any]:
+    if len(values) == n:
+        return values
+    if len(values) == 1:
+        return [values[0]] * n
+    raise ValueError(f"{name} has {len(values)} entries, expected 1 or {n}")
+
+
+def evaluate_transitions_batch(
+    creatures: Sequence[Creature],
+    now: float | Sequence[float],
+    *,
+    resting_entered_at: float | None | Sequence[float | None] = None,
+    chain: bool = True,
+) -> list[tuple[Creature, list[CreatureEvent]]]:
+    """Evaluate transitions for many creatures, or many timestamps, at once.
+
+    *creatures*, *now* and *resting_entered_at* are matched element-wise;
+    a single value (or a one-element sequence) is broadcast, so one
+    creature can be checked at many simulated times.  With *chain*,
+    transitions keep firing at the same timestamp until none applies.
+
+    Returns, per element, the creature with every fired event applied and
+    the events in order.  Without *chain* each list holds at most the one
+    event ``evaluate_transitions`` would return.
+    """
+    nows = [now] if isinstance(now, (int, float)) else list(now)
+    restings = (
+        [resting_entered_at]
+        if resting_entered_at is None or isinstance(resting_entered_at, (int, float))
+        else list(resting_entered_at)
+    )
+    n = max(len(creatures), len(nows), len(restings))
+    creatures = _broadcast(creatures, n, "creatures")
+    nows = _broadcast(nows, n, "now")
+    restings = _broadcast(restings, n, "resting_entered_at")
+
+    # Every chain step leaves the stage, so a chain can't be longer than
+    # the number of stages without cycling
+    max_steps = len(LifecycleStage) if chain else 1
+    results: list[tuple[Creature, list[CreatureEvent]]] = []
+    for creature, at, resting_at in zip(creatures, nows, restings):
+        events: list[CreatureEvent] = []
+        for _ in range(max_steps):
+            event = evaluate_transitions(
+                creature, at, resting_entered_at=resting_at,
             )
+            if event is None:
+                break
+            creature = _apply_event(creature, event)
+            if event.event_type == "entered_resting":
+                resting_at = event.created_at
+            events.append(event)
+        results.append((creature, events))
+    return results
 
-    return None
+
+def _apply_event(creature: Creature, event: CreatureEvent) -> Creature:
+    """Return *creature* with the stage bookkeeping for *event* applied."""
+    changes: dict[str, object] = {}
+    if event.to_stage is not None:
+        changes["lifecycle_stage"] = event.to_stage
+    if event.event_type == "egg_to_hatched":
+        changes["hatched_at"] = event.created_at
+    elif event.event_type == "entered_resting":
+        changes["pre_resting_stage"] = event.from_stage
+    elif event.event_type == "exited_resting":
+        changes["pre_resting_stage"] = None
+    return replace(creature, **changes)
+
+
+def _probe(
+    creature: Creature,
+    n_ticks: int,
+    at: float,
+    resting_entered_at: float | None,
+) -> tuple[Creature, CreatureEvent | None]:
+    """Decay *creature* by *n_ticks* and evaluate transitions at *at*."""
+    stage = creature.lifecycle_stage
+    if stage != LifecycleStage.EGG:
+        creature = replace(
+            creature,
+            mood_state=apply_decay_span(
+                creature.mood_state, stage, creature.personality, n_ticks
+            ),
+        )
+    event = evaluate_transitions(
+        creature, at, resting_entered_at=resting_entered_at
+    )
+    return creature, event
+
+
+def advance_ticks(
+    creature: Creature,
+    n_ticks: int,
+    now: float,
+    tick_seconds: float,
+    *,
+    resting_entered_at: float | None = None,
+    spans: list[tuple[Creature, int]] | None = None,
+) -> tuple[Creature, list[CreatureEvent]]:
+    """Advance a creature through *n_ticks* ticks, the last one at *now*.
+
+    Matches running the tick loop *n_ticks* times ``tick_seconds`` apart
+    (decay, skipped for eggs, followed by one transition check per tick):
+    stats agree up to float rounding and, because energy thresholds are
+    compared with ``ENERGY_EPSILON`` slack, transitions fire on the same
+    tick.  Decay between transitions is computed in
+    closed form and the tick on which each transition fires is found by
+    bisection, so a long span costs O(log n) per transition.
+
+    Returns the advanced creature and the events in the order they fired.
+    If *spans* is given, a ``(creature, ticks)`` pair is appended to it
+    for each run of ticks decayed within one stage, in order, with the
+    creature as it was at the start of the run.
+    """
+    events: list[CreatureEvent] = []
+    remaining = n_ticks
+    while remaining > 0:
+        # Transition conditions are monotone in elapsed ticks within a
+        # stage, so if nothing fires at the end of the span nothing fires
+        # before it either.
+        advanced, event = _probe(creature, remaining, now, resting_entered_at)
+        if event is None:
+            if spans is not None:
+                spans.append((creature, remaining))
+            return advanced, events
+
+        lo, hi = 1, remaining
+        while lo < hi:
+            mid = (lo + hi) // 2
+            at = now - (remaining - mid) * tick_seconds
+            if _probe(creature, mid, at, resting_entered_at)[1] is None:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo < remaining:
+            at = now - (remaining - lo) * tick_seconds
+            advanced, event = _probe(creature, lo, at, resting_entered_at)
+        if spans is not None:
+            spans.append((creature, lo))
+        creature = _apply_event(advanced, event)
+        if event.event_type == "entered_resting":
+            resting_entered_at = event.created_at
+        events.append(event)
+        remaining -= lo
+
+    return creature, events
@@ -5,9 +5,10 @@ daily budget enforcement, and graceful degradation.
 """
 from __future__ import annotations
 
+import json
 import logging
 from datetime import date
-from typing import Any, Literal
+from typing import Any, AsyncIterator, Literal
 
 import httpx
 
@@ -50,10 +51,8 @@ class LLMWrapper:
             return True
         return False
 
-    async def call(
-        self, messages: list[dict[str, str]], max_tokens: int | None = None
-    ) -> str | None:
-        """Make an LLM completion call. Returns None if budget exhausted or error."""
+    async def _reserve(self, max_tokens: int | None) -> int | None:
+        """Return the token cap for one call, or None if over budget."""
         was_reset = self._maybe_reset_budget()
 
         cap = min(
@@ -65,6 +64,39 @@ class LLMWrapper:
             if self._budget_exhausted_callback and not was_reset:
                 await self._budget_exhausted_callback()
             return None
+        return cap
+
+    def _charge(self, usage: dict[str, Any] | None, cap: int) -> None:
+        """Count a call's tokens against today's budget (*cap* if unknown)."""
+        tokens = (usage or {}).get("total_tokens", cap)
+        self._tokens_used_today += tokens
+
+        if self._config.dev_mode:
+            logger.info(
+                "[dev] LLM tokens: %d this call, %d/%d today",
+                tokens, self._tokens_used_today, self._config.max_tokens_per_day,
+            )
+
+    def _log_http_error(self, exc: httpx.HTTPStatusError) -> None:
+        if exc.response.status_code == 405:
+            logger.error(
+                "OpenClaw gateway returned 405 — the chat completions "
+                "endpoint is likely disabled. Enable it in "
+                "~/.openclaw/openclaw.json: "
+                "gateway.http.endpoints.chatCompletions.enabled = true"
+            )
+        else:
+            logger.exception(
+                "LLM call failed (HTTP %d)", exc.response.status_code
+            )
+
+    async def call(
+        self, messages: list[dict[str, str]], max_tokens: int | None = None
+    ) -> str | None:
+        """Make an LLM completion call. Returns None if budget exhausted or error."""
+        cap = await self._reserve(max_tokens)
+        if cap is None:
+            return None
 
         try:
             url, headers, body = self._build_request(messages, cap)
@@ -72,37 +104,65 @@ class LLMWrapper:
             resp.raise_for_status()
             data = resp.json()
         except httpx.HTTPStatusError as exc:
-            if exc.response.status_code == 405:
-                logger.error(
-                    "OpenClaw gateway returned 405 — the chat completions "
-                    "endpoint is likely disabled. Enable it in "
-                    "~/.openclaw/openclaw.json: "
-                    "gateway.http.endpoints.chatCompletions.enabled = true"
-                )
-            else:
-                logger.exception(
-                    "LLM call failed (HTTP %d)", exc.response.status_code
-                )
+            self._log_http_error(exc)
             return None
         except Exception:
             logger.exception("LLM call failed")
             return None
 
-        usage = data.get("usage", {})
-        tokens = usage.get("total_tokens", cap)
-        self._tokens_used_today += tokens
-
-        if self._config.dev_mode:
-            logger.info(
-                "[dev] LLM tokens: %d this call, %d/%d today",
-                tokens, self._tokens_used_today, self._config.max_tokens_per_day,
-            )
+        self._charge(data.get("usage"), cap)
 
         choices = data.get("choices", [])
         if not choices:
             return None
         return choices[0].get("message", {}).get("content", "")
 
+    async def stream(
+        self, messages: list[dict[str, str]], max_tokens: int | None = None
+    ) -> AsyncIterator[str]:
+        """Make a streaming completion call, yielding content as it arrives.
+
+        Yields nothing if the budget is exhausted; stops early on error.
+        Once the provider answers, tokens are charged from the usage it
+        sends in its final chunk, or as the full cap if it sends none.
+        """
+        cap = await self._reserve(max_tokens)
+        if cap is None:
+            return
+
+        url, headers, body = self._build_request(messages, cap)
+        body["stream"] = True
+        body["stream_options"] = {"include_usage": True}
+        usage: dict[str, Any] | None = None
+        answered = False
+        try:
+            async with self._client.stream(
+                "POST", url, headers=headers, json=body,
+            ) as resp:
+                resp.raise_for_status()
+                answered = True
+                async for line in resp.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    payload = line[5:].strip()
+                    if payload == "[DONE]":
+                        break
+                    chunk = json.loads(payload)
+                    if chunk.get("usage"):
+                        usage = chunk["usage"]
+                    for choice in chunk.get("choices") or []:
+                        content = (choice.get("delta") or {}).get("content")
+                        if content:
+                            yield content
+        except httpx.HTTPStatusError as exc:
+            self._log_http_error(exc)
+        except Exception:
+            logger.exception("LLM stream failed")
+        finally:
+            # Also when the caller stops early: the tokens were generated
+            if answered:
+                self._charge(usage, cap)
+
     def _build_request(
         self, messages: list[dict[str, str]], max_tokens: int
     ) -> tuple[str, dict[str, str], dict[str, Any]]:
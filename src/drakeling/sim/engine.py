@@ -0,0 +1,219 @@
+"""Offline long-horizon simulation over the domain layer.
+
+No database, no LLM, no wall clock: a creature is born at t=0 and advanced
+tick by tick with ``advance_ticks``, which applies decay in closed form and
+bisects for transitions, so simulated months cost milliseconds.  Care,
+feed and talk land between ticks, exactly as the API applies them.
+"""
+from __future__ import annotations
+
+import heapq
+import random
+from dataclasses import dataclass, field, replace
+
+from drakeling.domain.decay import (
+    apply_care_boost,
+    apply_feed_boost,
+    apply_talk_boost,
+)
+from drakeling.domain.lifecycle import advance_ticks
+from drakeling.domain.models import (
+    Creature,
+    CreatureEvent,
+    DragonColour,
+    LifecycleStage,
+    MoodState,
+)
+from drakeling.domain.traits import generate_traits
+
+INTERACTION_KINDS = ("care", "feed", "talk")
+
+
+@dataclass(frozen=True, order=True)
+class Interaction:
+    """A care, feed or talk applied just after tick *tick*."""
+
+    tick: int
+    kind: str
+
+
+@dataclass(frozen=True)
+class Sample:
+    tick: int
+    stage: LifecycleStage
+    mood_state: MoodState
+
+
+@dataclass
+class SimResult:
+    ticks: int
+    tick_seconds: float
+    creature: Creature
+    samples: list[Sample] = field(default_factory=list)
+    events: list[CreatureEvent] = field(default_factory=list)
+    interactions_applied: dict[str, int] = field(default_factory=dict)
+
+    def stage_durations(self) -> dict[str, float]:
+        """Total seconds spent in each stage over the run."""
+        end = self.ticks * self.tick_seconds
+        durations: dict[str, float] = {}
+        stage, since = LifecycleStage.EGG, 0.0
+        for event in self.events:
+            if event.to_stage is None:
+                continue
+            durations[stage.value] = durations.get(stage.value, 0.0) + (
+                event.created_at - since
+            )
+            stage, since = event.to_stage, event.created_at
+        durations[stage.value] = durations.get(stage.value, 0.0) + (end - since)
+        return durations
+
+    def first_reached(self) -> dict[str, float]:
+        """Seconds from birth until each stage was first entered."""
+        reached = {LifecycleStage.EGG.value: 0.0}
+        for event in self.events:
+            if event.to_stage is not None:
+                reached.setdefault(event.to_stage.value, event.created_at)
+        return reached
+
+
+def new_creature(colour: DragonColour, seed_hex: str) -> Creature:
+    """A freshly born egg at t=0 with the same starting stats as /birth."""
+    return Creature(
+        name="Sim",
+        colour=colour,
+        personality=generate_traits(colour, seed_hex),
+        mood_state=MoodState(
+            mood=0.5, energy=0.5, trust=0.5, trust_floor=0.0,
+            loneliness=0.0, state_curiosity=0.5, stability=0.5,
+        ),
+        lifecycle_stage=LifecycleStage.EGG,
+        pre_exhausted_stage=None,
+        pre_resting_stage=None,
+        born_at=0.0,
+        hatched_at=None,
+        public_key_hex="",
+        cumulative_care_events=0,
+        cumulative_talk_interactions=0,
+        last_reflection_at=None,
+    )
+
+
+def scripted_schedule(
+    total_ticks: int,
+    tick_seconds: float,
+    every: dict[str, float],
+) -> list[Interaction]:
+    """Interactions at fixed intervals, *every* maps kind -> seconds.
+
+    A kind with an interval of 0 is never scheduled.
+    """
+    schedule: list[Interaction] = []
+    for kind, interval in every.items():
+        if interval <= 0:
+            continue
+        step = max(1, round(interval / tick_seconds))
+        schedule.extend(
+            Interaction(tick, kind) for tick in range(step, total_ticks + 1, step)
+        )
+    schedule.sort()
+    return schedule
+
+
+def stochastic_schedule(
+    total_ticks: int,
+    tick_seconds: float,
+    per_day: dict[str, float],
+    rng: random.Random,
+) -> list[Interaction]:
+    """Poisson-distributed interactions, *per_day* maps kind -> mean rate."""
+    schedule: list[Interaction] = []
+    end = total_ticks * tick_seconds
+    for kind, rate in per_day.items():
+        if rate <= 0:
+            continue
+        mean_gap = 86_400 / rate
+        t = rng.expovariate(1.0 / mean_gap)
+        while t < end:
+            schedule.append(Interaction(max(1, int(t // tick_seconds)), kind))
+            t += rng.expovariate(1.0 / mean_gap)
+    schedule.sort()
+    return schedule
+
+
+def _interact(creature: Creature, kind: str) -> Creature | None:
+    """Apply an interaction as the API would, or None if it is refused."""
+    stage = creature.lifecycle_stage
+    if kind == "talk":
+        if stage == LifecycleStage.EGG:
+            return None
+        return replace(
+            creature,
+            mood_state=apply_talk_boost(creature.mood_state, creature.personality),
+            cumulative_talk_interactions=creature.cumulative_talk_interactions + 1,
+        )
+    boost = apply_feed_boost if kind == "feed" else apply_care_boost
+    return replace(
+        creature,
+        mood_state=boost(creature.mood_state),
+        cumulative_care_events=creature.cumulative_care_events + 1,
+    )
+
+
+def simulate(
+    creature: Creature,
+    schedule: list[Interaction],
+    total_ticks: int,
+    tick_seconds: float,
+    *,
+    sample_every: int = 0,
+) -> SimResult:
+    """Run *creature* for *total_ticks* ticks, applying *schedule*.
+
+    A state sample is taken every *sample_every* ticks (0 disables).
+    """
+    result = SimResult(
+        ticks=total_ticks,
+        tick_seconds=tick_seconds,
+        creature=creature,
+        interactions_applied={kind: 0 for kind in INTERACTION_KINDS},
+    )
+
+    # Merge sample points and interactions into one ordered stream;
+    # samples sort before interactions on the same tick
+    stops: list[tuple[int, int, str]] = [(i.tick, 1, i.kind) for i in schedule]
+    if sample_every > 0:
+        stops.extend(
+            (tick, 0, "") for tick in range(0, total_ticks + 1, sample_every)
+        )
+    stops.append((total_ticks, 2, ""))
+    heapq.heapify(stops)
+
+    tick = 0
+    resting_entered_at: float | None = None
+    while stops:
+        at_tick, order, kind = heapq.heappop(stops)
+        if at_tick > total_ticks:
+            break
+        if at_tick > tick:
+            creature, events = advance_ticks(
+                creature, at_tick - tick, at_tick * tick_seconds, tick_seconds,
+                resting_entered_at=resting_entered_at,
+            )
+            for event in events:
+                if event.event_type == "entered_resting":
+                    resting_entered_at = event.created_at
+            result.events.extend(events)
+            tick = at_tick
+        if order == 0:
+            result.samples.append(
+                Sample(tick, creature.lifecycle_stage, creature.mood_state)
+            )
+        elif order == 1:
+            after = _interact(creature, kind)
+            if after is not None:
+                creature = after
+                result.interactions_applied[kind] += 1
+
+    result.creature = creature
+    return result
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import time
+from pathlib import Path
+
+from drakeling.domain import lifecycle
+from drakeling.domain.models import DragonColour
+from drakeling.sim.engine import (
+    SimResult,
+    new_creature,
+    scripted_schedule,
+    simulate,
+    stochastic_schedule,
+)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="drakeling-sim",
+        description="Simulate a creature over weeks or months, offline",
+    )
+    parser.add_argument("--days", type=float, default=30.0,
+                        help="Simulated duration in days (default 30)")
+    parser.add_argument("--tick-seconds", type=int, default=60,
+                        help="Tick interval in seconds (default 60)")
+    parser.add_argument("--colour", choices=[c.value for c in DragonColour],
+                        default=DragonColour.RED.value)
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed for traits and the stochastic schedule")
+    parser.add_argument("--schedule", choices=["scripted", "stochastic"],
+                        default="scripted")
+    parser.add_argument("--care-every", type=float, default=240.0,
+                        help="Scripted: minutes between care (0 = never)")
+    parser.add_argument("--feed-every", type=float, default=480.0,
+                        help="Scripted: minutes between feeds (0 = never)")
+    parser.add_argument("--talk-every", type=float, default=360.0,
+                        help="Scripted: minutes between talks (0 = never)")
+    parser.add_argument("--care-per-day", type=float, default=6.0,
+                        help="Stochastic: mean care events per day")
+    parser.add_argument("--feed-per-day", type=float, default=3.0,
+                        help="Stochastic: mean feeds per day")
+    parser.add_argument("--talk-per-day", type=float, default=4.0,
+                        help="Stochastic: mean talks per day")
+    parser.add_argument("--sample-every", type=float, default=60.0,
+                        help="Minutes between time-series samples (default 60)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Write the time series as CSV to this path")
+    parser.add_argument(
+        "--set", action="append", default=[], metavar="NAME=VALUE",
+        help="Override a lifecycle threshold, e.g. JUVENILE_TO_MATURE_TIME=43200",
+    )
+    return parser.parse_args(argv)
+
+
+def _apply_overrides(pairs: list[str]) -> dict[str, float]:
+    """Set lifecycle threshold constants for this process."""
+    applied: dict[str, float] = {}
+    for pair in pairs:
+        name, sep, raw = pair.partition("=")
+        name = name.strip()
+        if not sep or not name.isupper() or not hasattr(lifecycle, name):
+            raise SystemExit(f"Unknown lifecycle threshold: {pair}")
+        current = getattr(lifecycle, name)
+        value = type(current)(float(raw))
+        setattr(lifecycle, name, value)
+        applied[name] = value
+    return applied
+
+
+def write_time_series(result: SimResult, path: Path) -> None:
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "tick", "hours", "stage", "mood", "energy", "trust",
+            "loneliness", "state_curiosity", "stability",
+        ])
+        for sample in result.samples:
+            ms = sample.mood_state
+            writer.writerow([
+                sample.tick,
+                f"{sample.tick * result.tick_seconds / 3600:.2f}",
+                sample.stage.value,
+                *(f"{v:.4f}" for v in (
+                    ms.mood, ms.energy, ms.trust, ms.loneliness,
+                    ms.state_curiosity, ms.stability,
+                )),
+            ])
+
+
+def _fmt_hours(seconds: float) -> str:
+    return f"{seconds / 3600:10.2f}h"
+
+
+def print_summary(result: SimResult, elapsed: float) -> None:
+    total = result.ticks * result.tick_seconds
+    rate = result.ticks / elapsed if elapsed > 0 else float("inf")
+    print(
+        f"Simulated {total / 86_400:.1f} days ({result.ticks:,} ticks) "
+        f"in {elapsed:.3f}s — {rate:,.0f} ticks/s"
+    )
+    applied = ", ".join(f"{k}={v}" for k, v in result.interactions_applied.items())
+    print(f"Interactions applied: {applied}")
+    print(f"Final stage: {result.creature.lifecycle_stage.value}")
+    print("")
+    print(f"{'stage':<10} {'first reached':>14} {'total time':>12} {'share':>7}")
+    reached = result.first_reached()
+    for stage, seconds in result.stage_durations().items():
+        print(
+            f"{stage:<10} {_fmt_hours(reached[stage]):>14} "
+            f"{_fmt_hours(seconds):>12} {seconds / total:>6.1%}"
+        )
+    transitions: dict[str, int] = {}
+    for event in result.events:
+        transitions[event.event_type] = transitions.get(event.event_type, 0) + 1
+    if transitions:
+        print("")
+        for event_type, count in transitions.items():
+            print(f"{event_type:<22} x{count}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    overrides = _apply_overrides(args.set)
+
+    tick = args.tick_seconds
+    total_ticks = int(args.days * 86_400 // tick)
+    rng = random.Random(args.seed)
+    seed_hex = rng.randbytes(32).hex()
+    creature = new_creature(DragonColour(args.colour), seed_hex)
+
+    if args.schedule == "scripted":
+        schedule = scripted_schedule(total_ticks, tick, {
+            "care": args.care_every * 60,
+            "feed": args.feed_every * 60,
+            "talk": args.talk_every * 60,
+        })
+    else:
+        schedule = stochastic_schedule(total_ticks, tick, {
+            "care": args.care_per_day,
+            "feed": args.feed_per_day,
+            "talk": args.talk_per_day,
+        }, rng)
+
+    sample_every = max(0, round(args.sample_every * 60 / tick))
+    started = time.perf_counter()
+    result = simulate(
+        creature, schedule, total_ticks, tick, sample_every=sample_every,
+    )
+    elapsed = time.perf_counter() - started
+
+    if overrides:
+        print("Overrides: " + ", ".join(f"{k}={v:g}" for k, v in overrides.items()))
+    print_summary(result, elapsed)
+    if args.output is not None:
+        write_time_series(result, args.output)
+        print(f"\nTime series: {args.output} ({len(result.samples)} samples)")
+
+
+if __name__ == "__main__":
+    main()
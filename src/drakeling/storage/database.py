@@ -1,23 +1,177 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 DB_FILENAME = "drakeling.db"
 
 _MIGRATIONS_DIR = str(Path(__file__).parent / "migrations")
 
+# Newest migration revision; bump together with each new migration
+# (tests check it against the scripts)
+SCHEMA_HEAD = "0006"
 
-def get_engine(data_dir: Path):
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+_AUTO_VACUUM = {"NONE": 0, "FULL": 1, "INCREMENTAL": 2}
+
+
+@dataclass(frozen=True)
+class SQLitePragmas:
+    """Connection pragmas applied to every new SQLite connection.
+
+    *cache_size* follows SQLite's convention: negative values are KiB,
+    positive values are pages.  *busy_timeout* is in milliseconds.
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 64 * 1024 * 1024
+    cache_size: int = -16_000
+    temp_store: str = "MEMORY"
+    busy_timeout: int = 5_000
+    auto_vacuum: str = "INCREMENTAL"
+
+    def __post_init__(self) -> None:
+        for name, allowed in (
+            ("journal_mode", _JOURNAL_MODES),
+            ("synchronous", _SYNCHRONOUS),
+            ("temp_store", _TEMP_STORES),
+            ("auto_vacuum", set(_AUTO_VACUUM)),
+        ):
+            value = getattr(self, name).upper()
+            if value not in allowed:
+                raise ValueError(
+                    f"Invalid SQLite {name}: {value}. Must be one of: "
+                    + ", ".join(sorted(allowed))
+                )
+            object.__setattr__(self, name, value)
+
+    def statements(self) -> list[str]:
+        # busy_timeout first so switching journal mode can wait for a lock.
+        # auto_vacuum only takes effect on a database with no tables yet
+        # (see ensure_auto_vacuum for existing files), and get_engine only
+        # issues it on an empty file, since setting it takes the write lock.
+        return [
+            f"PRAGMA busy_timeout={int(self.busy_timeout)}",
+            f"PRAGMA auto_vacuum={self.auto_vacuum}",
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA mmap_size={int(self.mmap_size)}",
+            f"PRAGMA cache_size={int(self.cache_size)}",
+            f"PRAGMA temp_store={self.temp_store}",
+        ]
+
+
+SQLITE_PROFILES: dict[str, SQLitePragmas] = {
+    # WAL with relaxed fsync: durable across crashes of the daemon, may
+    # lose the last commits on power loss
+    "balanced": SQLitePragmas(),
+    # WAL, fsync on every commit
+    "durable": SQLitePragmas(synchronous="FULL"),
+    # SQLite's own defaults
+    "legacy": SQLitePragmas(
+        journal_mode="DELETE",
+        synchronous="FULL",
+        mmap_size=0,
+        cache_size=-2_000,
+        temp_store="DEFAULT",
+        busy_timeout=0,
+        auto_vacuum="NONE",
+    ),
+}
+DEFAULT_SQLITE_PROFILE = "balanced"
+
+
+def get_engine(data_dir: Path, pragmas: SQLitePragmas | None = None):
     db_path = data_dir / DB_FILENAME
-    return create_async_engine(f"sqlite+aiosqlite:///{db_path}", echo=False)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", echo=False)
+    statements = (pragmas or SQLITE_PROFILES[DEFAULT_SQLITE_PROFILE]).statements()
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _apply_pragmas(dbapi_connection, _record) -> None:  # type: ignore[no-untyped-def]
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            if statement.startswith("PRAGMA auto_vacuum"):
+                cursor.execute("PRAGMA page_count")
+                if cursor.fetchone()[0] > 0:
+                    continue
+            cursor.execute(statement)
+        cursor.close()
+
+    return engine
+
+
+def get_read_engine(data_dir: Path, pragmas: SQLitePragmas | None = None):
+    """A second engine on the same file that can only read.
+
+    Opened with ``mode=ro`` and ``PRAGMA query_only`` and given its own
+    pool, so reads never queue behind write transactions for a connection.
+    Under WAL they also run concurrently with the writer.  The database
+    must already exist (run migrations on the write engine first).
+    """
+    db_path = data_dir / DB_FILENAME
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///file:{db_path}?mode=ro&uri=true", echo=False,
+    )
+    pragmas = pragmas or SQLITE_PROFILES[DEFAULT_SQLITE_PROFILE]
+    statements = [
+        f"PRAGMA busy_timeout={int(pragmas.busy_timeout)}",
+        f"PRAGMA mmap_size={int(pragmas.mmap_size)}",
+        f"PRAGMA cache_size={int(pragmas.cache_size)}",
+        f"PRAGMA temp_store={pragmas.temp_store}",
+        "PRAGMA query_only=1",
+    ]
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _apply_pragmas(dbapi_connection, _record) -> None:  # type: ignore[no-untyped-def]
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
+
+    return engine
+
+
+async def ensure_auto_vacuum(engine, pragmas: SQLitePragmas | None = None) -> bool:
+    """Convert an existing database to the configured auto_vacuum mode.
+
+    Changing the mode of a database that already has tables needs a full
+    ``VACUUM``, so this is a one-off cost the first time a database from
+    an older version is opened.  Returns True if a conversion ran.
+    """
+    mode = (pragmas or SQLITE_PROFILES[DEFAULT_SQLITE_PROFILE]).auto_vacuum
+    async with engine.connect() as conn:
+        current = (await conn.execute(text("PRAGMA auto_vacuum"))).scalar_one()
+    if current == _AUTO_VACUUM[mode]:
+        return False
+    # VACUUM can't run inside a transaction
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text(f"PRAGMA auto_vacuum={mode}"))
+        await conn.execute(text("VACUUM"))
+    return True
 
 
 def get_session_factory(engine) -> async_sessionmaker[AsyncSession]:
     return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+async def release_database(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """Fold the WAL into the database file and close pooled connections.
+
+    Call before the database file is copied or replaced on disk, so the
+    file alone holds every committed transaction.
+    """
+    async with session_factory() as session:
+        await session.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+    await session_factory.kw["bind"].dispose()
+
+
 def _run_alembic(connection) -> None:  # type: ignore[no-untyped-def]
     from alembic import command
     from alembic.config import Config
@@ -28,7 +182,28 @@ def _run_alembic(connection) -> None:  # type: ignore[no-untyped-def]
     command.upgrade(cfg, "head")
 
 
-async def run_migrations(engine) -> None:
-    """Run Alembic migrations to head."""
+async def schema_revision(engine) -> str | None:
+    """The revision stamped in ``alembic_version``, or None if unstamped."""
+    async with engine.connect() as conn:
+        exists = (await conn.execute(text(
+            "SELECT 1 FROM sqlite_master"
+            " WHERE type = 'table' AND name = 'alembic_version'"
+        ))).first()
+        if exists is None:
+            return None
+        return (await conn.execute(
+            text("SELECT version_num FROM alembic_version")
+        )).scalar_one_or_none()
+
+
+async def run_migrations(engine) -> bool:
+    """Run Alembic migrations to head; returns True if any ran.
+
+    A database already at :data:`SCHEMA_HEAD` is detected with a plain
+    query, so Alembic is only imported when there is work to do.
+    """
+    if await schema_revision(engine) == SCHEMA_HEAD:
+        return False
     async with engine.begin() as conn:
         await conn.run_sync(_run_alembic)
+    return True
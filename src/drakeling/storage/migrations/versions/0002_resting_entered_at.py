@@ -0,0 +1,35 @@
+"""Store when the creature entered resting on the creature row.
+
+Revision ID: 0002
+Revises: 0001
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("creature_state") as batch_op:
+        batch_op.add_column(sa.Column("resting_entered_at", sa.Float, nullable=True))
+
+    # Backfill from the most recent entered_resting event
+    op.execute(
+        "UPDATE creature_state SET resting_entered_at = ("
+        " SELECT MAX(created_at) FROM lifecycle_events"
+        " WHERE event_type = 'entered_resting'"
+        ") WHERE lifecycle_stage = 'resting'"
+        " OR (lifecycle_stage = 'exhausted' AND pre_exhausted_stage = 'resting')"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("creature_state") as batch_op:
+        batch_op.drop_column("resting_entered_at")
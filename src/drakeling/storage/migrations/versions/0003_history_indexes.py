@@ -0,0 +1,39 @@
+"""Composite indexes for history queries filtered by type, ordered by time.
+
+Revision ID: 0003
+Revises: 0002
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_interaction_log_type_created",
+        "interaction_log",
+        ["interaction_type", "created_at"],
+    )
+    op.create_index(
+        "ix_lifecycle_events_type_created",
+        "lifecycle_events",
+        ["event_type", "created_at"],
+    )
+    op.create_index(
+        "ix_creature_memory_type_created",
+        "creature_memory",
+        ["memory_type", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_creature_memory_type_created", "creature_memory")
+    op.drop_index("ix_lifecycle_events_type_created", "lifecycle_events")
+    op.drop_index("ix_interaction_log_type_created", "interaction_log")
@@ -0,0 +1,33 @@
+"""Compressed archive for history rows past the retention window.
+
+Revision ID: 0004
+Revises: 0003
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "history_archive",
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column("archived_at", sa.Float, nullable=False),
+        sa.Column("source_table", sa.String(30), nullable=False),
+        sa.Column("first_created_at", sa.Float, nullable=False),
+        sa.Column("last_created_at", sa.Float, nullable=False),
+        sa.Column("row_count", sa.Integer, nullable=False),
+        sa.Column("payload", sa.LargeBinary, nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("history_archive")
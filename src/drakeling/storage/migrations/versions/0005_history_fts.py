@@ -0,0 +1,62 @@
+"""Full-text index over memories and interactions.
+
+One FTS5 table covers both sources.  The rowid encodes where a document
+came from (``id * 2`` for creature_memory, ``id * 2 + 1`` for
+interaction_log), so triggers can keep it in sync by rowid.
+
+Revision ID: 0005
+Revises: 0004
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, type column, rowid offset)
+_SOURCES = (
+    ("creature_memory", "memory_type", 0),
+    ("interaction_log", "interaction_type", 1),
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE VIRTUAL TABLE history_fts USING fts5("
+        "content, kind UNINDEXED, created_at UNINDEXED,"
+        " tokenize = 'porter unicode61')"
+    )
+    for table, kind, offset in _SOURCES:
+        op.execute(
+            "INSERT INTO history_fts (rowid, content, kind, created_at)"
+            f" SELECT id * 2 + {offset}, content, {kind}, created_at FROM {table}"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_fts_insert AFTER INSERT ON {table} BEGIN"
+            " INSERT INTO history_fts (rowid, content, kind, created_at)"
+            f" VALUES (new.id * 2 + {offset}, new.content, new.{kind},"
+            " new.created_at); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_fts_delete AFTER DELETE ON {table} BEGIN"
+            f" DELETE FROM history_fts WHERE rowid = old.id * 2 + {offset}; END"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_fts_update AFTER UPDATE ON {table} BEGIN"
+            f" DELETE FROM history_fts WHERE rowid = old.id * 2 + {offset};"
+            " INSERT INTO history_fts (rowid, content, kind, created_at)"
+            f" VALUES (new.id * 2 + {offset}, new.content, new.{kind},"
+            " new.created_at); END"
+        )
+
+
+def downgrade() -> None:
+    for table, _, _ in _SOURCES:
+        for action in ("insert", "delete", "update"):
+            op.execute(f"DROP TRIGGER {table}_fts_{action}")
+    op.execute("DROP TABLE history_fts")
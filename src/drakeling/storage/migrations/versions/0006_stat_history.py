@@ -0,0 +1,35 @@
+"""Multi-resolution stat history.
+
+Revision ID: 0006
+Revises: 0005
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stat_history",
+        sa.Column("resolution", sa.Integer, primary_key=True),
+        sa.Column("bucket_start", sa.Float, primary_key=True),
+        sa.Column("mood", sa.Float, nullable=False),
+        sa.Column("energy", sa.Float, nullable=False),
+        sa.Column("trust", sa.Float, nullable=False),
+        sa.Column("loneliness", sa.Float, nullable=False),
+        sa.Column("state_curiosity", sa.Float, nullable=False),
+        sa.Column("stability", sa.Float, nullable=False),
+        sa.Column("samples", sa.Integer, nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("stat_history")
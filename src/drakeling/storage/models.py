@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Float, Integer, String, Text
+from sqlalchemy import Float, Index, Integer, LargeBinary, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -37,6 +37,7 @@ class CreatureStateRow(Base):
     lifecycle_stage: Mapped[str] = mapped_column(String(20), nullable=False)
     pre_exhausted_stage: Mapped[str | None] = mapped_column(String(20), nullable=True)
     pre_resting_stage: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    resting_entered_at: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     # Timestamps
     born_at: Mapped[float] = mapped_column(Float, nullable=False)
@@ -58,6 +59,9 @@ class CreatureStateRow(Base):
 
 class CreatureMemoryRow(Base):
     __tablename__ = "creature_memory"
+    __table_args__ = (
+        Index("ix_creature_memory_type_created", "memory_type", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     created_at: Mapped[float] = mapped_column(Float, nullable=False)
@@ -68,6 +72,9 @@ class CreatureMemoryRow(Base):
 
 class InteractionLogRow(Base):
     __tablename__ = "interaction_log"
+    __table_args__ = (
+        Index("ix_interaction_log_type_created", "interaction_type", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     created_at: Mapped[float] = mapped_column(Float, nullable=False)
@@ -79,6 +86,9 @@ class InteractionLogRow(Base):
 
 class LifecycleEventRow(Base):
     __tablename__ = "lifecycle_events"
+    __table_args__ = (
+        Index("ix_lifecycle_events_type_created", "event_type", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     created_at: Mapped[float] = mapped_column(Float, nullable=False)
@@ -86,3 +96,40 @@ class LifecycleEventRow(Base):
     from_stage: Mapped[str | None] = mapped_column(String(20), nullable=True)
     to_stage: Mapped[str | None] = mapped_column(String(20), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+class HistoryArchiveRow(Base):
+    """A batch of rows moved out of a history table by retention.
+
+    *payload* is zlib-compressed JSON: a list of the archived rows.
+    """
+
+    __tablename__ = "history_archive"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    archived_at: Mapped[float] = mapped_column(Float, nullable=False)
+    source_table: Mapped[str] = mapped_column(String(30), nullable=False)
+    first_created_at: Mapped[float] = mapped_column(Float, nullable=False)
+    last_created_at: Mapped[float] = mapped_column(Float, nullable=False)
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
+class StatHistoryRow(Base):
+    """Averaged stats over one time bucket at one resolution.
+
+    *resolution* is the bucket width in seconds and *samples* the number
+    of tick samples averaged into the row, so buckets can be merged.
+    """
+
+    __tablename__ = "stat_history"
+
+    resolution: Mapped[int] = mapped_column(Integer, primary_key=True)
+    bucket_start: Mapped[float] = mapped_column(Float, primary_key=True)
+    mood: Mapped[float] = mapped_column(Float, nullable=False)
+    energy: Mapped[float] = mapped_column(Float, nullable=False)
+    trust: Mapped[float] = mapped_column(Float, nullable=False)
+    loneliness: Mapped[float] = mapped_column(Float, nullable=False)
+    state_curiosity: Mapped[float] = mapped_column(Float, nullable=False)
+    stability: Mapped[float] = mapped_column(Float, nullable=False)
+    samples: Mapped[int] = mapped_column(Integer, nullable=False)
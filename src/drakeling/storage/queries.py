@@ -0,0 +1,64 @@
+"""Column-projected Core reads for request paths.
+
+Each statement is built once at import time and selects only the columns
+its caller uses, so SQLAlchemy reuses the compiled form from the engine's
+statement cache and rows come back as plain ``Row`` tuples rather than
+full ORM objects.
+"""
+from __future__ import annotations
+
+from sqlalchemy import Row, bindparam, desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from drakeling.storage.models import CreatureStateRow, InteractionLogRow
+
+_RECENT_TALK = (
+    select(InteractionLogRow.source, InteractionLogRow.content)
+    .where(InteractionLogRow.interaction_type == "talk")
+    .order_by(desc(InteractionLogRow.created_at))
+    .limit(bindparam("limit"))
+)
+
+_RECENT_FEED = (
+    select(
+        InteractionLogRow.created_at,
+        InteractionLogRow.source,
+        InteractionLogRow.interaction_type,
+        InteractionLogRow.content,
+        InteractionLogRow.care_type,
+    )
+    # A talk logs both sides with one timestamp; insert order breaks ties
+    .order_by(desc(InteractionLogRow.created_at), desc(InteractionLogRow.id))
+    .limit(bindparam("limit"))
+)
+
+_CREATURE_IDENTITY = select(
+    CreatureStateRow.name,
+    CreatureStateRow.public_key_hex,
+    CreatureStateRow.lifecycle_stage,
+).limit(1)
+
+
+async def recent_talk(session: AsyncSession, limit: int = 10) -> list[Row]:
+    """Last *limit* talk lines, oldest first, as ``(source, content)``."""
+    result = await session.execute(_RECENT_TALK, {"limit": limit})
+    rows = result.all()
+    rows.reverse()
+    return rows
+
+
+async def recent_feed(session: AsyncSession, limit: int = 20) -> list[Row]:
+    """Last *limit* interaction log entries of any kind, oldest first.
+
+    Rows are ``(created_at, source, interaction_type, content, care_type)``.
+    """
+    result = await session.execute(_RECENT_FEED, {"limit": limit})
+    rows = result.all()
+    rows.reverse()
+    return rows
+
+
+async def creature_identity(session: AsyncSession) -> Row | None:
+    """``(name, public_key_hex, lifecycle_stage)`` of the creature, if any."""
+    result = await session.execute(_CREATURE_IDENTITY)
+    return result.first()
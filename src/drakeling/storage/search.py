@@ -0,0 +1,69 @@
+"""Ranked full-text search over memories and interactions (FTS5)."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+_SEARCH_SQL = text(
+    "SELECT rowid, kind, created_at, content,"
+    " snippet(history_fts, 0, '[', ']', '…', 12) AS snippet,"
+    " bm25(history_fts) AS score"
+    " FROM history_fts WHERE history_fts MATCH :match"
+    " ORDER BY score LIMIT :limit OFFSET :offset"
+)
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    source: str  # "memory" or "interaction"
+    id: int
+    kind: str
+    created_at: float
+    content: str
+    snippet: str
+    score: float
+
+
+def match_expression(query: str) -> str | None:
+    """Turn free text into an FTS5 query matching every word.
+
+    Words are quoted, so FTS5 operators in user input are taken literally.
+    Returns None when *query* has no searchable words.
+    """
+    tokens = _TOKEN.findall(query)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"' for token in tokens)
+
+
+async def search_history(
+    session: AsyncSession,
+    query: str,
+    *,
+    limit: int = 20,
+    offset: int = 0,
+) -> list[SearchHit]:
+    """Best-matching documents first (BM25), *limit* from *offset*."""
+    match = match_expression(query)
+    if match is None:
+        return []
+    result = await session.execute(
+        _SEARCH_SQL, {"match": match, "limit": limit, "offset": offset},
+    )
+    return [
+        SearchHit(
+            source="interaction" if row.rowid % 2 else "memory",
+            id=row.rowid // 2,
+            kind=row.kind,
+            created_at=row.created_at,
+            content=row.content,
+            snippet=row.snippet,
+            score=row.score,
+        )
+        for row in result
+    ]
@@ -0,0 +1,78 @@
+"""Consistent online copies of the database with ``VACUUM INTO``.
+
+``VACUUM INTO`` reads the database inside a single read transaction and
+writes a compacted copy, so the snapshot is exactly one committed state,
+includes anything still in the WAL, and never blocks writers.
+"""
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+SNAPSHOT_DIRNAME = "snapshots"
+SNAPSHOT_PREFIX = "drakeling_"
+SNAPSHOT_SUFFIX = ".db"
+
+
+async def snapshot_database(
+    session_factory: async_sessionmaker[AsyncSession],
+    dest: Path,
+) -> Path:
+    """Write a consistent, compacted copy of the database to *dest*.
+
+    The copy is built next to *dest* and renamed into place, so *dest*
+    never holds a partial file.  An existing *dest* is replaced.
+    """
+    partial = dest.with_name(dest.name + ".partial")
+    partial.unlink(missing_ok=True)
+    engine = session_factory.kw["bind"]
+    try:
+        # VACUUM can't run inside a transaction
+        async with engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("VACUUM INTO :dest"), {"dest": str(partial)})
+        os.replace(partial, dest)
+    finally:
+        partial.unlink(missing_ok=True)
+    return dest
+
+
+def list_snapshots(snapshot_dir: Path) -> list[Path]:
+    """Snapshots in *snapshot_dir*, oldest first."""
+    if not snapshot_dir.is_dir():
+        return []
+    return sorted(
+        p for p in snapshot_dir.iterdir()
+        if p.name.startswith(SNAPSHOT_PREFIX) and p.name.endswith(SNAPSHOT_SUFFIX)
+    )
+
+
+def rotate_snapshots(snapshot_dir: Path, keep: int) -> list[Path]:
+    """Delete all but the newest *keep* snapshots; returns those deleted."""
+    snapshots = list_snapshots(snapshot_dir)
+    doomed = snapshots[:-keep] if keep > 0 else snapshots
+    for path in doomed:
+        path.unlink(missing_ok=True)
+    return doomed
+
+
+async def take_snapshot(
+    session_factory: async_sessionmaker[AsyncSession],
+    data_dir: Path,
+    *,
+    keep: int,
+    now: float | None = None,
+) -> Path:
+    """Snapshot into ``<data_dir>/snapshots`` and keep the newest *keep*."""
+    snapshot_dir = data_dir / SNAPSHOT_DIRNAME
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    # UTC, so names sort in time order across DST changes
+    stamp = time.strftime("%Y%m%d_%H%M%SZ", time.gmtime(now))
+    dest = snapshot_dir / f"{SNAPSHOT_PREFIX}{stamp}{SNAPSHOT_SUFFIX}"
+    await snapshot_database(session_factory, dest)
+    rotate_snapshots(snapshot_dir, keep)
+    return dest
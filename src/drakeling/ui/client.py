@@ -1,20 +1,173 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+import json
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Callable
 
 import httpx
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed
 
 from drakeling.crypto.token import TOKEN_FILENAME
 from drakeling.storage.paths import get_data_dir
 
+# Seconds to wait for the daemon, unless a call says otherwise
+DEFAULT_TIMEOUT = 5.0
+
 
 class DaemonNotAvailable(Exception):
     """Raised when the daemon cannot be reached."""
 
 
+async def _read_sse(
+    resp: httpx.Response,
+) -> AsyncIterator[tuple[int | None, str, dict[str, Any]]]:
+    """Parse a server-sent event stream into ``(id, type, data)``."""
+    event_id: int | None = None
+    event_type = "message"
+    data: list[str] = []
+    async for line in resp.aiter_lines():
+        if line:
+            field, _, value = line.partition(":")
+            value = value.removeprefix(" ")
+            if field == "id":
+                event_id = int(value)
+            elif field == "event":
+                event_type = value
+            elif field == "data":
+                data.append(value)
+            continue
+        if data:
+            yield event_id, event_type, json.loads("\n".join(data))
+        event_type, data = "message", []
+
+
+class DaemonRequestError(Exception):
+    """The daemon refused an action sent over the WebSocket."""
+
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class DrakelingSocket:
+    """One ``/ws`` connection: actions out, replies and pushed events in."""
+
+    def __init__(
+        self, connection: ClientConnection, *, timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        self._connection = connection
+        self._timeout = timeout
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._on_token: dict[int, Callable[[str], None]] = {}
+        self._events: asyncio.Queue[tuple[int, str, dict[str, Any]] | None] = (
+            asyncio.Queue()
+        )
+        self._reader = asyncio.create_task(self._read())
+
+    @property
+    def open(self) -> bool:
+        return not self._reader.done()
+
+    async def _read(self) -> None:
+        try:
+            async for raw in self._connection:
+                message = json.loads(raw)
+                if message.get("type") == "event":
+                    self._events.put_nowait(
+                        (message["event_id"], message["event"], message["data"])
+                    )
+                    continue
+                if message.get("type") == "token":
+                    on_token = self._on_token.get(message.get("id"))
+                    if on_token is not None:
+                        on_token(message["text"])
+                    continue
+                future = self._pending.pop(message.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except ConnectionClosed:
+            pass
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(
+                        DaemonNotAvailable("Lost the connection to the daemon")
+                    )
+            self._pending.clear()
+            self._events.put_nowait(None)
+
+    async def request(
+        self,
+        type: str,
+        *,
+        on_token: Callable[[str], None] | None = None,
+        timeout: float | None = None,
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """Send an action and wait for its reply.
+
+        *on_token* receives streamed pieces of a talk reply.  Like an HTTP
+        read timeout, :class:`httpx.ReadTimeout` is raised once *timeout*
+        seconds (default: the socket's) pass with neither the reply nor a
+        new token arriving.
+        """
+        if not self.open:
+            raise DaemonNotAvailable("Lost the connection to the daemon")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        tokens = 0
+        if on_token is not None:
+            def on_piece(text: str) -> None:
+                nonlocal tokens
+                tokens += 1
+                on_token(text)
+
+            self._on_token[request_id] = on_piece
+        try:
+            await self._connection.send(
+                json.dumps({"id": request_id, "type": type, **fields})
+            )
+            while True:
+                seen = tokens
+                try:
+                    reply = await asyncio.wait_for(
+                        asyncio.shield(future), timeout or self._timeout,
+                    )
+                    break
+                except asyncio.TimeoutError:
+                    if tokens == seen:
+                        raise httpx.ReadTimeout(
+                            "No reply from the daemon"
+                        ) from None
+        finally:
+            self._pending.pop(request_id, None)
+            self._on_token.pop(request_id, None)
+        if reply["type"] == "error":
+            raise DaemonRequestError(reply["status"], str(reply["detail"]))
+        return reply["data"]
+
+    async def events(self) -> AsyncIterator[tuple[int, str, dict[str, Any]]]:
+        """Pushed ``(id, type, data)`` events until the connection closes."""
+        while (event := await self._events.get()) is not None:
+            yield event
+
+    async def close(self) -> None:
+        await self._connection.close()
+        await self._reader
+
+
 class DrakelingClient:
-    """Thin HTTP client for the Drakeling daemon API."""
+    """Thin HTTP client for the Drakeling daemon API.
+
+    Once :meth:`connect_socket` has succeeded, care, talk and rest go over
+    the WebSocket instead of one HTTP request each.
+    """
 
     def __init__(self, *, base_url: str | None = None, data_dir: Path | None = None):
         self._data_dir = data_dir or get_data_dir()
@@ -23,6 +176,9 @@ class DrakelingClient:
         port = int(os.environ.get("DRAKELING_PORT", "52780"))
         self._base_url = base_url or f"http://127.0.0.1:{port}"
         self._client: httpx.AsyncClient | None = None
+        self._socket: DrakelingSocket | None = None
+        # Last ETag and body per path, for conditional GETs
+        self._etags: dict[str, tuple[str, dict[str, Any]]] = {}
 
         token_path = self._data_dir / TOKEN_FILENAME
         if token_path.exists():
@@ -40,7 +196,7 @@ class DrakelingClient:
             self._client = httpx.AsyncClient(
                 base_url=self._base_url,
                 headers={"Authorization": f"Bearer {self._token}"},
-                timeout=5.0,
+                timeout=DEFAULT_TIMEOUT,
             )
         return self._client
 
@@ -66,15 +222,68 @@ class DrakelingClient:
             return True
         return False
 
+    async def _get_revalidated(
+        self, path: str, *, missing_ok: bool = False,
+    ) -> dict[str, Any] | None:
+        """GET *path*, sending the last ETag seen.
+
+        A 304 answer is served from the copy kept for that ETag.  With
+        *missing_ok*, a 404 returns None instead of raising.
+        """
+        client = self._ensure_client()
+        cached = self._etags.get(path)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        resp = await client.get(path, headers=headers)
+        if resp.status_code == 304 and cached:
+            return dict(cached[1])
+        self._etags.pop(path, None)
+        if resp.status_code == 404 and missing_ok:
+            return None
+        resp.raise_for_status()
+        body = resp.json()
+        etag = resp.headers.get("etag")
+        if etag:
+            self._etags[path] = (etag, body)
+        return dict(body)
+
     async def get_status(self) -> dict[str, Any] | None:
         """Get creature status. Returns None if no creature exists (404)."""
+        return await self._get_revalidated("/status", missing_ok=True)
+
+    async def dashboard(self, feed: int = 20) -> dict[str, Any] | None:
+        """Status, attention, cooldowns, budget and the last *feed* log
+        entries in one request.  Returns None if no creature exists (404).
+        """
         client = self._ensure_client()
-        resp = await client.get("/status")
+        resp = await client.get("/dashboard", params={"feed": feed})
         if resp.status_code == 404:
             return None
         resp.raise_for_status()
         return resp.json()
 
+    @property
+    def socket(self) -> DrakelingSocket | None:
+        """The open WebSocket, if any."""
+        if self._socket is not None and self._socket.open:
+            return self._socket
+        return None
+
+    async def connect_socket(
+        self, last_event_id: int | None = None,
+    ) -> DrakelingSocket:
+        """Open ``/ws``, resuming pushed events after *last_event_id*."""
+        self._ensure_client()
+        url = self._base_url.replace("http", "ws", 1) + "/ws"
+        if last_event_id is not None:
+            url += f"?last_event_id={last_event_id}"
+        connection = await connect(
+            url,
+            additional_headers={"Authorization": f"Bearer {self._token}"},
+            open_timeout=DEFAULT_TIMEOUT,
+        )
+        self._socket = DrakelingSocket(connection)
+        return self._socket
+
     async def birth(self, colour: str, name: str) -> dict[str, Any]:
         client = self._ensure_client()
         resp = await client.post("/birth", json={"colour": colour, "name": name})
@@ -82,6 +291,9 @@ class DrakelingClient:
         return resp.json()
 
     async def care(self, care_type: str) -> dict[str, Any]:
+        socket = self.socket
+        if socket is not None:
+            return await socket.request("care", care_type=care_type)
         client = self._ensure_client()
         resp = await client.post("/care", json={"type": care_type})
         resp.raise_for_status()
@@ -93,12 +305,18 @@ class DrakelingClient:
         *,
         timeout: float | None = None,
     ) -> dict[str, Any]:
+        socket = self.socket
+        if socket is not None:
+            return await socket.request("talk", message=message, timeout=timeout)
         client = self._ensure_client()
         resp = await client.post("/talk", json={"message": message}, timeout=timeout)
         resp.raise_for_status()
         return resp.json()
 
     async def rest(self) -> dict[str, Any]:
+        socket = self.socket
+        if socket is not None:
+            return await socket.request("rest")
         client = self._ensure_client()
         resp = await client.post("/rest", json={})
         resp.raise_for_status()
@@ -112,11 +330,67 @@ class DrakelingClient:
         return resp.json()
 
     async def needs_attention(self) -> dict[str, Any]:
+        return await self._get_revalidated("/needs-attention")
+
+    async def events(
+        self, last_event_id: int | None = None,
+    ) -> AsyncIterator[tuple[int | None, str, dict[str, Any]]]:
+        """Follow ``GET /events``, yielding ``(id, type, data)`` per event.
+
+        Returns when the daemon closes the stream; the caller reconnects
+        with the last id it saw to resume.
+        """
         client = self._ensure_client()
-        resp = await client.get("/needs-attention")
-        resp.raise_for_status()
-        return resp.json()
+        headers = {}
+        if last_event_id is not None:
+            headers["Last-Event-ID"] = str(last_event_id)
+        # The daemon sends a keepalive every 30s
+        timeout = httpx.Timeout(5.0, read=90.0)
+        async with client.stream(
+            "GET", "/events", headers=headers, timeout=timeout,
+        ) as resp:
+            resp.raise_for_status()
+            async for event in _read_sse(resp):
+                yield event
+
+    async def talk_stream(
+        self,
+        message: str,
+        on_token: Callable[[str], None],
+        *,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Talk, calling *on_token* with each piece of the reply as it comes.
+
+        Returns the same body as :meth:`talk` once the reply is complete.
+        """
+        socket = self.socket
+        if socket is not None:
+            return await socket.request(
+                "talk", message=message, stream=True, on_token=on_token,
+                timeout=timeout,
+            )
+        client = self._ensure_client()
+        async with client.stream(
+            "POST", "/talk/stream", json={"message": message}, timeout=timeout,
+        ) as resp:
+            if resp.is_error:
+                await resp.aread()
+            resp.raise_for_status()
+            if not resp.headers.get("content-type", "").startswith(
+                "text/event-stream"
+            ):
+                await resp.aread()
+                return resp.json()
+            async for _, event_type, data in _read_sse(resp):
+                if event_type == "token":
+                    on_token(data["text"])
+                elif event_type == "done":
+                    return data
+        raise DaemonNotAvailable("The reply stream ended early")
 
     async def close(self) -> None:
+        if self._socket is not None:
+            await self._socket.close()
         if self._client:
             await self._client.aclose()
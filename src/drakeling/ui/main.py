@@ -12,13 +12,31 @@ from textual.widgets import Footer, Header, Input, Label, Static
 import httpx
 
 from drakeling.domain.models import DragonColour, LifecycleStage
-from drakeling.ui.client import DaemonNotAvailable, DrakelingClient
-from drakeling.ui.widgets.feed import InteractionFeed
+from drakeling.ui.client import (
+    DaemonNotAvailable,
+    DaemonRequestError,
+    DrakelingClient,
+)
+from drakeling.ui.widgets.feed import InteractionFeed, StreamingMessage
 from drakeling.ui.widgets.input_bar import InputBar
 from drakeling.ui.widgets.sprite_panel import SpritePanel
 from drakeling.ui.widgets.stats_display import StatsDisplay
 
 
+def _error_detail(exc: Exception) -> tuple[int, str]:
+    """Status code and ``detail`` of a refused request, HTTP or socket."""
+    if isinstance(exc, DaemonRequestError):
+        return exc.status_code, exc.detail
+    detail = ""
+    try:
+        body = exc.response.json()
+        if isinstance(body, dict) and "detail" in body:
+            detail = str(body["detail"])
+    except Exception:
+        pass
+    return exc.response.status_code, detail
+
+
 class DaemonUnavailableScreen(Screen):
     """Shown when the daemon is not running or not yet initialised."""
 
@@ -87,10 +105,17 @@ class MainScreen(Screen):
     }
     """
 
-    def __init__(self, client: DrakelingClient, status: dict) -> None:
+    def __init__(
+        self,
+        client: DrakelingClient,
+        status: dict,
+        *,
+        dashboard: dict | None = None,
+    ) -> None:
         super().__init__()
         self._client = client
         self._status = status
+        self._dashboard = dashboard
         self._colour = DragonColour(status["colour"])
         self._stage = LifecycleStage(status["lifecycle_stage"])
 
@@ -106,12 +131,16 @@ class MainScreen(Screen):
         with Vertical(id="right-top"):
             yield Label("", id="attention-indicator")
         with Vertical(id="right-bottom"):
-            yield InteractionFeed(id="feed")
+            draft = StreamingMessage(id="feed-draft")
+            yield InteractionFeed(id="feed", draft=draft)
+            yield draft
             yield InputBar()
         yield Footer()
 
     def on_mount(self) -> None:
         self._refresh_stats()
+        if self._dashboard is not None:
+            self._show_dashboard(self._dashboard)
         self._poll_status()
         talk_input = self.query_one("#talk-input", Input)
         talk_input.focus()
@@ -138,27 +167,75 @@ class MainScreen(Screen):
         sprite = self.query_one(SpritePanel)
         sprite.update_sprite(self._stage, self._colour)
 
+    def _show_dashboard(self, dashboard: dict) -> None:
+        """Replay recent history into the feed and show attention."""
+        feed = self.query_one("#feed", InteractionFeed)
+        for entry in dashboard.get("feed", []):
+            if entry["source"] == "user":
+                feed.add_user_message(entry["content"])
+            else:
+                feed.add_creature_message(entry["content"], self._colour.hex_tint)
+        self._show_attention(dashboard.get("attention"))
+
+    def _show_attention(self, attn: dict | None) -> None:
+        indicator = self.query_one("#attention-indicator", Label)
+        if attn and attn.get("needs_attention"):
+            reason = attn.get("reason") or ""
+            indicator.update(f"[bold red]! {reason.replace('_', ' ')}[/]")
+        else:
+            indicator.update("")
+
+    def _apply_event(self, event_type: str, data: dict) -> None:
+        if event_type in ("snapshot", "creature"):
+            if data.get("creature"):
+                self._status.update(data["creature"])
+                self._refresh_stats()
+            self._show_attention(data.get("attention"))
+        elif event_type == "state":
+            self._status.update(data)
+            self._refresh_stats()
+        elif event_type == "attention":
+            self._show_attention(data)
+        elif event_type == "lifecycle":
+            feed = self.query_one("#feed", InteractionFeed)
+            feed.add_system_note(f"({data['event_type'].replace('_', ' ')})")
+
+    async def _poll_once(self) -> None:
+        try:
+            new_status = await self._client.get_status()
+            if new_status:
+                self._status = new_status
+                self._refresh_stats()
+            self._show_attention(await self._client.needs_attention())
+        except Exception:
+            pass
+
     @work(exclusive=True, thread=False)
     async def _poll_status(self) -> None:
-        """Periodically refresh status from daemon."""
+        """Follow pushed events from the daemon, polling while it is down.
+
+        The WebSocket is preferred, since talk, care and rest then share
+        it; the event stream is the fallback.
+        """
         import asyncio
+        last_id = None
         while True:
-            await asyncio.sleep(5)
             try:
-                new_status = await self._client.get_status()
-                if new_status:
-                    self._status = new_status
-                    self._refresh_stats()
-
-                attn = await self._client.needs_attention()
-                indicator = self.query_one("#attention-indicator", Label)
-                if attn and attn.get("needs_attention"):
-                    reason = attn.get("reason", "")
-                    indicator.update(f"[bold red]! {reason.replace('_', ' ')}[/]")
-                else:
-                    indicator.update("")
+                socket = await self._client.connect_socket(last_id)
+                async for event_id, event_type, data in socket.events():
+                    last_id = event_id
+                    self._apply_event(event_type, data)
+            except Exception:
+                pass
+            try:
+                async for event_id, event_type, data in self._client.events(last_id):
+                    if event_id is not None:
+                        last_id = event_id
+                    self._apply_event(event_type, data)
             except Exception:
                 pass
+            await asyncio.sleep(5)
+            await self._poll_once()
 
     @on(Input.Submitted, "#talk-input")
     def _on_talk(self, event: Input.Submitted) -> None:
@@ -173,15 +250,25 @@ class MainScreen(Screen):
     @work(thread=False)
     async def _do_talk(self, message: str) -> None:
         feed = self.query_one("#feed", InteractionFeed)
+
+        def on_token(text: str) -> None:
+            feed.stream_creature_text(text, self._colour.hex_tint)
+
         for attempt in range(2):
+            streamed = ""
             try:
-                result = await self._client.talk(message, timeout=60.0)
+                try:
+                    result = await self._client.talk_stream(
+                        message, on_token, timeout=60.0,
+                    )
+                finally:
+                    streamed = feed.end_creature_stream()
                 if "cooldown_remaining" in result:
                     secs = int(result["cooldown_remaining"])
                     feed.add_system_note(f"(give them a moment... {secs}s)")
                     return
                 response = result.get("response")
-                if response:
+                if response and not streamed:
                     feed.add_creature_message(response, self._colour.hex_tint)
                 elif result.get("budget_exhausted"):
                     feed.add_system_note("(resting quietly for now)")
@@ -190,6 +277,13 @@ class MainScreen(Screen):
                     self._refresh_stats()
                 return
             except httpx.ReadTimeout:
+                # Once a token has arrived the daemon has taken the talk;
+                # sending it again would count it twice
+                if streamed:
+                    feed.add_system_note(
+                        "(the reply stalled part-way. try again shortly.)"
+                    )
+                    return
                 if attempt == 0:
                     feed.add_system_note(
                         "(they are still thinking... local models can take a while. "
@@ -201,19 +295,9 @@ class MainScreen(Screen):
                     "please try again shortly.)"
                 )
                 return
-            except httpx.HTTPStatusError as exc:
-                detail = ""
-                try:
-                    body = exc.response.json()
-                    if isinstance(body, dict) and "detail" in body:
-                        detail = str(body["detail"])
-                except Exception:
-                    pass
-
-                if (
-                    exc.response.status_code == 403
-                    and "not yet hatched" in detail.lower()
-                ):
+            except (httpx.HTTPStatusError, DaemonRequestError) as exc:
+                status_code, detail = _error_detail(exc)
+                if status_code == 403 and "not yet hatched" in detail.lower():
                     feed.add_system_note(
                         "(your drakeling is still an egg and cannot talk yet. "
                         "keep caring for it until it hatches.)"
@@ -264,14 +348,8 @@ class MainScreen(Screen):
             if response:
                 feed.add_creature_message(response, self._colour.hex_tint)
             feed.add_system_note("your creature is resting")
-        except httpx.HTTPStatusError as exc:
-            detail = ""
-            try:
-                body = exc.response.json()
-                if isinstance(body, dict) and "detail" in body:
-                    detail = body["detail"]
-            except Exception:
-                pass
+        except (httpx.HTTPStatusError, DaemonRequestError) as exc:
+            _, detail = _error_detail(exc)
             msg = detail or str(exc)
             feed.add_system_note(f"(could not rest: {msg})")
         except Exception as exc:
@@ -339,11 +417,11 @@ class DrakelingApp(App):
             return
 
         try:
-            status = await self._client.get_status()
+            dashboard = await self._client.dashboard()
         except Exception:
-            status = None
+            dashboard = None
 
-        if status is None:
+        if dashboard is None:
             from drakeling.ui.birth import BirthScreen
 
             self.push_screen(
@@ -351,11 +429,11 @@ class DrakelingApp(App):
                 callback=self._on_birth_dismissed,
             )
         else:
-            self._push_main(status)
+            self._push_main(dashboard["status"], dashboard=dashboard)
 
-    def _push_main(self, status: dict) -> None:
+    def _push_main(self, status: dict, *, dashboard: dict | None = None) -> None:
         self.push_screen(
-            MainScreen(self._client, status),
+            MainScreen(self._client, status, dashboard=dashboard),
             callback=self._on_main_dismissed,
         )
 
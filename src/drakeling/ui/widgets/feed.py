@@ -1,7 +1,24 @@
 from __future__ import annotations
 
 from rich.markup import escape
-from textual.widgets import RichLog
+from textual.widgets import RichLog, Static
+
+
+def _creature_markup(text: str, colour_hex: str = "") -> str:
+    safe = escape(text)
+    return f"[{colour_hex}]> {safe}[/]" if colour_hex else f"> {safe}"
+
+
+class StreamingMessage(Static):
+    """The creature message being generated, shown under the feed."""
+
+    DEFAULT_CSS = """
+    StreamingMessage {
+        height: auto;
+        padding: 0 2;
+        display: none;
+    }
+    """
 
 
 class InteractionFeed(RichLog):
@@ -15,15 +32,38 @@ class InteractionFeed(RichLog):
     }
     """
 
-    def __init__(self, **kwargs: object) -> None:
+    def __init__(
+        self, *, draft: StreamingMessage | None = None, **kwargs: object,
+    ) -> None:
         super().__init__(markup=True, **kwargs)
+        self._draft_widget = draft
+        self._draft = ""
+        self._draft_colour = ""
 
     def add_creature_message(self, text: str, colour_hex: str = "") -> None:
-        safe = escape(text)
-        if colour_hex:
-            self.write(f"[{colour_hex}]> {safe}[/]")
-        else:
-            self.write(f"> {safe}")
+        self.write(_creature_markup(text, colour_hex))
+
+    def stream_creature_text(self, text: str, colour_hex: str = "") -> None:
+        """Append *text* to the creature message that is being generated.
+
+        The draft is shown in the feed's :class:`StreamingMessage` and only
+        written to the log by :meth:`end_creature_stream`.
+        """
+        self._draft += text
+        self._draft_colour = colour_hex
+        if self._draft_widget is not None:
+            self._draft_widget.update(_creature_markup(self._draft, colour_hex))
+            self._draft_widget.display = True
+
+    def end_creature_stream(self) -> str:
+        """Write the streamed message to the log and return its text."""
+        text, self._draft = self._draft, ""
+        if self._draft_widget is not None:
+            self._draft_widget.display = False
+            self._draft_widget.update("")
+        if text:
+            self.add_creature_message(text, self._draft_colour)
+        return text
 
     def add_user_message(self, text: str) -> None:
         self.write(f"[dim]you:[/] {escape(text)}")
@@ -1,6 +1,8 @@
 """Integration tests for the API endpoints."""
+import json
 import pytest
 import time
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import AsyncMock
 
@@ -9,6 +11,7 @@ from sqlalchemy import select
 
 from drakeling.api.app import create_app
 from drakeling.daemon.config import DrakelingConfig
+from drakeling.domain.models import LifecycleStage
 from drakeling.storage.database import get_engine, get_session_factory, run_migrations
 from drakeling.storage.models import CreatureStateRow
 
@@ -172,3 +175,695 @@ class TestNeedsAttention:
         assert "needs_attention" in data
         assert "reason" in data
         assert "urgency" in data
+
+
+class TestDaemonStats:
+    @pytest.mark.asyncio
+    async def test_reports_tick_stats(self, app_and_client):
+        from drakeling.daemon.tick import TickScheduler
+
+        app, client = app_and_client
+        resp = await client.get("/stats")
+        assert resp.status_code == 200
+        assert resp.json()["tick"] is None
+
+        app.state.scheduler = TickScheduler(app.state.config)
+        app.state.scheduler.stats.record_pass(2.0, overran=True)
+        data = (await client.get("/stats")).json()["tick"]
+        assert data["overruns"] == 1
+        assert data["last_duration"] == 2.0
+
+
+class TestTickDiagnostics:
+    @pytest.mark.asyncio
+    async def test_reports_phase_timings(self, app_and_client):
+        from drakeling.daemon.tick import TickScheduler, _do_tick
+
+        app, client = app_and_client
+        resp = await client.get("/diagnostics/tick")
+        assert resp.status_code == 503
+
+        await client.post("/birth", json={"colour": "red", "name": "Test"})
+        scheduler = TickScheduler(app.state.config)
+        app.state.scheduler = scheduler
+        await _do_tick(app.state.store, app.state.config, AsyncMock(), scheduler)
+
+        phases = (await client.get("/diagnostics/tick")).json()["phases"]
+        assert {"load", "settle", "forecast"} <= set(phases)
+        assert phases["settle"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_requires_token(self, app_and_client):
+        app, client = app_and_client
+        resp = await client.get(
+            "/diagnostics/tick", headers={"Authorization": "Bearer wrong"},
+        )
+        assert resp.status_code == 401
+
+
+class TestScheduledDecay:
+    @pytest.mark.asyncio
+    async def test_care_settles_owed_ticks_first(self, app_and_client, monkeypatch):
+        from drakeling.daemon.tick import TickScheduler
+
+        monkeypatch.setattr("drakeling.api.cooldown._last_care_at", 0.0)
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Test"})
+        store = app.state.store
+        creature = await store.get()
+        store.update(replace(
+            creature,
+            lifecycle_stage=LifecycleStage.MATURE,
+            mood_state=replace(creature.mood_state, loneliness=0.5),
+        ), now=time.time())
+
+        scheduler = TickScheduler(app.state.config)
+        scheduler.last_tick_at = time.time() - 10 * scheduler._config.tick_seconds
+        app.state.scheduler = scheduler
+
+        resp = await client.get("/status")
+        assert resp.json()["mood"] < 0.5  # projected, not yet persisted
+
+        resp = await client.post("/care", json={"type": "gentle_attention"})
+        data = resp.json()["state"]
+        assert data["loneliness"] == 0.0
+        assert abs(data["mood"] - (0.5 - 10 * 0.005 + 0.05)) < 1e-9
+
+
+class TestCreatureStore:
+    @pytest.mark.asyncio
+    async def test_state_served_from_memory_until_flushed(self, app_and_client):
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Test"})
+        store = app.state.store
+        creature = await store.get()
+        store.update(replace(
+            creature, mood_state=replace(creature.mood_state, mood=0.9),
+        ), now=time.time())
+
+        resp = await client.get("/status")
+        assert resp.json()["mood"] == 0.9
+        async with app.state.session_factory() as session:
+            row = (await session.execute(select(CreatureStateRow))).scalar_one()
+            assert row.mood == 0.5
+
+        await store.flush()
+        assert not store.dirty
+        async with app.state.session_factory() as session:
+            row = (await session.execute(select(CreatureStateRow))).scalar_one()
+            assert row.mood == 0.9
+
+    @pytest.mark.asyncio
+    async def test_rest_persists_resting_entered_at(self, app_and_client):
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Test"})
+        store = app.state.store
+        creature = await store.get()
+        store.update(
+            replace(creature, lifecycle_stage=LifecycleStage.MATURE),
+            now=time.time(),
+        )
+
+        resp = await client.post("/rest")
+        assert resp.status_code == 200
+        async with app.state.session_factory() as session:
+            row = (await session.execute(select(CreatureStateRow))).scalar_one()
+            assert row.lifecycle_stage == "resting"
+            assert row.resting_entered_at == store.resting_entered_at
+            assert row.resting_entered_at is not None
+
+        await store.load()
+        assert store.resting_entered_at == row.resting_entered_at
+
+    @pytest.mark.asyncio
+    async def test_rest_survives_exhaustion(self, app_and_client):
+        from types import SimpleNamespace
+
+        from drakeling.daemon.tick import TickScheduler, _do_tick
+        from drakeling.domain.lifecycle import (
+            RESTING_MAX_DURATION,
+            evaluate_transitions,
+        )
+
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Test"})
+        store = app.state.store
+        creature = await store.get()
+        store.update(
+            replace(creature, lifecycle_stage=LifecycleStage.MATURE),
+            now=time.time(),
+        )
+        await client.post("/rest")
+        rested_at = store.resting_entered_at
+
+        # Budget runs out mid-rest, then comes back
+        creature = store.creature
+        store.update(replace(
+            creature,
+            pre_exhausted_stage=creature.lifecycle_stage,
+            lifecycle_stage=LifecycleStage.EXHAUSTED,
+        ), now=time.time())
+        assert store.resting_entered_at == rested_at
+        llm = SimpleNamespace(budget_exhausted=False)
+        await _do_tick(store, app.state.config, llm, TickScheduler(app.state.config))
+        creature = store.creature
+        assert creature.lifecycle_stage == LifecycleStage.RESTING
+        assert store.resting_entered_at == rested_at
+
+        event = evaluate_transitions(
+            creature, rested_at + RESTING_MAX_DURATION,
+            resting_entered_at=store.resting_entered_at,
+        )
+        assert event is not None
+        assert event.to_stage == LifecycleStage.MATURE
+
+
+class TestBackgroundReflection:
+    @pytest.mark.asyncio
+    async def test_care_not_blocked_by_inflight_reflection(
+        self, app_and_client, monkeypatch,
+    ):
+        import asyncio
+
+        from drakeling.daemon.tick import TickScheduler, _do_tick
+        from drakeling.storage.models import CreatureMemoryRow
+
+        monkeypatch.setattr("drakeling.api.cooldown._last_care_at", 0.0)
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Test"})
+        store = app.state.store
+        creature = await store.get()
+        store.update(
+            replace(creature, lifecycle_stage=LifecycleStage.MATURE),
+            now=time.time(),
+        )
+
+        release = asyncio.Event()
+
+        async def slow_call(messages):
+            await release.wait()
+            return "I wondered about the sky."
+
+        llm = AsyncMock()
+        llm.call = slow_call
+        llm.budget_exhausted = False
+        llm.budget_remaining = 10_000
+        config = DrakelingConfig(dev_mode=False)
+        scheduler = TickScheduler(config)
+        app.state.scheduler = scheduler
+
+        await asyncio.wait_for(_do_tick(store, config, llm, scheduler), 1.0)
+        assert scheduler.reflecting
+
+        resp = await asyncio.wait_for(
+            client.post("/care", json={"type": "gentle_attention"}), 1.0,
+        )
+        assert resp.status_code == 200
+
+        release.set()
+        await scheduler._reflection
+        assert store.creature.last_reflection_at is not None
+        async with app.state.session_factory() as session:
+            memories = (await session.execute(select(CreatureMemoryRow))).scalars().all()
+        assert [m.memory_type for m in memories] == ["reflection"]
+
+
+class TestSQLiteProfile:
+    @pytest.mark.asyncio
+    async def test_default_profile_applied(self, app_and_client):
+        from sqlalchemy import text
+
+        app, _ = app_and_client
+        async with app.state.session_factory() as session:
+            mode = (await session.execute(text("PRAGMA journal_mode"))).scalar_one()
+            sync = (await session.execute(text("PRAGMA synchronous"))).scalar_one()
+            busy = (await session.execute(text("PRAGMA busy_timeout"))).scalar_one()
+        assert mode == "wal"
+        assert sync == 1  # NORMAL
+        assert busy == 5000
+
+    @pytest.mark.asyncio
+    async def test_export_includes_wal_contents(self, app_and_client, tmp_path):
+        import sqlite3
+
+        from drakeling.crypto.bundle import import_bundle
+
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Walrus"})
+        resp = await client.post("/export", json={"passphrase": "pw"})
+        assert resp.status_code == 200
+
+        db_bytes, _ = import_bundle(Path(resp.json()["path"]).read_bytes(), "pw")
+        copy = tmp_path / "exported.db"
+        copy.write_bytes(db_bytes)
+        with sqlite3.connect(copy) as conn:
+            names = [r[0] for r in conn.execute("SELECT name FROM creature_state")]
+        assert names == ["Walrus"]
+
+        # The app keeps working after its pool was released
+        assert (await client.get("/status")).json()["name"] == "Walrus"
+
+
+class TestMemorySearch:
+    async def _seed(self, app):
+        from drakeling.storage.models import CreatureMemoryRow, InteractionLogRow
+
+        async with app.state.session_factory() as session:
+            session.add_all([
+                CreatureMemoryRow(
+                    created_at=1.0, memory_type="reflection",
+                    content="I dreamt of the mountain and the mountain dreamt back",
+                    lifecycle_stage="juvenile",
+                ),
+                CreatureMemoryRow(
+                    created_at=2.0, memory_type="reflection",
+                    content="The river was cold today", lifecycle_stage="juvenile",
+                ),
+            ])
+            session.add(InteractionLogRow(
+                created_at=3.0, source="user", interaction_type="talk",
+                content="Shall we climb the mountain tomorrow?",
+            ))
+            await session.commit()
+
+    @pytest.mark.asyncio
+    async def test_ranked_results_across_sources(self, app_and_client):
+        app, client = app_and_client
+        await self._seed(app)
+        resp = await client.get("/memories/search", params={"q": "mountain"})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["has_more"] is False
+        results = data["results"]
+        assert [r["source"] for r in results] == ["memory", "interaction"]
+        assert results[0]["kind"] == "reflection"
+        assert "[mountain]" in results[0]["snippet"]
+        assert results[0]["score"] <= results[1]["score"]
+
+    @pytest.mark.asyncio
+    async def test_pagination(self, app_and_client):
+        app, client = app_and_client
+        await self._seed(app)
+        first = (await client.get(
+            "/memories/search", params={"q": "mountain", "limit": 1},
+        )).json()
+        second = (await client.get(
+            "/memories/search", params={"q": "mountain", "limit": 1, "offset": 1},
+        )).json()
+        assert first["has_more"] is True
+        assert second["has_more"] is False
+        assert first["results"][0]["source"] == "memory"
+        assert second["results"][0]["source"] == "interaction"
+
+    @pytest.mark.asyncio
+    async def test_operators_are_literal(self, app_and_client):
+        app, client = app_and_client
+        await self._seed(app)
+        resp = await client.get("/memories/search", params={"q": 'river OR "cold'})
+        assert resp.status_code == 200
+        # OR is a plain word, so nothing contains all three
+        assert resp.json()["results"] == []
+
+    @pytest.mark.asyncio
+    async def test_query_without_words_returns_422(self, app_and_client):
+        _, client = app_and_client
+        resp = await client.get("/memories/search", params={"q": "?!"})
+        assert resp.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_deleted_rows_leave_the_index(self, app_and_client):
+        from sqlalchemy import delete
+
+        from drakeling.storage.models import CreatureMemoryRow
+
+        app, client = app_and_client
+        await self._seed(app)
+        async with app.state.session_factory() as session:
+            await session.execute(delete(CreatureMemoryRow))
+            await session.commit()
+        results = (await client.get(
+            "/memories/search", params={"q": "mountain"},
+        )).json()["results"]
+        assert [r["source"] for r in results] == ["interaction"]
+
+
+class TestBatchedLogWrites:
+    @pytest.mark.asyncio
+    async def test_talk_history_includes_queued_rows(self, app_and_client, monkeypatch):
+        from drakeling.storage.models import InteractionLogRow
+
+        monkeypatch.setattr("drakeling.api.cooldown._last_talk_at", 0.0)
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Quill"})
+        store = app.state.store
+        store.update(
+            replace(store.creature, lifecycle_stage=LifecycleStage.JUVENILE),
+            now=time.time(),
+        )
+        store.writes.add(InteractionLogRow(
+            created_at=time.time(), source="creature",
+            interaction_type="care_response", content="queued",
+        ))
+
+        resp = await client.post("/talk", json={"message": "hello"})
+        assert resp.status_code == 200
+        assert store.writes.pending == 0
+        async with app.state.session_factory() as session:
+            rows = (await session.execute(select(InteractionLogRow))).scalars().all()
+        assert [r.content for r in rows] == ["queued", "hello"]
+
+    @pytest.mark.asyncio
+    async def test_stats_report_write_queue(self, app_and_client):
+        _, client = app_and_client
+        data = (await client.get("/stats")).json()
+        assert data["writes"]["pending"] == 0
+
+
+class TestReadOnlyEngine:
+    @pytest.fixture
+    async def read_app(self, tmp_path):
+        from drakeling.storage.database import get_read_engine
+
+        (tmp_path / "api_token").write_text("tok")
+        engine = get_engine(tmp_path)
+        await run_migrations(engine)
+        read_engine = get_read_engine(tmp_path)
+        app = create_app(
+            config=DrakelingConfig(dev_mode=True),
+            session_factory=get_session_factory(engine),
+            data_dir=tmp_path,
+            read_session_factory=get_session_factory(read_engine),
+        )
+        app.state.llm = None
+        transport = ASGITransport(app=app)
+        async with AsyncClient(
+            transport=transport, base_url="http://test",
+            headers={"Authorization": "Bearer tok"},
+        ) as client:
+            yield app, client
+        await read_engine.dispose()
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_read_engine_rejects_writes(self, read_app):
+        from sqlalchemy import text
+        from sqlalchemy.exc import OperationalError
+
+        app, _ = read_app
+        async with app.state.read_session_factory() as session:
+            with pytest.raises(OperationalError):
+                await session.execute(text(
+                    "INSERT INTO lifecycle_events (created_at, event_type)"
+                    " VALUES (0, 'x')"
+                ))
+
+    @pytest.mark.asyncio
+    async def test_get_reads_while_writer_holds_lock(self, read_app):
+        from drakeling.storage.models import CreatureMemoryRow
+
+        app, client = read_app
+        async with app.state.session_factory() as session:
+            session.add(CreatureMemoryRow(
+                created_at=1.0, memory_type="reflection",
+                content="a warm stone", lifecycle_stage="juvenile",
+            ))
+            await session.commit()
+
+        async with app.state.session_factory() as writer:
+            writer.add(CreatureMemoryRow(
+                created_at=2.0, memory_type="reflection",
+                content="another warm stone", lifecycle_stage="juvenile",
+            ))
+            await writer.flush()
+            start = time.perf_counter()
+            resp = await client.get("/memories/search", params={"q": "stone"})
+            elapsed = time.perf_counter() - start
+            await writer.commit()
+
+        assert resp.status_code == 200
+        assert len(resp.json()["results"]) == 1
+        assert elapsed < 1.0
+
+
+class TestStatHistoryEndpoint:
+    @pytest.mark.asyncio
+    async def test_ticks_show_up_columnar(self, app_and_client):
+        from drakeling.daemon.tick import TickScheduler
+
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Graph"})
+        store = app.state.store
+        now = time.time()
+        store.update(
+            replace(store.creature, lifecycle_stage=LifecycleStage.MATURE), now=now,
+        )
+        scheduler = TickScheduler(app.state.config)
+        tick = app.state.config.tick_seconds
+        scheduler.last_tick_at = now - 5 * tick
+        scheduler.settle(store, now)
+
+        resp = await client.get(
+            "/history/stats", params={"from": now - 10 * tick, "to": now},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["resolution"] == "minute"
+        assert data["step"] == 60
+        assert len(data["t"]) == 5
+        assert len(data["mood"]) == 5
+        assert data["mood"] == sorted(data["mood"], reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_owed_ticks_are_served_without_writing(self, app_and_client):
+        from drakeling.daemon.tick import TickScheduler
+
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Graph"})
+        store = app.state.store
+        now = time.time()
+        store.update(
+            replace(store.creature, lifecycle_stage=LifecycleStage.MATURE), now=now,
+        )
+        app.state.scheduler = TickScheduler(app.state.config)
+        tick = app.state.config.tick_seconds
+        app.state.scheduler.last_tick_at = now - 3 * tick
+        version = store.version
+
+        resp = await client.get(
+            "/history/stats", params={"from": now - 10 * tick, "resolution": "minute"},
+        )
+        assert len(resp.json()["t"]) == 3
+        assert app.state.scheduler.owed_ticks(now) == 3
+        assert store.version == version
+        assert store.history.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_bad_parameters(self, app_and_client):
+        _, client = app_and_client
+        resp = await client.get("/history/stats", params={"resolution": "week"})
+        assert resp.status_code == 422
+        resp = await client.get(
+            "/history/stats", params={"from": 0, "to": 1e9, "resolution": "minute"},
+        )
+        assert resp.status_code == 422
+
+
+class TestEventsEndpoint:
+    @pytest.mark.asyncio
+    async def test_requires_token(self, app_and_client):
+        _, client = app_and_client
+        resp = await client.get("/events", headers={"Authorization": ""})
+        assert resp.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_mutations_are_published(self, app_and_client, monkeypatch):
+        monkeypatch.setattr("drakeling.api.cooldown._last_care_at", 0.0)
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Pip"})
+        events = app.state.store.events
+        born = events.last_id
+        assert events.since(born - 1)[0].type == "creature"
+
+        await client.post("/care", json={"type": "gentle_attention"})
+        state = [e for e in events.since(born) if e.type == "state"]
+        assert state[0].data["cumulative_care_events"] == 1
+        assert "name" not in state[0].data
+
+        await client.request("DELETE", "/creature", json={"confirm": True})
+        last = events.since(events.last_id - 1)[0]
+        assert last.type == "creature"
+        assert last.data["creature"] is None
+
+
+class _StreamingLLM:
+    """Stands in for LLMWrapper, replying in fixed pieces."""
+
+    budget_exhausted = False
+    budget_remaining = 10_000
+    tokens_used_today = 0
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+
+    async def call(self, messages, max_tokens=None):
+        return None
+
+    async def stream(self, messages, max_tokens=None):
+        for piece in self.pieces:
+            yield piece
+
+
+class TestTalkStream:
+    async def _hatch(self, app, client):
+        await client.post("/birth", json={"colour": "red", "name": "Echo"})
+        store = app.state.store
+        store.update(
+            replace(store.creature, lifecycle_stage=LifecycleStage.JUVENILE),
+            now=time.time(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_streams_tokens_then_done(self, app_and_client, monkeypatch):
+        from drakeling.storage.models import InteractionLogRow
+
+        monkeypatch.setattr("drakeling.api.cooldown._last_talk_at", 0.0)
+        app, client = app_and_client
+        await self._hatch(app, client)
+        app.state.llm = _StreamingLLM(["Hel", "lo ", "there"])
+
+        resp = await client.post("/talk/stream", json={"message": "hi"})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = [
+            block.split("\n", 1) for block in resp.text.strip().split("\n\n")
+        ]
+        assert [e[0] for e in events] == ["event: token"] * 3 + ["event: done"]
+        assert events[0][1] == 'data: {"text":"Hel"}'
+        done = json.loads(events[-1][1].removeprefix("data: "))
+        assert done["response"] == "Hello there"
+        assert "state" in done
+
+        await app.state.store.writes.flush()
+        async with app.state.session_factory() as session:
+            rows = (await session.execute(select(InteractionLogRow))).scalars().all()
+        assert [r.content for r in rows] == ["hi", "Hello there"]
+
+    @pytest.mark.asyncio
+    async def test_refusals_are_plain_responses(self, app_and_client, monkeypatch):
+        monkeypatch.setattr("drakeling.api.cooldown._last_talk_at", 0.0)
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Echo"})
+        resp = await client.post("/talk/stream", json={"message": "hi"})
+        assert resp.status_code == 403
+
+        resp = await client.post("/talk/stream", json={"message": "hi"})
+        assert "cooldown_remaining" in resp.json()
+
+    @pytest.mark.asyncio
+    async def test_no_llm_reports_budget_exhausted(self, app_and_client, monkeypatch):
+        monkeypatch.setattr("drakeling.api.cooldown._last_talk_at", 0.0)
+        app, client = app_and_client
+        await self._hatch(app, client)
+        resp = await client.post("/talk/stream", json={"message": "hi"})
+        assert resp.json() == {"response": None, "budget_exhausted": True}
+
+
+class TestConditionalGet:
+    @pytest.mark.asyncio
+    async def test_status_revalidates_to_304(self, app_and_client, monkeypatch):
+        monkeypatch.setattr("drakeling.api.cooldown._last_care_at", 0.0)
+        _, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Tag"})
+        first = await client.get("/status")
+        etag = first.headers["etag"]
+        assert etag.startswith('"')
+
+        again = await client.get("/status", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["etag"] == etag
+
+        await client.post("/care", json={"type": "feed"})
+        changed = await client.get("/status", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_owed_ticks_change_the_tag(self, app_and_client):
+        from drakeling.daemon.tick import TickScheduler
+
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Tag"})
+        scheduler = app.state.scheduler = TickScheduler(app.state.config)
+        scheduler.last_tick_at = time.time()
+        etag = (await client.get("/needs-attention")).headers["etag"]
+        listed = {"If-None-Match": f'W/"other", {etag}'}
+        assert (await client.get(
+            "/needs-attention", headers=listed,
+        )).status_code == 304
+
+        scheduler.last_tick_at -= 3 * app.state.config.tick_seconds
+        resp = await client.get("/needs-attention", headers=listed)
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_client_sends_if_none_match(self, app_and_client):
+        from drakeling.ui.client import DrakelingClient
+
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Tag"})
+        seen: list[int] = []
+        drakeling = DrakelingClient(base_url="http://test", data_dir=app.state.data_dir)
+        drakeling._client = AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+            headers=dict(client.headers),
+            event_hooks={"response": [lambda r: _record(seen, r)]},
+        )
+        first = await drakeling.get_status()
+        second = await drakeling.get_status()
+        assert seen == [200, 304]
+        assert second == first
+        await drakeling.close()
+
+
+async def _record(seen: list[int], response) -> None:
+    seen.append(response.status_code)
+
+
+class TestDashboard:
+    @pytest.mark.asyncio
+    async def test_no_creature_is_404(self, app_and_client):
+        _, client = app_and_client
+        resp = await client.get("/dashboard")
+        assert resp.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_one_response_for_opening_the_ui(self, app_and_client, monkeypatch):
+        monkeypatch.setattr("drakeling.api.cooldown._last_care_at", 0.0)
+        monkeypatch.setattr("drakeling.api.cooldown._last_talk_at", 0.0)
+        app, client = app_and_client
+        await client.post("/birth", json={"colour": "red", "name": "Echo"})
+        store = app.state.store
+        store.update(
+            replace(store.creature, lifecycle_stage=LifecycleStage.JUVENILE),
+            now=time.time(),
+        )
+        app.state.llm = _StreamingLLM(["Hel", "lo"])
+        await client.post("/talk/stream", json={"message": "hi"})
+        await client.post("/care", json={"type": "feed"})
+
+        data = (await client.get("/dashboard")).json()
+        assert data["status"]["name"] == "Echo"
+        assert data["status"]["budget_remaining_today"] == 10_000
+        assert "needs_attention" in data["attention"]
+        assert data["cooldown"]["care"] > 0
+        assert data["cooldown"]["talk"] > 0
+        assert data["budget"]["exhausted"] is False
+        assert [(e["source"], e["content"]) for e in data["feed"]] == [
+            ("user", "hi"), ("creature", "Hello"),
+        ]
+
+        data = (await client.get("/dashboard", params={"feed": 0})).json()
+        assert data["feed"] == []
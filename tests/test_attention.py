@@ -0,0 +1,68 @@
+"""Tests for needs-attention evaluation."""
+from drakeling.domain.attention import (
+    HATCHING_SOON_WINDOW,
+    LONELY_THRESHOLD,
+    evaluate_attention,
+)
+from drakeling.domain.lifecycle import EGG_TO_HATCHED_TIME
+from drakeling.domain.models import (
+    Creature,
+    LifecycleStage,
+    MoodState,
+    PersonalityProfile,
+)
+
+
+def _make_creature(
+    stage: LifecycleStage = LifecycleStage.MATURE,
+    care: int = 0,
+    **mood,
+) -> Creature:
+    defaults = dict(
+        mood=0.5, energy=0.5, trust=0.5, trust_floor=0.0,
+        loneliness=0.0, state_curiosity=0.5, stability=0.5,
+    )
+    defaults.update(mood)
+    return Creature(
+        name="Test",
+        colour="red",
+        personality=PersonalityProfile(
+            seed="aa" * 32,
+            trait_curiosity=0.5, trait_sociability=0.5, trait_confidence=0.5,
+            trait_emotional_sensitivity=0.5, trait_autonomy_preference=0.5,
+            trait_loneliness_rate=0.5,
+        ),
+        mood_state=MoodState(**defaults),
+        lifecycle_stage=stage,
+        pre_exhausted_stage=None,
+        pre_resting_stage=None,
+        born_at=0.0,
+        hatched_at=None,
+        public_key_hex="ab" * 32,
+        cumulative_care_events=care,
+        cumulative_talk_interactions=0,
+        last_reflection_at=None,
+    )
+
+
+class TestEvaluateAttention:
+    def test_content_creature(self):
+        assert evaluate_attention(_make_creature(), now=0.0) == (None, None)
+
+    def test_lonely(self):
+        c = _make_creature(loneliness=LONELY_THRESHOLD)
+        assert evaluate_attention(c, now=0.0) == ("lonely", "medium")
+
+    def test_lonely_beats_low_mood(self):
+        c = _make_creature(loneliness=0.95, mood=0.05)
+        assert evaluate_attention(c, now=0.0) == ("lonely", "high")
+
+    def test_low_energy(self):
+        c = _make_creature(energy=0.15)
+        assert evaluate_attention(c, now=0.0) == ("low_energy", "low")
+
+    def test_hatching_soon(self):
+        c = _make_creature(stage=LifecycleStage.EGG, care=1)
+        now = EGG_TO_HATCHED_TIME - HATCHING_SOON_WINDOW
+        assert evaluate_attention(c, now=now) == ("hatching_soon", "low")
+        assert evaluate_attention(c, now=now - 1) == (None, None)
@@ -0,0 +1,85 @@
+"""Tests for the vectorised decay kernel against the scalar functions."""
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from drakeling.domain import batch, decay
+from drakeling.domain.models import LifecycleStage, MoodState, PersonalityProfile
+
+FIELDS = ["mood", "energy", "trust", "trust_floor", "loneliness",
+          "state_curiosity", "stability"]
+
+
+def _random_population(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    edges = [0.0, 0.001, 0.005, 0.79, 0.8, 0.999, 1.0]
+
+    def value():
+        return rng.choice(edges) if rng.random() < 0.2 else rng.random()
+
+    states = [MoodState(**{f: value() for f in FIELDS}) for _ in range(n)]
+    traits = [
+        PersonalityProfile(
+            seed="aa" * 32,
+            trait_curiosity=rng.random(), trait_sociability=0.5,
+            trait_confidence=0.5, trait_emotional_sensitivity=0.5,
+            trait_autonomy_preference=0.5, trait_loneliness_rate=rng.random(),
+        )
+        for _ in range(n)
+    ]
+    stages = [
+        rng.choice([LifecycleStage.MATURE, LifecycleStage.RESTING])
+        for _ in range(n)
+    ]
+    return states, traits, stages
+
+
+def _assert_bit_identical(result: batch.MoodStateBatch, expected: list[MoodState]):
+    for got, want in zip(result.to_states(), expected):
+        for field in FIELDS:
+            assert getattr(got, field).hex() == getattr(want, field).hex(), field
+
+
+class TestMoodStateBatch:
+    def test_round_trip(self):
+        states, _, _ = _random_population(50)
+        b = batch.MoodStateBatch.from_states(states)
+        assert len(b) == 50
+        assert b.to_states() == states
+
+
+class TestBatchKernels:
+    def test_tick_decay_matches_scalar(self):
+        states, traits, stages = _random_population(500)
+        b = batch.MoodStateBatch.from_states(states)
+        resting = batch.resting_mask(stages)
+        rate = np.array([t.trait_loneliness_rate for t in traits])
+        for _ in range(300):
+            b = batch.apply_tick_decay(b, resting, rate)
+            states = [
+                decay.apply_tick_decay(s, stage, t)
+                for s, stage, t in zip(states, stages, traits)
+            ]
+        _assert_bit_identical(b, states)
+
+    def test_care_boost_matches_scalar(self):
+        states, _, _ = _random_population(500)
+        b = batch.apply_care_boost(batch.MoodStateBatch.from_states(states))
+        _assert_bit_identical(b, [decay.apply_care_boost(s) for s in states])
+
+    def test_feed_boost_matches_scalar(self):
+        states, _, _ = _random_population(500)
+        b = batch.apply_feed_boost(batch.MoodStateBatch.from_states(states))
+        _assert_bit_identical(b, [decay.apply_feed_boost(s) for s in states])
+
+    def test_talk_boost_matches_scalar(self):
+        states, traits, _ = _random_population(500)
+        curiosity = np.array([t.trait_curiosity for t in traits])
+        b = batch.apply_talk_boost(
+            batch.MoodStateBatch.from_states(states), curiosity
+        )
+        _assert_bit_identical(
+            b, [decay.apply_talk_boost(s, t) for s, t in zip(states, traits)]
+        )
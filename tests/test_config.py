@@ -0,0 +1,70 @@
+"""Tests for daemon configuration from environment variables."""
+import pytest
+
+from drakeling.daemon.config import DrakelingConfig
+from drakeling.storage.database import SQLITE_PROFILES, SQLitePragmas
+
+
+class TestSQLiteConfig:
+    def test_defaults_to_balanced_profile(self, monkeypatch):
+        monkeypatch.delenv("DRAKELING_SQLITE_PROFILE", raising=False)
+        config = DrakelingConfig.from_env()
+        assert config.sqlite_pragmas() == SQLITE_PROFILES["balanced"]
+
+    def test_profile_then_overrides(self, monkeypatch):
+        monkeypatch.setenv("DRAKELING_SQLITE_PROFILE", "legacy")
+        monkeypatch.setenv("DRAKELING_SQLITE_BUSY_TIMEOUT", "250")
+        monkeypatch.setenv("DRAKELING_SQLITE_JOURNAL_MODE", "wal")
+        pragmas = DrakelingConfig.from_env().sqlite_pragmas()
+        assert pragmas.journal_mode == "WAL"
+        assert pragmas.busy_timeout == 250
+        assert pragmas.synchronous == SQLITE_PROFILES["legacy"].synchronous
+
+    def test_unknown_profile_rejected(self, monkeypatch):
+        monkeypatch.setenv("DRAKELING_SQLITE_PROFILE", "turbo")
+        with pytest.raises(ValueError):
+            DrakelingConfig.from_env()
+
+    def test_invalid_pragma_rejected(self):
+        with pytest.raises(ValueError):
+            SQLitePragmas(synchronous="SOMETIMES")
+
+
+class TestWriteQueueConfig:
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("DRAKELING_WRITE_FLUSH_MS", "250")
+        monkeypatch.setenv("DRAKELING_WRITE_BATCH_ROWS", "0")
+        config = DrakelingConfig.from_env()
+        assert config.write_flush_ms == 250
+        assert config.write_batch_rows == 1
+
+
+class TestSnapshotConfig:
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("DRAKELING_SNAPSHOT_HOURS", raising=False)
+        assert DrakelingConfig.from_env().snapshot_hours == 0
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("DRAKELING_SNAPSHOT_HOURS", "12")
+        monkeypatch.setenv("DRAKELING_SNAPSHOT_KEEP", "3")
+        config = DrakelingConfig.from_env()
+        assert config.snapshot_hours == 12
+        assert config.snapshot_keep == 3
+
+
+class TestRetentionConfig:
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("DRAKELING_RETENTION_DAYS", raising=False)
+        monkeypatch.delenv("DRAKELING_RETENTION_TABLES", raising=False)
+        config = DrakelingConfig.from_env()
+        assert config.retention_days == 0
+        assert config.retention_tables == ("interaction_log",)
+
+    def test_tables_from_env(self, monkeypatch):
+        monkeypatch.setenv("DRAKELING_RETENTION_TABLES", "interaction_log, Creature_Memory")
+        config = DrakelingConfig.from_env()
+        assert config.retention_tables == ("interaction_log", "creature_memory")
+
+        monkeypatch.setenv("DRAKELING_RETENTION_TABLES", "creature_state")
+        with pytest.raises(ValueError):
+            DrakelingConfig.from_env()
@@ -1,6 +1,7 @@
 """Tests for stat decay and boost functions."""
 from drakeling.domain.decay import (
     apply_care_boost,
+    apply_decay_span,
     apply_talk_boost,
     apply_tick_decay,
 )
@@ -82,6 +83,50 @@ class TestTickDecay:
             assert 0.0 <= val <= 1.0, f"{field} = {val}"
 
 
+class TestDecaySpan:
+    def _iterate(self, ms, stage, traits, n):
+        for _ in range(n):
+            ms = apply_tick_decay(ms, stage, traits)
+        return ms
+
+    def _assert_close(self, a, b):
+        for field in ["mood", "energy", "trust", "trust_floor", "loneliness",
+                      "state_curiosity", "stability"]:
+            assert abs(getattr(a, field) - getattr(b, field)) < 1e-9, field
+
+    def test_zero_ticks_is_identity(self):
+        ms = _make_mood()
+        assert apply_decay_span(ms, LifecycleStage.MATURE, _make_traits(), 0) == ms
+
+    def test_matches_iterated_decay(self):
+        ms = _make_mood(mood=0.9, energy=0.4, trust=0.7, loneliness=0.1)
+        traits = _make_traits(trait_loneliness_rate=0.8)
+        for stage in (LifecycleStage.MATURE, LifecycleStage.RESTING):
+            for n in (1, 7, 50, 400):
+                self._assert_close(
+                    apply_decay_span(ms, stage, traits, n),
+                    self._iterate(ms, stage, traits, n),
+                )
+
+    def test_clamps_at_bounds(self):
+        ms = _make_mood(mood=0.01, loneliness=0.99, energy=0.99)
+        result = apply_decay_span(ms, LifecycleStage.RESTING, _make_traits(), 1440)
+        assert result.mood == 0.0
+        assert result.loneliness == 1.0
+        assert result.energy == 1.0
+
+    def test_trust_stops_at_floor(self):
+        ms = _make_mood(trust=0.6, trust_floor=0.4)
+        result = apply_decay_span(ms, LifecycleStage.MATURE, _make_traits(), 1440)
+        assert result.trust == 0.4
+
+    def test_floor_above_trust_lifts_trust(self):
+        ms = _make_mood(trust=0.3, trust_floor=0.35)
+        traits = _make_traits()
+        result = apply_decay_span(ms, LifecycleStage.MATURE, traits, 10)
+        assert result.trust == self._iterate(ms, LifecycleStage.MATURE, traits, 10).trust
+
+
 class TestCareBoost:
     def test_mood_increases(self):
         ms = _make_mood(mood=0.5)
@@ -0,0 +1,167 @@
+"""Tests for the event bus and the server-sent event stream."""
+import asyncio
+import json
+from dataclasses import replace
+
+import pytest
+
+from drakeling.api.events import event_stream, format_event
+from drakeling.daemon.events import SUBSCRIBER_QUEUE, EventBus
+from drakeling.storage.models import (
+    CreatureMemoryRow,
+    InteractionLogRow,
+    LifecycleEventRow,
+)
+from tests.test_attention import _make_creature
+
+
+def _parse(chunk: str) -> tuple[int, str, dict]:
+    fields = dict(
+        line.split(": ", 1) for line in chunk.strip().splitlines()
+    )
+    return int(fields["id"]), fields["event"], json.loads(fields["data"])
+
+
+class TestEventBus:
+    def test_ids_increase(self):
+        bus = EventBus()
+        first = bus.publish("state", {"mood": 0.5})
+        second = bus.publish("state", {"mood": 0.6})
+        assert second.id == first.id + 1
+        assert bus.last_id == second.id
+
+    def test_state_carries_only_changed_fields(self):
+        bus = EventBus()
+        creature = _make_creature(mood=0.5, energy=0.5)
+        bus.reset(creature, 0.0)
+        bus.creature_changed(
+            replace(creature, mood_state=replace(creature.mood_state, mood=0.7)),
+            0.0,
+        )
+        event = bus.since(bus.last_id - 1)[0]
+        assert event.type == "state"
+        assert event.data == {"mood": 0.7}
+
+    def test_sub_rounding_changes_publish_nothing(self):
+        bus = EventBus()
+        creature = _make_creature(mood=0.5)
+        bus.reset(creature, 0.0)
+        before = bus.last_id
+        bus.creature_changed(
+            replace(creature, mood_state=replace(creature.mood_state, mood=0.50001)),
+            0.0,
+        )
+        assert bus.last_id == before
+
+    def test_attention_published_on_change_only(self):
+        bus = EventBus()
+        creature = _make_creature(loneliness=0.5)
+        bus.reset(creature, 0.0)
+        lonely = replace(
+            creature, mood_state=replace(creature.mood_state, loneliness=0.75),
+        )
+        bus.creature_changed(lonely, 0.0)
+        types = [e.type for e in bus.since(bus.last_id - 2)]
+        assert types == ["state", "attention"]
+        assert bus.snapshot()["attention"]["reason"] == "lonely"
+
+        lonelier = replace(
+            lonely, mood_state=replace(lonely.mood_state, loneliness=0.8),
+        )
+        bus.creature_changed(lonelier, 0.0)
+        assert bus.since(bus.last_id - 1)[0].type == "state"
+
+    def test_rows_committed_publishes_lifecycle_and_reflections(self):
+        bus = EventBus()
+        bus.rows_committed([
+            LifecycleEventRow(
+                created_at=1.0, event_type="hatched",
+                from_stage="egg", to_stage="hatchling",
+            ),
+            InteractionLogRow(
+                created_at=2.0, source="user", interaction_type="talk",
+                content="hi",
+            ),
+            CreatureMemoryRow(
+                created_at=3.0, memory_type="reflection",
+                content="I wonder", lifecycle_stage="juvenile",
+            ),
+        ])
+        events = bus.since(bus.last_id - 2)
+        assert [e.type for e in events] == ["lifecycle", "reflection"]
+        assert events[0].data["to_stage"] == "hatchling"
+        assert events[1].data["content"] == "I wonder"
+
+    def test_since_refuses_ids_outside_the_buffer(self):
+        bus = EventBus(buffer=4)
+        start = bus.last_id
+        for i in range(10):
+            bus.publish("state", {"mood": i})
+        assert bus.since(start) is None
+        assert bus.since(bus.last_id + 1) is None
+        assert bus.since(bus.last_id) == []
+        assert len(bus.since(bus.last_id - 4)) == 4
+
+    def test_full_subscriber_is_told_to_resync(self):
+        bus = EventBus()
+        queue = bus.subscribe()
+        for i in range(SUBSCRIBER_QUEUE + 1):
+            bus.publish("state", {"mood": i})
+        assert queue.qsize() == 1
+        assert queue.get_nowait() is None
+        assert bus.resyncs == 1
+
+
+class TestEventStream:
+    @pytest.mark.asyncio
+    async def test_starts_with_snapshot(self):
+        bus = EventBus()
+        bus.reset(_make_creature(), 0.0)
+        stream = event_stream(bus)
+        assert (await anext(stream)).startswith("retry:")
+        event_id, event_type, data = _parse(await anext(stream))
+        assert event_type == "snapshot"
+        assert event_id == bus.last_id
+        assert data["creature"]["lifecycle_stage"] == "mature"
+        await stream.aclose()
+        assert bus.subscribers == 0
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_last_event_id(self):
+        bus = EventBus()
+        seen = bus.publish("state", {"mood": 0.1})
+        missed = bus.publish("state", {"mood": 0.2})
+        stream = event_stream(bus, seen.id)
+        await anext(stream)
+        assert _parse(await anext(stream)) == (missed.id, "state", {"mood": 0.2})
+
+        live = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        bus.publish("lifecycle", {"event_type": "hatched"})
+        event_id, event_type, _ = _parse(await live)
+        assert (event_id, event_type) == (missed.id + 1, "lifecycle")
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unknown_id_gets_snapshot(self):
+        bus = EventBus()
+        bus.publish("state", {"mood": 0.1})
+        stream = event_stream(bus, 42)
+        await anext(stream)
+        assert _parse(await anext(stream))[1] == "snapshot"
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_keepalive_when_idle(self):
+        bus = EventBus()
+        stream = event_stream(bus, bus.last_id, keepalive=0.01)
+        await anext(stream)
+        assert await anext(stream) == ": keepalive\n\n"
+        await stream.aclose()
+
+
+def test_format_event():
+    assert format_event(7, "state", {"mood": 0.5}) == (
+        'id: 7\nevent: state\ndata: {"mood":0.5}\n\n'
+    )
+
@@ -0,0 +1,55 @@
+"""Tests for forecasting the next observable state change."""
+from dataclasses import replace
+
+from drakeling.domain.attention import evaluate_attention
+from drakeling.domain.decay import apply_tick_decay
+from drakeling.domain.forecast import ticks_until_change
+from drakeling.domain.lifecycle import (
+    EGG_TO_HATCHED_TIME,
+    ENERGY_RESTING_THRESHOLD,
+    evaluate_transitions,
+)
+from drakeling.domain.models import LifecycleStage
+
+from tests.test_attention import _make_creature
+
+
+def _step_until_change(creature, now, tick_seconds, max_ticks):
+    """Reference: tick one at a time until something observable changes."""
+    start = evaluate_attention(creature, now)
+    for k in range(1, max_ticks + 1):
+        at = now + k * tick_seconds
+        if creature.lifecycle_stage != LifecycleStage.EGG:
+            creature = replace(creature, mood_state=apply_tick_decay(
+                creature.mood_state, creature.lifecycle_stage,
+                creature.personality,
+            ))
+        if evaluate_transitions(creature, at) is not None:
+            return k
+        if evaluate_attention(creature, at) != start:
+            return k
+    return max_ticks
+
+
+class TestTicksUntilChange:
+    def test_nothing_changes_within_horizon(self):
+        c = _make_creature(energy=0.9, mood=0.9)
+        assert ticks_until_change(c, 0.0, 60, max_ticks=5) == 5
+
+    def test_loneliness_threshold(self):
+        c = _make_creature(loneliness=0.6, energy=0.9, mood=0.9)
+        assert ticks_until_change(c, 0.0, 60, max_ticks=500) == (
+            _step_until_change(c, 0.0, 60, 500)
+        )
+
+    def test_mature_enters_resting(self):
+        c = _make_creature(energy=ENERGY_RESTING_THRESHOLD + 0.0301, mood=0.9)
+        k = ticks_until_change(c, 0.0, 60, max_ticks=500)
+        assert k == _step_until_change(c, 0.0, 60, 500)
+
+    def test_egg_hatch_time(self):
+        c = _make_creature(stage=LifecycleStage.EGG, care=1)
+        k = ticks_until_change(c, 0.0, 10, max_ticks=100)
+        # hatching_soon shows up one window before the hatch itself
+        assert k == _step_until_change(c, 0.0, 10, 100)
+        assert k * 10 < EGG_TO_HATCHED_TIME
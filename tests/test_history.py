@@ -0,0 +1,155 @@
+"""Tests for the multi-resolution stat history."""
+import time
+
+import pytest
+from sqlalchemy import func, select
+
+from drakeling.daemon import history as history_mod
+from drakeling.daemon.history import StatHistory, pick_resolution, query_stats
+from drakeling.daemon.state import CreatureStore
+from drakeling.domain.lifecycle import advance_ticks
+from drakeling.domain.models import LifecycleStage, MoodState
+from drakeling.storage.database import get_engine, get_session_factory, run_migrations
+from drakeling.storage.models import StatHistoryRow
+
+from tests.test_attention import _make_creature
+
+DAY = 86_400.0
+
+
+def _state(mood: float) -> MoodState:
+    return MoodState(
+        mood=mood, energy=0.5, trust=0.5, trust_floor=0.0,
+        loneliness=0.0, state_curiosity=0.5, stability=0.5,
+    )
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = get_engine(tmp_path)
+    await run_migrations(engine)
+    yield get_session_factory(engine)
+    await engine.dispose()
+
+
+class TestStatHistory:
+    def test_samples_average_per_bucket(self):
+        h = StatHistory()
+        h.record(_state(0.2), at=120.0)
+        h.record(_state(0.4), at=150.0)
+        h.record(_state(0.9), at=185.0)
+        entries = {(e["resolution"], e["bucket_start"]): e for e in h.take()}
+        assert entries[(60, 120.0)]["mood"] == pytest.approx(0.3)
+        assert entries[(60, 180.0)]["samples"] == 1
+        assert entries[(3_600, 0.0)]["samples"] == 3
+        assert entries[(86_400, 0.0)]["mood"] == pytest.approx(0.5)
+        assert h.pending == 0
+
+    def test_record_spans_projects_each_tick(self):
+        h = StatHistory()
+        creature = _make_creature(mood=0.5)
+        h.record_spans([(creature, 3)], first_tick_at=60.0, tick_seconds=60)
+        minute = sorted(
+            (e["bucket_start"], e["mood"]) for e in h.take() if e["resolution"] == 60
+        )
+        assert minute == [
+            (60.0, pytest.approx(0.495)),
+            (120.0, pytest.approx(0.490)),
+            (180.0, pytest.approx(0.485)),
+        ]
+
+    def test_spans_follow_stage_changes(self):
+        creature = _make_creature(stage=LifecycleStage.MATURE, energy=0.3005)
+        n_ticks, tick, now = 240, 60, 1_000_020.0
+        spans = []
+        advance_ticks(creature, n_ticks, now, tick, spans=spans)
+        assert len(spans) > 1
+        h = StatHistory()
+        h.record_spans(spans, now - (n_ticks - 1) * tick, tick)
+        recorded = sorted(
+            (e["bucket_start"], e["energy"]) for e in h.take() if e["resolution"] == 60
+        )
+
+        # The same ticks run one at a time, as the loop would
+        expected, resting_at = [], None
+        for k in range(n_ticks):
+            at = now - (n_ticks - 1 - k) * tick
+            creature, events = advance_ticks(
+                creature, 1, at, tick, resting_entered_at=resting_at,
+            )
+            for event in events:
+                if event.event_type == "entered_resting":
+                    resting_at = event.created_at
+            expected.append((at, pytest.approx(creature.mood_state.energy)))
+        assert recorded == expected
+
+    def test_pick_resolution(self):
+        now = 100 * DAY
+        assert pick_resolution(now - 3_600, now) == "minute"
+        assert pick_resolution(now - 7 * DAY, now) == "hour"
+        assert pick_resolution(now - 60 * DAY, now) == "day"
+
+    @pytest.mark.asyncio
+    async def test_writes_merge_into_existing_buckets(self, session_factory):
+        h = StatHistory()
+        now = 10 * DAY
+        for mood, at in ((0.2, now), (0.4, now + 1)):
+            h.record(_state(mood), at=at)
+            async with session_factory() as session:
+                await h.write(session, h.take(), now)
+                await session.commit()
+        h.record(_state(0.9), at=now + 2)
+        async with session_factory() as session:
+            await h.write(session, h.take(), now)
+            await session.commit()
+            rows = await query_stats(session, "minute", now, now + 60)
+        assert len(rows) == 1
+        assert rows[0].mood == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_pending_buckets_merge_with_stored_rows(self, session_factory):
+        h = StatHistory()
+        now = 10 * DAY
+        h.record(_state(0.2), at=now)
+        async with session_factory() as session:
+            await h.write(session, h.take(), now)
+            await session.commit()
+            rows = await query_stats(session, "minute", now, now + 120)
+        h.record(_state(0.5), at=now + 1)
+        h.record(_state(0.5), at=now + 2)
+        h.record(_state(0.9), at=now + 60)
+        pending = h.pending
+        merged = h.merged(rows, "minute", now, now + 120)
+        assert [m[0] for m in merged] == [now, now + 60]
+        assert merged[0][1] == pytest.approx(0.4)
+        assert merged[1][1] == pytest.approx(0.9)
+        assert h.pending == pending
+
+    @pytest.mark.asyncio
+    async def test_prunes_expired_fine_buckets(self, session_factory):
+        h = StatHistory()
+        now = 100 * DAY
+        h.record(_state(0.5), at=now - 2 * DAY)
+        async with session_factory() as session:
+            await h.write(session, h.take(), now - 2 * DAY)
+            await session.commit()
+        h._pruned_at = 0.0
+        async with session_factory() as session:
+            await h.write(session, [], now)
+            await session.commit()
+            kept = (await session.execute(
+                select(StatHistoryRow.resolution).order_by(StatHistoryRow.resolution)
+            )).scalars().all()
+        assert kept == [3_600, 86_400]
+
+    @pytest.mark.asyncio
+    async def test_store_flush_writes_samples(self, session_factory):
+        store = CreatureStore(session_factory)
+        store.history.record(_state(0.5), at=time.time())
+        await store.flush()
+        async with session_factory() as session:
+            count = (await session.execute(
+                select(func.count()).select_from(StatHistoryRow)
+            )).scalar_one()
+        assert count == len(history_mod.RESOLUTIONS)
+        assert store.history.pending == 0
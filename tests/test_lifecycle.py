@@ -1,6 +1,9 @@
 """Tests for lifecycle transition evaluation."""
+import random
 import time
 
+import pytest
+
 from drakeling.domain.lifecycle import (
     EGG_TO_HATCHED_CARE,
     EGG_TO_HATCHED_TIME,
@@ -11,8 +14,12 @@ from drakeling.domain.lifecycle import (
     JUVENILE_TO_MATURE_CARE,
     JUVENILE_TO_MATURE_TALK,
     JUVENILE_TO_MATURE_TIME,
+    RESTING_MAX_DURATION,
+    advance_ticks,
     evaluate_transitions,
+    evaluate_transitions_batch,
 )
+from drakeling.domain.decay import apply_tick_decay
 from drakeling.domain.models import (
     Creature,
     LifecycleStage,
@@ -151,3 +158,172 @@ class TestRestingWake:
         assert event is not None
         assert event.event_type == "exited_resting"
         assert event.to_stage == LifecycleStage.JUVENILE
+
+
+def _step_ticks(creature, n_ticks, now, tick_seconds, resting_entered_at=None):
+    """Reference implementation: one decay + transition check per tick."""
+    from dataclasses import replace
+
+    events = []
+    for i in range(1, n_ticks + 1):
+        at = now - (n_ticks - i) * tick_seconds
+        stage = creature.lifecycle_stage
+        if stage != LifecycleStage.EGG:
+            creature = replace(creature, mood_state=apply_tick_decay(
+                creature.mood_state, stage, creature.personality,
+            ))
+        event = evaluate_transitions(
+            creature, at, resting_entered_at=resting_entered_at,
+        )
+        if event is None:
+            continue
+        changes = {"lifecycle_stage": event.to_stage}
+        if event.event_type == "egg_to_hatched":
+            changes["hatched_at"] = at
+        elif event.event_type == "entered_resting":
+            changes["pre_resting_stage"] = event.from_stage
+            resting_entered_at = at
+        elif event.event_type == "exited_resting":
+            changes["pre_resting_stage"] = None
+        creature = replace(creature, **changes)
+        events.append(event)
+    return creature, events
+
+
+class TestAdvanceTicks:
+    def test_zero_ticks_is_identity(self):
+        c = _make_creature(stage=LifecycleStage.MATURE)
+        advanced, events = advance_ticks(c, 0, 1000.0, 60)
+        assert advanced == c
+        assert events == []
+
+    def test_single_tick_matches_evaluate(self):
+        c = _make_creature(care=EGG_TO_HATCHED_CARE, born_at=0.0)
+        advanced, events = advance_ticks(c, 1, EGG_TO_HATCHED_TIME + 1, 60)
+        assert [e.event_type for e in events] == ["egg_to_hatched"]
+        assert advanced.lifecycle_stage == LifecycleStage.HATCHED
+        assert advanced.hatched_at == EGG_TO_HATCHED_TIME + 1
+
+    def test_day_of_downtime_chains_transitions(self):
+        c = _make_creature(
+            stage=LifecycleStage.MATURE,
+            energy=0.3005,
+            pre_resting_stage=None,
+        )
+        now = 1_000_000.0
+        advanced, events = advance_ticks(c, 1440, now, 60)
+        expected, expected_events = _step_ticks(c, 1440, now, 60)
+        assert events == expected_events
+        assert [e.event_type for e in events][:2] == [
+            "entered_resting", "exited_resting",
+        ]
+        assert advanced.lifecycle_stage == expected.lifecycle_stage
+        assert abs(advanced.mood_state.energy - expected.mood_state.energy) < 1e-9
+
+    def test_egg_hatches_mid_span_then_decays(self):
+        c = _make_creature(care=EGG_TO_HATCHED_CARE, born_at=0.0)
+        now = 3_000.0
+        advanced, events = advance_ticks(c, 50, now, 60)
+        expected, expected_events = _step_ticks(c, 50, now, 60)
+        assert events == expected_events
+        assert advanced.hatched_at == expected.hatched_at
+        assert abs(advanced.mood_state.mood - expected.mood_state.mood) < 1e-9
+
+    @pytest.mark.parametrize("stage", [
+        LifecycleStage.MATURE, LifecycleStage.RESTING,
+    ])
+    def test_transitions_fire_on_the_same_tick_as_the_loop(self, stage):
+        # Energies on a 0.001 grid sit exactly on the 0.003/0.006 steps, so
+        # rounding in either path lands right at a threshold.
+        rng = random.Random(1)
+        now = 1_000_000.0
+        for _ in range(500):
+            c = _make_creature(
+                stage=stage,
+                energy=rng.randrange(1001) / 1000,
+                pre_resting_stage=(
+                    LifecycleStage.MATURE
+                    if stage == LifecycleStage.RESTING else None
+                ),
+            )
+            n_ticks = rng.randint(1, 600)
+            entered = (
+                now - rng.randint(0, 59) * 60
+                if stage == LifecycleStage.RESTING else None
+            )
+            advanced, events = advance_ticks(
+                c, n_ticks, now, 60, resting_entered_at=entered,
+            )
+            expected, expected_events = _step_ticks(
+                c, n_ticks, now, 60, resting_entered_at=entered,
+            )
+            assert [(e.event_type, e.created_at) for e in events] == [
+                (e.event_type, e.created_at) for e in expected_events
+            ]
+            assert advanced.lifecycle_stage == expected.lifecycle_stage
+
+    def test_resting_wakes_on_timeout(self):
+        c = _make_creature(
+            stage=LifecycleStage.RESTING,
+            energy=0.0,
+            pre_resting_stage=LifecycleStage.JUVENILE,
+        )
+        now = 10_000.0
+        advanced, events = advance_ticks(
+            c, 100, now, 60, resting_entered_at=now - 100 * 60,
+        )
+        assert [e.event_type for e in events] == ["exited_resting"]
+        assert events[0].created_at >= now - 100 * 60 + RESTING_MAX_DURATION
+        assert advanced.lifecycle_stage == LifecycleStage.JUVENILE
+
+
+class TestEvaluateTransitionsBatch:
+    def _population(self):
+        creatures = []
+        for stage in (LifecycleStage.EGG, LifecycleStage.HATCHED,
+                      LifecycleStage.JUVENILE, LifecycleStage.MATURE,
+                      LifecycleStage.RESTING, LifecycleStage.EXHAUSTED):
+            for care, talk in ((0, 0), (3, 1), (10, 5)):
+                for energy in (0.1, 0.3, 0.6):
+                    creatures.append(_make_creature(
+                        stage=stage, hatched_at=0.0, care=care, talk=talk,
+                        energy=energy, pre_resting_stage=LifecycleStage.MATURE,
+                    ))
+        return creatures
+
+    def test_matches_single_evaluation(self):
+        creatures = self._population()
+        for now in (10.0, EGG_TO_HATCHED_TIME, JUVENILE_TO_MATURE_TIME + 1):
+            results = evaluate_transitions_batch(
+                creatures, now, resting_entered_at=0.0, chain=False,
+            )
+            for creature, (_, events) in zip(creatures, results):
+                expected = evaluate_transitions(
+                    creature, now, resting_entered_at=0.0,
+                )
+                assert events == ([expected] if expected else [])
+
+    def test_one_creature_many_timestamps(self):
+        c = _make_creature(care=EGG_TO_HATCHED_CARE)
+        times = [0.0, EGG_TO_HATCHED_TIME - 1, EGG_TO_HATCHED_TIME]
+        results = evaluate_transitions_batch([c], times)
+        assert [len(events) for _, events in results] == [0, 0, 1]
+        assert results[2][0].hatched_at == EGG_TO_HATCHED_TIME
+
+    def test_chains_transitions_at_one_timestamp(self, monkeypatch):
+        from drakeling.domain import lifecycle
+
+        monkeypatch.setattr(lifecycle, "HATCHED_TO_JUVENILE_TIME", 0)
+        c = _make_creature(care=HATCHED_TO_JUVENILE_CARE)
+        [(advanced, events)] = evaluate_transitions_batch(
+            [c], EGG_TO_HATCHED_TIME,
+        )
+        assert [e.event_type for e in events] == [
+            "egg_to_hatched", "hatched_to_juvenile",
+        ]
+        assert advanced.lifecycle_stage == LifecycleStage.JUVENILE
+
+    def test_rejects_mismatched_lengths(self):
+        c = _make_creature()
+        with pytest.raises(ValueError):
+            evaluate_transitions_batch([c, c], [1.0, 2.0, 3.0])
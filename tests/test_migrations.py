@@ -0,0 +1,172 @@
+"""Tests for Alembic schema migrations."""
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import desc, select, text
+
+from drakeling.storage import database
+from drakeling.storage.database import get_engine, run_migrations
+from drakeling.storage.models import (
+    CreatureMemoryRow,
+    InteractionLogRow,
+    LifecycleEventRow,
+)
+
+
+async def _upgrade_to(engine, revision: str) -> None:
+    def _run(connection):
+        cfg = Config()
+        cfg.set_main_option("script_location", database._MIGRATIONS_DIR)
+        cfg.attributes["connection"] = connection
+        command.upgrade(cfg, revision)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(_run)
+
+
+_INSERT_CREATURE = text(
+    "INSERT INTO creature_state (id, name, colour, personality_seed,"
+    " trait_curiosity, trait_sociability, trait_confidence,"
+    " trait_emotional_sensitivity, trait_autonomy_preference,"
+    " trait_loneliness_rate, mood, energy, trust, trust_floor, loneliness,"
+    " state_curiosity, stability, lifecycle_stage, pre_resting_stage,"
+    " born_at, public_key_hex, cumulative_care_events,"
+    " cumulative_talk_interactions, updated_at)"
+    " VALUES (1, 'Test', 'red', 'aa', 0.5, 0.5, 0.5, 0.5, 0.5, 0.5,"
+    " 0.5, 0.5, 0.5, 0.0, 0.0, 0.5, 0.5, :stage, 'mature', 0.0, 'ab', 0, 0, 0.0)"
+)
+
+
+class TestRestingEnteredAt:
+    @pytest.mark.asyncio
+    async def test_backfills_latest_entered_resting(self, tmp_path):
+        engine = get_engine(tmp_path)
+        await _upgrade_to(engine, "0001")
+        async with engine.begin() as conn:
+            await conn.execute(_INSERT_CREATURE, {"stage": "resting"})
+            for at in (100.0, 300.0, 200.0):
+                await conn.execute(text(
+                    "INSERT INTO lifecycle_events (created_at, event_type)"
+                    " VALUES (:at, 'entered_resting')"
+                ), {"at": at})
+
+        await run_migrations(engine)
+        async with engine.connect() as conn:
+            value = (await conn.execute(
+                text("SELECT resting_entered_at FROM creature_state")
+            )).scalar_one()
+        await engine.dispose()
+        assert value == 300.0
+
+    @pytest.mark.asyncio
+    async def test_not_backfilled_when_awake(self, tmp_path):
+        engine = get_engine(tmp_path)
+        await _upgrade_to(engine, "0001")
+        async with engine.begin() as conn:
+            await conn.execute(_INSERT_CREATURE, {"stage": "mature"})
+            await conn.execute(text(
+                "INSERT INTO lifecycle_events (created_at, event_type)"
+                " VALUES (100.0, 'entered_resting')"
+            ))
+
+        await run_migrations(engine)
+        async with engine.connect() as conn:
+            value = (await conn.execute(
+                text("SELECT resting_entered_at FROM creature_state")
+            )).scalar_one()
+        await engine.dispose()
+        assert value is None
+
+
+async def _query_plan(engine, statement) -> str:
+    compiled = statement.compile(
+        dialect=engine.dialect, compile_kwargs={"literal_binds": True},
+    )
+    async with engine.connect() as conn:
+        rows = (await conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+class TestHistoryIndexes:
+    @pytest.mark.parametrize("model, type_column, value, index", [
+        (InteractionLogRow, "interaction_type", "talk",
+         "ix_interaction_log_type_created"),
+        (LifecycleEventRow, "event_type", "entered_resting",
+         "ix_lifecycle_events_type_created"),
+        (CreatureMemoryRow, "memory_type", "reflection",
+         "ix_creature_memory_type_created"),
+    ])
+    @pytest.mark.asyncio
+    async def test_latest_by_type_uses_index(
+        self, tmp_path, model, type_column, value, index,
+    ):
+        engine = get_engine(tmp_path)
+        await run_migrations(engine)
+        plan = await _query_plan(
+            engine,
+            select(model)
+            .where(getattr(model, type_column) == value)
+            .order_by(desc(model.created_at))
+            .limit(10),
+        )
+        await engine.dispose()
+        assert f"USING INDEX {index}" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+class TestHistoryFTS:
+    @pytest.mark.asyncio
+    async def test_backfills_existing_history(self, tmp_path):
+        engine = get_engine(tmp_path)
+        await _upgrade_to(engine, "0004")
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                "INSERT INTO creature_memory (id, created_at, memory_type,"
+                " content, lifecycle_stage)"
+                " VALUES (7, 1.0, 'reflection', 'a quiet cave', 'juvenile')"
+            ))
+            await conn.execute(text(
+                "INSERT INTO interaction_log (id, created_at, source,"
+                " interaction_type, content) VALUES (7, 2.0, 'user', 'talk',"
+                " 'the cave is quiet')"
+            ))
+
+        await run_migrations(engine)
+        async with engine.connect() as conn:
+            rowids = (await conn.execute(text(
+                "SELECT rowid FROM history_fts WHERE history_fts MATCH 'cave'"
+                " ORDER BY rowid"
+            ))).scalars().all()
+        await engine.dispose()
+        assert rowids == [14, 15]
+
+
+class TestStartupFastPath:
+    def test_schema_head_matches_scripts(self):
+        from alembic.script import ScriptDirectory
+
+        cfg = Config()
+        cfg.set_main_option("script_location", database._MIGRATIONS_DIR)
+        assert ScriptDirectory.from_config(cfg).get_current_head() == database.SCHEMA_HEAD
+
+    @pytest.mark.asyncio
+    async def test_skips_alembic_at_head(self, tmp_path, monkeypatch):
+        engine = get_engine(tmp_path)
+        assert await run_migrations(engine) is True
+        assert await database.schema_revision(engine) == database.SCHEMA_HEAD
+
+        def _fail(connection):
+            raise AssertionError("Alembic should not run")
+
+        monkeypatch.setattr(database, "_run_alembic", _fail)
+        assert await run_migrations(engine) is False
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_upgrades_older_database(self, tmp_path):
+        engine = get_engine(tmp_path)
+        await _upgrade_to(engine, "0003")
+        assert await database.schema_revision(engine) == "0003"
+        assert await run_migrations(engine) is True
+        assert await database.schema_revision(engine) == database.SCHEMA_HEAD
+        await engine.dispose()
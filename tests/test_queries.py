@@ -0,0 +1,72 @@
+"""Tests for the column-projected read queries."""
+import pytest
+
+from drakeling.storage.database import get_engine, get_session_factory, run_migrations
+from drakeling.storage.models import InteractionLogRow
+from drakeling.storage.queries import creature_identity, recent_feed, recent_talk
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = get_engine(tmp_path)
+    await run_migrations(engine)
+    yield get_session_factory(engine)
+    await engine.dispose()
+
+
+class TestRecentTalk:
+    @pytest.mark.asyncio
+    async def test_last_lines_oldest_first(self, session_factory):
+        async with session_factory() as session:
+            session.add_all(
+                InteractionLogRow(
+                    created_at=float(i), source="user" if i % 2 else "creature",
+                    interaction_type="talk", content=f"line {i}",
+                )
+                for i in range(5)
+            )
+            session.add(InteractionLogRow(
+                created_at=10.0, source="creature",
+                interaction_type="care_response", content="not talk",
+            ))
+            await session.commit()
+
+            rows = await recent_talk(session, limit=3)
+        assert [tuple(r) for r in rows] == [
+            ("creature", "line 2"), ("user", "line 3"), ("creature", "line 4"),
+        ]
+
+
+class TestRecentFeed:
+    @pytest.mark.asyncio
+    async def test_all_kinds_oldest_first(self, session_factory):
+        async with session_factory() as session:
+            session.add_all([
+                InteractionLogRow(
+                    created_at=1.0, source="user",
+                    interaction_type="talk", content="hello",
+                ),
+                InteractionLogRow(
+                    created_at=2.0, source="creature",
+                    interaction_type="care_response", content="purr",
+                    care_type="feed",
+                ),
+                InteractionLogRow(
+                    created_at=3.0, source="creature",
+                    interaction_type="talk", content="hi",
+                ),
+            ])
+            await session.commit()
+
+            rows = await recent_feed(session, limit=2)
+        assert [tuple(r) for r in rows] == [
+            (2.0, "creature", "care_response", "purr", "feed"),
+            (3.0, "creature", "talk", "hi", None),
+        ]
+
+
+class TestCreatureIdentity:
+    @pytest.mark.asyncio
+    async def test_no_creature(self, session_factory):
+        async with session_factory() as session:
+            assert await creature_identity(session) is None
@@ -0,0 +1,141 @@
+"""Tests for history retention and archival."""
+import sqlite3
+
+import pytest
+from sqlalchemy import func, select, text
+
+from drakeling.daemon import retention
+from drakeling.daemon.retention import decode_archive, run_retention
+from drakeling.storage.database import (
+    DB_FILENAME,
+    SQLITE_PROFILES,
+    SQLitePragmas,
+    ensure_auto_vacuum,
+    get_engine,
+    get_session_factory,
+    run_migrations,
+)
+from drakeling.storage.models import (
+    HistoryArchiveRow,
+    InteractionLogRow,
+    LifecycleEventRow,
+)
+
+DAY = 86_400.0
+NOW = 100 * DAY
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = get_engine(tmp_path)
+    await run_migrations(engine)
+    yield get_session_factory(engine)
+    await engine.dispose()
+
+
+async def _add_talk(session_factory, days_ago: list[float]) -> None:
+    async with session_factory() as session:
+        session.add_all(
+            InteractionLogRow(
+                created_at=NOW - d * DAY, source="user",
+                interaction_type="talk", content="x" * 200,
+            )
+            for d in days_ago
+        )
+        await session.commit()
+
+
+async def _count(session_factory, model) -> int:
+    async with session_factory() as session:
+        return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+class TestRunRetention:
+    @pytest.mark.asyncio
+    async def test_archives_only_rows_past_window(self, session_factory):
+        await _add_talk(session_factory, [45, 40, 31, 29, 1])
+        result = await run_retention(session_factory, 30, now=NOW, pause=0)
+        assert result["interaction_log"] == 3
+        assert await _count(session_factory, InteractionLogRow) == 2
+
+        async with session_factory() as session:
+            archive = (await session.execute(select(HistoryArchiveRow))).scalar_one()
+        assert archive.source_table == "interaction_log"
+        assert archive.row_count == 3
+        rows = decode_archive(archive.payload)
+        assert [r["created_at"] for r in rows] == [
+            NOW - 45 * DAY, NOW - 40 * DAY, NOW - 31 * DAY,
+        ]
+        assert rows[0]["interaction_type"] == "talk"
+
+    @pytest.mark.asyncio
+    async def test_runs_in_batches(self, session_factory, monkeypatch):
+        monkeypatch.setattr(retention, "BATCH_ROWS", 4)
+        await _add_talk(session_factory, [60] * 10)
+        async with session_factory() as session:
+            session.add(LifecycleEventRow(created_at=NOW - 60 * DAY, event_type="born"))
+            await session.commit()
+
+        result = await run_retention(
+            session_factory, 30, now=NOW, pause=0,
+            tables=("interaction_log", "lifecycle_events"),
+        )
+        assert result["interaction_log"] == 10
+        assert result["lifecycle_events"] == 1
+        async with session_factory() as session:
+            counts = (await session.execute(
+                select(HistoryArchiveRow.row_count).order_by(HistoryArchiveRow.id)
+            )).scalars().all()
+        assert counts == [4, 4, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_leaves_other_tables_alone_by_default(self, session_factory):
+        async with session_factory() as session:
+            session.add(LifecycleEventRow(created_at=NOW - 60 * DAY, event_type="born"))
+            await session.commit()
+
+        result = await run_retention(session_factory, 30, now=NOW, pause=0)
+        assert "lifecycle_events" not in result
+        assert await _count(session_factory, LifecycleEventRow) == 1
+
+    @pytest.mark.asyncio
+    async def test_reclaims_free_pages(self, session_factory):
+        await _add_talk(session_factory, [60] * 2000)
+        result = await run_retention(session_factory, 30, now=NOW, pause=0)
+        assert result["pages_reclaimed"] > 0
+        async with session_factory() as session:
+            free = (await session.execute(text("PRAGMA freelist_count"))).scalar_one()
+        assert free == 0
+
+
+class TestEnsureAutoVacuum:
+    @pytest.mark.asyncio
+    async def test_converts_existing_database(self, tmp_path):
+        engine = get_engine(tmp_path, SQLITE_PROFILES["legacy"])
+        await run_migrations(engine)
+        await engine.dispose()
+
+        engine = get_engine(tmp_path)
+        assert await ensure_auto_vacuum(engine) is True
+        assert await ensure_auto_vacuum(engine) is False
+        async with engine.connect() as conn:
+            mode = (await conn.execute(text("PRAGMA auto_vacuum"))).scalar_one()
+        await engine.dispose()
+        assert mode == 2
+
+    @pytest.mark.asyncio
+    async def test_new_connection_does_not_wait_for_writer(self, tmp_path):
+        engine = get_engine(tmp_path)
+        await run_migrations(engine)
+        await engine.dispose()
+
+        writer = sqlite3.connect(tmp_path / DB_FILENAME, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        engine = get_engine(tmp_path, SQLitePragmas(busy_timeout=50))
+        try:
+            async with engine.connect() as conn:
+                assert (await conn.execute(text("SELECT 1"))).scalar_one() == 1
+        finally:
+            writer.rollback()
+            writer.close()
+            await engine.dispose()
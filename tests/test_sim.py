@@ -0,0 +1,93 @@
+"""Tests for the offline simulation engine and CLI."""
+import csv
+import random
+from dataclasses import replace
+
+from drakeling.domain import lifecycle
+from drakeling.domain.decay import apply_care_boost, apply_tick_decay
+from drakeling.domain.lifecycle import _apply_event, evaluate_transitions
+from drakeling.domain.models import DragonColour, LifecycleStage
+from drakeling.sim.engine import (
+    Interaction,
+    new_creature,
+    scripted_schedule,
+    simulate,
+    stochastic_schedule,
+)
+from drakeling.sim.main import main
+
+
+def _step(creature, schedule, total_ticks, tick_seconds):
+    """Reference: one decay and transition check per tick, like the daemon."""
+    by_tick: dict[int, list[str]] = {}
+    for i in schedule:
+        by_tick.setdefault(i.tick, []).append(i.kind)
+    resting_at = None
+    for tick in range(1, total_ticks + 1):
+        now = tick * tick_seconds
+        if creature.lifecycle_stage != LifecycleStage.EGG:
+            creature = replace(creature, mood_state=apply_tick_decay(
+                creature.mood_state, creature.lifecycle_stage, creature.personality,
+            ))
+        event = evaluate_transitions(creature, now, resting_entered_at=resting_at)
+        if event is not None:
+            creature = _apply_event(creature, event)
+            if event.event_type == "entered_resting":
+                resting_at = now
+        for kind in by_tick.get(tick, []):
+            assert kind == "care"
+            creature = replace(
+                creature,
+                mood_state=apply_care_boost(creature.mood_state),
+                cumulative_care_events=creature.cumulative_care_events + 1,
+            )
+    return creature
+
+
+class TestSimulate:
+    def test_matches_tick_by_tick_reference(self):
+        creature = new_creature(DragonColour.GOLD, "ab" * 32)
+        schedule = scripted_schedule(3000, 60, {"care": 3 * 3600})
+        result = simulate(creature, schedule, 3000, 60)
+        expected = _step(creature, schedule, 3000, 60)
+        assert result.creature.lifecycle_stage == expected.lifecycle_stage
+        assert result.creature.hatched_at == expected.hatched_at
+        assert abs(result.creature.mood_state.energy
+                   - expected.mood_state.energy) < 1e-9
+
+    def test_talk_refused_in_egg(self):
+        creature = new_creature(DragonColour.RED, "ab" * 32)
+        result = simulate(creature, [Interaction(1, "talk")], 2, 60)
+        assert result.interactions_applied["talk"] == 0
+        assert result.creature.cumulative_talk_interactions == 0
+
+    def test_stage_durations_cover_run(self):
+        creature = new_creature(DragonColour.BLUE, "ab" * 32)
+        schedule = stochastic_schedule(
+            20_000, 60, {"care": 8, "feed": 4, "talk": 6}, random.Random(1),
+        )
+        result = simulate(creature, schedule, 20_000, 60)
+        assert abs(sum(result.stage_durations().values()) - 20_000 * 60) < 1e-6
+        assert result.first_reached()["egg"] == 0.0
+
+    def test_samples_taken_on_grid(self):
+        creature = new_creature(DragonColour.RED, "ab" * 32)
+        result = simulate(creature, [], 600, 60, sample_every=100)
+        assert [s.tick for s in result.samples] == [0, 100, 200, 300, 400, 500, 600]
+
+
+class TestSimCli:
+    def test_writes_time_series_and_summary(self, tmp_path, capsys, monkeypatch):
+        monkeypatch.setattr(lifecycle, "JUVENILE_TO_MATURE_TIME",
+                            lifecycle.JUVENILE_TO_MATURE_TIME)
+        out = tmp_path / "sim.csv"
+        main([
+            "--days", "3", "--output", str(out),
+            "--set", "JUVENILE_TO_MATURE_TIME=43200",
+        ])
+        printed = capsys.readouterr().out
+        assert "JUVENILE_TO_MATURE_TIME=43200" in printed
+        assert "juvenile" in printed
+        rows = list(csv.DictReader(out.open()))
+        assert len(rows) == 3 * 24 + 1
+        assert rows[0]["stage"] == "egg"
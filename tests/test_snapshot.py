@@ -0,0 +1,90 @@
+"""Tests for online database snapshots and their rotation."""
+import os
+import sqlite3
+
+import pytest
+from sqlalchemy import text
+
+from drakeling.daemon.snapshots import seconds_until_due
+from drakeling.storage.database import get_engine, get_session_factory, run_migrations
+from drakeling.storage.models import LifecycleEventRow
+from drakeling.storage.snapshot import (
+    SNAPSHOT_DIRNAME,
+    list_snapshots,
+    rotate_snapshots,
+    snapshot_database,
+    take_snapshot,
+)
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = get_engine(tmp_path)
+    await run_migrations(engine)
+    yield get_session_factory(engine)
+    await engine.dispose()
+
+
+def _events(path) -> list[str]:
+    with sqlite3.connect(path) as conn:
+        return [r[0] for r in conn.execute("SELECT event_type FROM lifecycle_events")]
+
+
+class TestSnapshotDatabase:
+    @pytest.mark.asyncio
+    async def test_includes_wal_and_ignores_open_write(self, session_factory, tmp_path):
+        async with session_factory() as session:
+            session.add(LifecycleEventRow(created_at=1.0, event_type="committed"))
+            await session.commit()
+
+        # A write transaction is open while the snapshot runs
+        async with session_factory() as writer:
+            writer.add(LifecycleEventRow(created_at=2.0, event_type="pending"))
+            await writer.flush()
+            dest = await snapshot_database(session_factory, tmp_path / "copy.db")
+            await writer.commit()
+
+        assert _events(dest) == ["committed"]
+        assert not (tmp_path / "copy.db.partial").exists()
+        # The source is in WAL mode, the snapshot is a standalone file
+        async with session_factory() as session:
+            mode = (await session.execute(text("PRAGMA journal_mode"))).scalar_one()
+        assert mode == "wal"
+        assert not (tmp_path / "copy.db-wal").exists()
+
+    @pytest.mark.asyncio
+    async def test_replaces_existing_destination(self, session_factory, tmp_path):
+        dest = tmp_path / "copy.db"
+        dest.write_bytes(b"stale")
+        await snapshot_database(session_factory, dest)
+        assert _events(dest) == []
+
+
+class TestRotation:
+    @pytest.mark.asyncio
+    async def test_take_snapshot_keeps_newest(self, session_factory, tmp_path):
+        for i in range(4):
+            await take_snapshot(
+                session_factory, tmp_path, keep=2, now=1_700_000_000 + i * 3_600,
+            )
+        kept = list_snapshots(tmp_path / SNAPSHOT_DIRNAME)
+        assert [p.name for p in kept] == [
+            "drakeling_20231115_001320Z.db", "drakeling_20231115_011320Z.db",
+        ]
+
+    def test_rotate_ignores_other_files(self, tmp_path):
+        (tmp_path / "notes.txt").write_text("keep me")
+        for stamp in ("20250101_000000", "20250102_000000"):
+            (tmp_path / f"drakeling_{stamp}.db").write_bytes(b"")
+        deleted = rotate_snapshots(tmp_path, keep=1)
+        assert [p.name for p in deleted] == ["drakeling_20250101_000000.db"]
+        assert (tmp_path / "notes.txt").exists()
+
+    def test_due_follows_newest_snapshot(self, tmp_path):
+        assert seconds_until_due(tmp_path, 3_600, now=1_000.0) == 0.0
+        snapshot_dir = tmp_path / SNAPSHOT_DIRNAME
+        snapshot_dir.mkdir()
+        path = snapshot_dir / "drakeling_20250101_000000.db"
+        path.write_bytes(b"")
+        os.utime(path, (1_000.0, 1_000.0))
+        assert seconds_until_due(tmp_path, 3_600, now=1_600.0) == 3_000.0
@@ -0,0 +1,186 @@
+"""Tests for the background tick scheduler."""
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from drakeling.daemon.config import DrakelingConfig
+from drakeling.daemon.tick import (
+    MAX_IDLE_TICKS,
+    RESTING_REFLECTION_LONELINESS,
+    TickScheduler,
+    TickStats,
+    _do_tick,
+)
+from drakeling.daemon.state import CreatureStore, _creature_to_values
+from drakeling.domain.decay import apply_tick_decay
+from drakeling.domain.models import LifecycleStage
+from drakeling.storage.database import get_engine, get_session_factory, run_migrations
+from drakeling.storage.models import CreatureStateRow
+
+from tests.test_attention import _make_creature
+
+
+def _scheduler(**overrides) -> TickScheduler:
+    return TickScheduler(DrakelingConfig(tick_seconds=60, **overrides))
+
+
+class TestTickScheduler:
+    def test_first_take_counts_from_fallback(self):
+        s = _scheduler()
+        assert s.take_ticks(now=1000.0 + 60 * 24 * 60, fallback=1000.0) == 1440
+        assert s.last_tick_at == 1000.0 + 60 * 24 * 60
+
+    def test_partial_tick_carries_over(self):
+        s = _scheduler()
+        assert s.take_ticks(now=150.0, fallback=0.0) == 2
+        assert s.take_ticks(now=170.0, fallback=0.0) == 0
+        assert s.take_ticks(now=185.0, fallback=0.0) == 1
+
+    def test_project_does_not_consume(self):
+        s = _scheduler()
+        s.take_ticks(now=0.0, fallback=0.0)
+        c = _make_creature(mood=0.5)
+        projected = s.project(c, now=600.0)
+        assert projected.mood_state.mood < 0.5
+        assert s.last_tick_at == 0.0
+
+    def test_project_leaves_egg_alone(self):
+        s = _scheduler()
+        s.take_ticks(now=0.0, fallback=0.0)
+        c = _make_creature(stage=LifecycleStage.EGG)
+        assert s.project(c, now=600.0) is c
+
+    def test_idle_creature_sleeps_to_cap(self):
+        s = _scheduler(dev_mode=True)
+        s.take_ticks(now=0.0, fallback=0.0)
+        c = _make_creature(mood=0.9, energy=0.9)
+        assert s.next_delay(c, now=0.0) == MAX_IDLE_TICKS * 60
+
+    def test_wakes_for_due_reflection(self):
+        s = _scheduler(min_reflection_interval=600)
+        s.take_ticks(now=0.0, fallback=0.0)
+        c = _make_creature(mood=0.9, energy=0.9)
+        c.last_reflection_at = 0.0
+        assert s.next_delay(c, now=0.0) == 600.0
+
+    def test_wakes_when_resting_creature_grows_lonely(self):
+        s = _scheduler(min_reflection_interval=600)
+        s.take_ticks(now=10_000.0, fallback=10_000.0)
+        c = _make_creature(
+            stage=LifecycleStage.RESTING, loneliness=0.78, energy=0.3, mood=0.9,
+        )
+        c.pre_resting_stage = LifecycleStage.MATURE
+        c.last_reflection_at = 0.0
+
+        state, k = c.mood_state, 0
+        while state.loneliness <= RESTING_REFLECTION_LONELINESS:
+            state = apply_tick_decay(state, c.lifecycle_stage, c.personality)
+            k += 1
+        assert k < MAX_IDLE_TICKS
+        assert s.next_delay(c, now=10_000.0) == k * 60
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = get_engine(tmp_path)
+    await run_migrations(engine)
+    yield get_session_factory(engine)
+    await engine.dispose()
+
+
+class TestDoTick:
+    @pytest.mark.asyncio
+    async def test_budget_restore_after_downtime_still_catches_up(
+        self, session_factory,
+    ):
+        now = time.time()
+        creature = _make_creature(
+            stage=LifecycleStage.EXHAUSTED, mood=0.9, loneliness=0.0, energy=0.5,
+        )
+        creature.pre_exhausted_stage = LifecycleStage.MATURE
+        traits = creature.personality
+        async with session_factory() as session:
+            session.add(CreatureStateRow(
+                name=creature.name, colour=creature.colour,
+                personality_seed=traits.seed,
+                **{
+                    name: getattr(traits, name)
+                    for name in vars(traits) if name.startswith("trait_")
+                },
+                **_creature_to_values(creature),
+                born_at=0.0, public_key_hex=creature.public_key_hex,
+                updated_at=now - 8 * 3_600,
+            ))
+            await session.commit()
+
+        config = DrakelingConfig(tick_seconds=60, dev_mode=True)
+        store = CreatureStore(session_factory)
+        llm = SimpleNamespace(budget_exhausted=False)
+        await _do_tick(store, config, llm, TickScheduler(config))
+
+        creature = store.creature
+        assert creature.lifecycle_stage == LifecycleStage.MATURE
+        assert creature.mood_state.mood < 0.9
+        assert creature.mood_state.loneliness > 0.0
+
+
+class TestTickStats:
+    def test_overruns_and_durations(self):
+        stats = TickStats()
+        stats.record_pass(0.5, overran=False)
+        stats.record_pass(31.5, overran=True)
+        data = stats.as_dict()
+        assert data["passes"] == 2
+        assert data["overruns"] == 1
+        assert data["max_duration"] == 31.5
+        assert data["mean_duration"] == 16.0
+
+    def test_lag_counts_whole_missed_ticks(self):
+        stats = TickStats()
+        stats.record_lag(0.02, tick_seconds=60)
+        assert stats.missed_ticks == 0
+        stats.record_lag(130.0, tick_seconds=60)
+        assert stats.missed_ticks == 2
+        assert stats.max_lag == 130.0
+
+    @pytest.mark.asyncio
+    async def test_sleep_until_past_deadline_records_lag(self):
+        s = _scheduler()
+        woken = await s.sleep_until(time.monotonic() - 125.0)
+        assert woken is False
+        assert s.stats.missed_ticks == 2
+
+    @pytest.mark.asyncio
+    async def test_wake_interrupts_sleep(self):
+        s = _scheduler()
+        s.wake()
+        assert await s.sleep_until(time.monotonic() + 60.0) is True
+        assert s.stats.last_lag == 0.0
+
+
+class TestTickProfiler:
+    def test_phase_summary_and_buckets(self):
+        from drakeling.daemon.profiler import TickProfiler
+
+        p = TickProfiler(window=4)
+        for seconds in (0.0005, 0.002, 0.002, 0.2, 6.0):
+            p.record("settle", seconds)
+        summary = p.snapshot()["phases"]["settle"]
+        assert summary["count"] == 4  # oldest sample rolled out
+        assert summary["total_count"] == 5
+        assert summary["max_ms"] == 6000.0
+        assert summary["buckets"]["le_5ms"] == 2
+        assert summary["buckets"]["le_500ms"] == 1
+        assert summary["buckets"]["inf"] == 1
+
+    def test_last_pass_excludes_out_of_pass_work(self):
+        from drakeling.daemon.profiler import TickProfiler
+
+        p = TickProfiler()
+        p.begin_pass()
+        with p.phase("load"):
+            pass
+        p.record("reflection_llm", 3.0, in_pass=False)
+        assert list(p.last_pass) == ["load"]
+        assert "reflection_llm" in p.snapshot()["phases"]
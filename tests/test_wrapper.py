@@ -0,0 +1,76 @@
+"""Tests for the LLM wrapper's streaming calls."""
+import json
+
+import httpx
+import pytest
+
+from drakeling.daemon.config import DrakelingConfig
+from drakeling.llm.wrapper import LLMWrapper
+
+
+def _sse(*chunks) -> bytes:
+    lines = [f"data: {json.dumps(chunk)}\n\n" for chunk in chunks]
+    lines.append("data: [DONE]\n\n")
+    return "".join(lines).encode()
+
+
+def _delta(text: str) -> dict:
+    return {"choices": [{"index": 0, "delta": {"content": text}}]}
+
+
+def _wrapper(handler, **config) -> tuple[LLMWrapper, list[dict]]:
+    sent: list[dict] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return handler(request)
+
+    llm = LLMWrapper(DrakelingConfig(
+        llm_base_url="http://llm.test/v1", llm_model="tiny", **config,
+    ))
+    llm._client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+    return llm, sent
+
+
+async def _collect(llm: LLMWrapper) -> list[str]:
+    return [text async for text in llm.stream([{"role": "user", "content": "hi"}])]
+
+
+class TestStream:
+    @pytest.mark.asyncio
+    async def test_yields_deltas_and_charges_final_usage(self):
+        body = _sse(
+            {"choices": [{"index": 0, "delta": {"role": "assistant"}}]},
+            _delta("Hel"),
+            _delta("lo"),
+            {"choices": [], "usage": {"total_tokens": 42}},
+        )
+        llm, sent = _wrapper(lambda r: httpx.Response(200, content=body))
+        assert await _collect(llm) == ["Hel", "lo"]
+        assert llm.tokens_used_today == 42
+        assert sent[0]["stream"] is True
+        assert sent[0]["stream_options"] == {"include_usage": True}
+
+    @pytest.mark.asyncio
+    async def test_charges_cap_without_usage(self):
+        body = _sse(_delta("Hi"))
+        llm, _ = _wrapper(
+            lambda r: httpx.Response(200, content=body), max_tokens_per_call=50,
+        )
+        assert await _collect(llm) == ["Hi"]
+        assert llm.tokens_used_today == 50
+
+    @pytest.mark.asyncio
+    async def test_http_error_yields_nothing_and_costs_nothing(self):
+        llm, _ = _wrapper(lambda r: httpx.Response(500))
+        assert await _collect(llm) == []
+        assert llm.tokens_used_today == 0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_makes_no_request(self):
+        llm, sent = _wrapper(
+            lambda r: httpx.Response(200, content=_sse(_delta("x"))),
+            max_tokens_per_call=300, max_tokens_per_day=200,
+        )
+        assert await _collect(llm) == []
+        assert sent == []
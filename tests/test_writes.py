@@ -0,0 +1,112 @@
+"""Tests for the batched history write queue."""
+import asyncio
+
+import pytest
+from sqlalchemy import event, func, select
+
+from drakeling.daemon.state import CreatureStore
+from drakeling.daemon.writes import WriteQueue
+from drakeling.storage.database import get_engine, get_session_factory, run_migrations
+from drakeling.storage.models import (
+    CreatureMemoryRow,
+    InteractionLogRow,
+    LifecycleEventRow,
+)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = get_engine(tmp_path)
+    await run_migrations(engine)
+    yield engine
+    await engine.dispose()
+
+
+def _talk(i: int) -> InteractionLogRow:
+    return InteractionLogRow(
+        created_at=float(i), source="user", interaction_type="talk",
+        content=f"message {i}",
+    )
+
+
+async def _count(session_factory, model) -> int:
+    async with session_factory() as session:
+        return (await session.execute(
+            select(func.count()).select_from(model)
+        )).scalar_one()
+
+
+def _count_statements(engine) -> list[tuple[str, bool]]:
+    """Record (statement, executemany) for every INSERT on *engine*."""
+    seen: list[tuple[str, bool]] = []
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT"):
+            seen.append((statement, executemany))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before)
+    return seen
+
+
+class TestWriteQueue:
+    @pytest.mark.asyncio
+    async def test_one_executemany_per_table(self, engine):
+        sf = get_session_factory(engine)
+        queue = WriteQueue(sf)
+        statements = _count_statements(engine)
+        queue.add(*(_talk(i) for i in range(5)))
+        queue.add(
+            CreatureMemoryRow(
+                created_at=1.0, memory_type="reflection", content="m",
+                lifecycle_stage="juvenile",
+            ),
+            LifecycleEventRow(created_at=1.0, event_type="hatched"),
+        )
+        assert await queue.flush() == 7
+
+        assert len(statements) == 3
+        assert [many for sql, many in statements if "interaction_log" in sql] == [True]
+        assert await _count(sf, InteractionLogRow) == 5
+        assert await _count(sf, CreatureMemoryRow) == 1
+        assert queue.as_dict()["batches"] == 1
+        assert queue.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_requeued_in_order(self, engine):
+        sf = get_session_factory(engine)
+        queue = WriteQueue(sf)
+        bad = InteractionLogRow(created_at=0.0, source="user", interaction_type="talk")
+        queue.add(bad, _talk(1))
+        with pytest.raises(Exception):
+            await queue.flush()
+        assert queue.pending == 2
+        queue.add(_talk(2))
+        assert queue.take()[0] is bad
+
+    @pytest.mark.asyncio
+    async def test_full_queue_flushes_before_interval(self, engine):
+        sf = get_session_factory(engine)
+        queue = WriteQueue(sf, max_rows=3)
+        runner = asyncio.create_task(queue.run(interval=60))
+        try:
+            queue.add(_talk(1), _talk(2))
+            await asyncio.sleep(0.05)
+            assert await _count(sf, InteractionLogRow) == 0
+            queue.add(_talk(3))
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                if queue.pending == 0 and await _count(sf, InteractionLogRow):
+                    break
+            assert await _count(sf, InteractionLogRow) == 3
+        finally:
+            runner.cancel()
+
+    @pytest.mark.asyncio
+    async def test_store_flush_includes_queued_rows(self, engine):
+        sf = get_session_factory(engine)
+        store = CreatureStore(sf)
+        store.writes.add(_talk(1))
+        await store.flush(LifecycleEventRow(created_at=2.0, event_type="hatched"))
+        assert store.writes.pending == 0
+        assert await _count(sf, InteractionLogRow) == 1
+        assert await _count(sf, LifecycleEventRow) == 1
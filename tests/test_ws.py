@@ -0,0 +1,179 @@
+"""Tests for the /ws WebSocket endpoint."""
+import asyncio
+import json
+from dataclasses import replace
+
+import httpx
+import pytest
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from drakeling.api.app import create_app
+from drakeling.daemon.config import DrakelingConfig
+from drakeling.domain.models import LifecycleStage
+from drakeling.storage.database import get_engine, get_session_factory, run_migrations
+from drakeling.ui.client import DrakelingSocket
+from tests.test_api import _StreamingLLM
+
+TOKEN = "test-token-12345"
+AUTH = {"Authorization": f"Bearer {TOKEN}"}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """A synchronous test client; the app runs on the client's own loop."""
+    (tmp_path / "api_token").write_text(TOKEN)
+    engine = get_engine(tmp_path)
+
+    async def migrate():
+        await run_migrations(engine)
+        await engine.dispose()
+
+    asyncio.run(migrate())
+    app = create_app(
+        config=DrakelingConfig(dev_mode=True),
+        session_factory=get_session_factory(engine),
+        data_dir=tmp_path,
+    )
+    app.state.llm = None
+    monkeypatch.setattr("drakeling.api.cooldown._last_care_at", 0.0)
+    monkeypatch.setattr("drakeling.api.cooldown._last_talk_at", 0.0)
+    with TestClient(app, headers=AUTH) as client:
+        yield client
+
+
+def _receive_reply(ws, request_id):
+    """Skip pushed events until the reply to *request_id* arrives."""
+    events = []
+    while True:
+        message = ws.receive_json()
+        if message["type"] == "event":
+            events.append(message)
+        elif message["id"] == request_id:
+            return message, events
+
+
+class TestWebSocket:
+    def test_rejects_missing_token(self, client):
+        with pytest.raises(WebSocketDisconnect) as exc:
+            with client.websocket_connect("/ws", headers={"Authorization": ""}):
+                pass
+        assert exc.value.code == 1008
+
+    def test_starts_with_snapshot(self, client):
+        client.post("/birth", json={"colour": "red", "name": "Sock"})
+        with client.websocket_connect("/ws") as ws:
+            message = ws.receive_json()
+        assert message["event"] == "snapshot"
+        assert message["data"]["creature"]["name"] == "Sock"
+
+    def test_care_reply_and_pushed_state(self, client):
+        client.post("/birth", json={"colour": "red", "name": "Sock"})
+        with client.websocket_connect("/ws") as ws:
+            ws.receive_json()
+            ws.send_json({"id": "c1", "type": "care", "care_type": "feed"})
+            reply, events = _receive_reply(ws, "c1")
+            assert reply["type"] == "result"
+            assert "state" in reply["data"]
+            if not events:
+                events.append(ws.receive_json())
+        assert events[0]["event"] == "state"
+        assert events[0]["data"]["cumulative_care_events"] == 1
+
+    def test_errors_carry_status_and_id(self, client):
+        client.post("/birth", json={"colour": "red", "name": "Sock"})
+        with client.websocket_connect("/ws") as ws:
+            ws.receive_json()
+            ws.send_json({"id": 1, "type": "talk", "message": "hello"})
+            reply, _ = _receive_reply(ws, 1)
+            assert reply["type"] == "error"
+            assert reply["status"] == 403
+
+            ws.send_json({"id": 2, "type": "care", "care_type": "juggling"})
+            reply, _ = _receive_reply(ws, 2)
+            assert reply["status"] == 422
+
+            ws.send_json({"id": 3, "type": "dance"})
+            reply, _ = _receive_reply(ws, 3)
+            assert reply["status"] == 400
+
+    def test_resumes_after_last_event_id(self, client):
+        client.post("/birth", json={"colour": "red", "name": "Sock"})
+        with client.websocket_connect("/ws") as ws:
+            last_id = ws.receive_json()["event_id"]
+        client.post("/care", json={"type": "feed"})
+        with client.websocket_connect(f"/ws?last_event_id={last_id}") as ws:
+            message = ws.receive_json()
+        assert message["event"] == "state"
+        assert message["event_id"] == last_id + 1
+
+    def test_streamed_talk_sends_tokens(self, client):
+        client.post("/birth", json={"colour": "red", "name": "Sock"})
+        store = client.app.state.store
+        store.update(
+            replace(store.creature, lifecycle_stage=LifecycleStage.JUVENILE),
+            now=store.updated_at,
+        )
+        client.app.state.llm = _StreamingLLM(["a", "b"])
+        with client.websocket_connect("/ws") as ws:
+            ws.receive_json()
+            ws.send_json({"id": "t", "type": "talk", "message": "hi",
+                          "stream": True})
+            tokens = []
+            while True:
+                message = ws.receive_json()
+                if message["type"] == "token":
+                    tokens.append(message["text"])
+                elif message["type"] == "result":
+                    break
+        assert tokens == ["a", "b"]
+        assert message["data"]["response"] == "ab"
+
+
+class _FakeConnection:
+    """Stands in for a websockets connection; the test feeds replies."""
+
+    def __init__(self):
+        self.incoming: asyncio.Queue = asyncio.Queue()
+
+    async def send(self, raw):
+        pass
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self.incoming.get()
+        if message is None:
+            raise StopAsyncIteration
+        return json.dumps(message)
+
+    async def close(self):
+        self.incoming.put_nowait(None)
+
+
+class TestSocketClient:
+    @pytest.mark.asyncio
+    async def test_request_times_out_without_reply(self):
+        socket = DrakelingSocket(_FakeConnection(), timeout=0.05)
+        with pytest.raises(httpx.ReadTimeout):
+            await socket.request("care", care_type="feed")
+        await socket.close()
+
+    @pytest.mark.asyncio
+    async def test_tokens_keep_a_slow_reply_alive(self):
+        connection = _FakeConnection()
+        socket = DrakelingSocket(connection, timeout=0.05)
+
+        async def reply():
+            for text in ("a", "b", "c"):
+                await asyncio.sleep(0.03)
+                connection.incoming.put_nowait({"id": 1, "type": "token", "text": text})
+            connection.incoming.put_nowait({"id": 1, "type": "result", "data": {}})
+
+        tokens = []
+        feeder = asyncio.create_task(reply())
+        assert await socket.request("talk", on_token=tokens.append) == {}
+        await feeder
+        assert tokens == ["a", "b", "c"]
+        await socket.close()